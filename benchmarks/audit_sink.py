@@ -0,0 +1,101 @@
+"""
+Cost of auditing screening verdicts: batched AuditLog vs one JSON file per result.
+
+Records `--reports` synthetic screening reports and times:
+
+- per-file:   what the caller pays to write each report to its own JSON file
+- AuditLog:   what the caller pays per `record()` (queueing only), and the
+              time until the background writer has flushed everything
+
+then times `query()` by address, by risk_flag and by a date range that no
+segment covers (answered from the segment indexes alone).
+
+Usage:
+    python benchmarks/audit_sink.py
+    python benchmarks/audit_sink.py --reports 500000 --segment-rows 50000
+"""
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+
+
+def synthetic_report(i: int) -> dict:
+    flagged = i % 50 == 0
+    return {
+        "metadata": {"screening_time": "2026-01-01T00:00:00", "wallet_address": "0x%040x" % i},
+        "summary": {
+            "risk_flag": flagged,
+            "sanctioned_entity_match": flagged,
+            "malicious_interaction_count": i % 3,
+            "balance_usd": i * 1.5,
+            "total_transactions": i % 1000,
+            "partial": False,
+        },
+        "risk_details": {
+            "sanctions_hits": [{"label": "Lazarus Group", "jurisdiction": "US", "reason": "Sanctions/Blacklist",
+                                "source_file": "normalized_fbi_lazarus.json", "network": "Ethereum"}] if flagged else [],
+        },
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--reports", type=int, default=100000)
+    parser.add_argument("--segment-rows", type=int, default=20000)
+    args = parser.parse_args()
+
+    sys.path.insert(0, REPO_ROOT)
+    from skillware.core.audit import AuditLog
+
+    reports = [synthetic_report(i) for i in range(args.reports)]
+    with tempfile.TemporaryDirectory() as tmp:
+        files_dir = os.path.join(tmp, "files")
+        os.makedirs(files_dir)
+        started = time.perf_counter()
+        for i, report in enumerate(reports):
+            with open(os.path.join(files_dir, f"{i}.json"), "w") as f:
+                json.dump(report, f)
+        per_file_s = time.perf_counter() - started
+
+        audit = AuditLog(os.path.join(tmp, "audit"), key="benchmark", segment_max_rows=args.segment_rows)
+        started = time.perf_counter()
+        for report in reports:
+            audit.record(report)
+        record_s = time.perf_counter() - started
+        audit.flush()
+        flushed_s = time.perf_counter() - started
+        stats = audit.stats()
+        # Closing writes the index of the last segment; queries then only scan what may match.
+        audit.close()
+
+        queries = {
+            "by address": dict(address="0x%040x" % (args.reports // 2)),
+            "risk_flag=true": dict(risk_flag=True),
+            "empty date range": dict(since="2000-01-01", until="2000-01-02"),
+        }
+        query_ms = {}
+        for name, predicate in queries.items():
+            started = time.perf_counter()
+            rows = sum(1 for _ in audit.query(**predicate))
+            query_ms[name] = ((time.perf_counter() - started) * 1000, rows)
+        size = sum(os.path.getsize(p) for p in audit.segments())
+        index_size = sum(os.path.getsize(p + ".idx") for p in audit.segments())
+
+    n = args.reports
+    print(f"{n:,} reports, {stats['segments']} segments ({size / 1e6:.1f} MB, indexes {index_size / 1e3:.0f} KB), "
+          f"{stats['dropped']} dropped\n")
+    print(f"{'sink':<28} {'us/report (caller)':>20} {'total s':>10}")
+    print(f"{'one JSON file per report':<28} {per_file_s / n * 1e6:>20.1f} {per_file_s:>10.2f}")
+    print(f"{'AuditLog':<28} {record_s / n * 1e6:>20.1f} {flushed_s:>10.2f}")
+    print(f"\n{'query':<28} {'ms':>10} {'rows':>10}")
+    for name, (ms, rows) in query_ms.items():
+        print(f"{name:<28} {ms:>10.1f} {rows:>10,}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,123 @@
+"""
+Recall and latency of identity (name/email/phone/ID) screening.
+
+Queries are derived from the bundled FtM `Person` names with realistic noise
+(case and diacritics dropped, tokens reordered, one typo, a dropped token).
+For each noise type the script reports recall@1 and recall@10 of the indexed
+search, and it compares per-query latency against a naive full scan.
+
+`--scale N` pads the list with synthetic people built from the real name
+vocabulary, up to N names, to show how latency behaves at OFAC size.
+
+Usage:
+    python benchmarks/identity_screening.py
+    python benchmarks/identity_screening.py --scale 20000 --threshold 0.6
+"""
+import argparse
+import os
+import random
+import statistics
+import sys
+import time
+import unicodedata
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+
+
+def strip_accents(text: str) -> str:
+    return ''.join(c for c in unicodedata.normalize('NFKD', text) if not unicodedata.combining(c))
+
+
+def perturb(name: str, kind: str, rng: random.Random) -> str:
+    tokens = name.split()
+    if kind == "exact":
+        return name
+    if kind == "case_accents":
+        return strip_accents(name).upper()
+    if kind == "reordered":
+        return " ".join(tokens[1:] + tokens[:1])
+    if kind == "typo":
+        chars = list(name)
+        letters = [i for i, c in enumerate(chars) if c.isalpha()]
+        i = rng.choice(letters)
+        chars[i] = rng.choice("abcdefghijklmnopqrstuvwxyz".replace(chars[i].lower(), ""))
+        return "".join(chars)
+    if kind == "dropped_token":
+        # Keep first and last names, drop a middle one (e.g. "Mohammed M S Samara" -> "Mohammed Samara").
+        return " ".join([tokens[0], tokens[-1]]) if len(tokens) > 2 else name
+    raise ValueError(kind)
+
+
+def synthetic_people(persons, target: int, rng: random.Random):
+    first = [p['properties']['name'][0].split()[0] for p in persons]
+    last = [p['properties']['name'][0].split()[-1] for p in persons]
+    for i in range(max(0, target - len(persons))):
+        yield {
+            "id": f"synthetic-{i}",
+            "schema": "Person",
+            "properties": {"name": [f"{rng.choice(first)} {rng.choice(last)}"]},
+            "datasets": ["synthetic"],
+        }
+
+
+def percentile(values, pct):
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * pct / 100))]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--threshold", type=float, default=0.5)
+    parser.add_argument("--scale", type=int, default=0, help="Pad the index to this many names.")
+    parser.add_argument("--naive-sample", type=int, default=100, help="Queries timed with the naive scan.")
+    args = parser.parse_args()
+
+    sys.path.insert(0, REPO_ROOT)
+    from skills.finance.wallet_screening.skill import WalletScreeningSkill
+    from skills.finance.wallet_screening.identity_index import IdentityIndex, name_ngrams, normalize_name
+
+    rng = random.Random(42)
+    entities = list(WalletScreeningSkill().sanctions_entities)
+    persons = [e for e in entities if e['schema'] == 'Person' and e['properties'].get('name')
+               and all(ord(c) < 0x0590 for c in e['properties']['name'][0])]
+    entities += list(synthetic_people(persons, args.scale, rng))
+
+    started = time.perf_counter()
+    index = IdentityIndex(entities)
+    print(f"Indexed {len(index):,} records / {len(index.variants):,} names "
+          f"in {(time.perf_counter() - started) * 1000:.0f} ms (threshold {args.threshold})\n")
+
+    kinds = ["exact", "case_accents", "reordered", "typo", "dropped_token"]
+    latencies = []
+    print(f"{'noise':<15} {'queries':>8} {'recall@1':>9} {'recall@10':>10}")
+    for kind in kinds:
+        hits_1 = hits_10 = 0
+        for person in persons:
+            query = perturb(person['properties']['name'][0], kind, rng)
+            t0 = time.perf_counter()
+            result = index.search(name=query, threshold=args.threshold, limit=10)
+            latencies.append((time.perf_counter() - t0) * 1000)
+            ids = [m['entity_id'] for m in result['matches']]
+            hits_1 += int(ids[:1] == [person['id']])
+            hits_10 += int(person['id'] in ids)
+        n = len(persons)
+        print(f"{kind:<15} {n:>8} {hits_1 / n:>9.1%} {hits_10 / n:>10.1%}")
+
+    # Naive baseline: normalize + Dice against every name variant per query.
+    naive = []
+    for person in persons[:args.naive_sample]:
+        query = perturb(person['properties']['name'][0], "typo", rng)
+        t0 = time.perf_counter()
+        q = name_ngrams(normalize_name(query))
+        scores = [2 * len(q & grams) / (len(q) + len(grams)) for _, _, grams in index.variants]
+        sorted(scores, reverse=True)[:10]
+        naive.append((time.perf_counter() - t0) * 1000)
+
+    print(f"\n{'latency (ms)':<15} {'p50':>8} {'p95':>8} {'p99':>8}")
+    for label, values in (("indexed", latencies), ("naive scan", naive)):
+        print(f"{label:<15} {statistics.median(values):>8.3f} {percentile(values, 95):>8.3f} "
+              f"{percentile(values, 99):>8.3f}")
+
+
+if __name__ == "__main__":
+    main()
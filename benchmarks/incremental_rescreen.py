@@ -0,0 +1,114 @@
+"""
+Rescreen cost with persisted per-address aggregates vs a full history replay.
+
+Builds a synthetic wallet history of `--history` transactions, stores its
+aggregates once, then rescreens after `--new` more transactions. It times the
+analysis step only (network calls excluded):
+
+- full replay:   `_analyze_transactions` over the whole history (no store)
+- incremental:   `AggregateStore.fold` over the new transactions only
+- dataset bump:  `fold` after the malicious-contract dataset version changed,
+                 which rebuilds interactions from stored counterparties
+
+Usage:
+    python benchmarks/incremental_rescreen.py
+    python benchmarks/incremental_rescreen.py --history 200000 --new 50
+"""
+import argparse
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+
+
+def synthetic_history(wallet: str, count: int, first_block: int, counterparties, rng: random.Random):
+    block = first_block
+    txs = []
+    for i in range(count):
+        block += rng.choice((0, 1, 1, 2))
+        other = rng.choice(counterparties)
+        outgoing = rng.random() < 0.5
+        txs.append({
+            "hash": "0x%064x" % rng.getrandbits(256),
+            "blockNumber": str(block),
+            "from": wallet if outgoing else other,
+            "to": other if outgoing else wallet,
+            "value": str(rng.randint(0, 10 ** 19)),
+            "gasUsed": "21000",
+            "gasPrice": str(rng.randint(10 ** 9, 10 ** 11)),
+            "isError": "1" if rng.random() < 0.02 else "0",
+        })
+    return txs
+
+
+def timed(fn, repeat: int) -> float:
+    runs = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        runs.append((time.perf_counter() - started) * 1000)
+    return statistics.median(runs)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--history", type=int, default=50000, help="Transactions already screened.")
+    parser.add_argument("--new", type=int, default=20, help="Transactions since the last screening.")
+    parser.add_argument("--counterparties", type=int, default=2000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    sys.path.insert(0, REPO_ROOT)
+    from skills.finance.wallet_screening.aggregates import AggregateStore
+    from skills.finance.wallet_screening.skill import WalletScreeningSkill
+
+    rng = random.Random(5)
+    skill = WalletScreeningSkill()
+    snapshot = skill.snapshot
+    wallet = "0x" + "ab" * 20
+    listed = list(snapshot.malicious_index)[:20]
+    counterparties = ['0x' + '%040x' % rng.getrandbits(160) for _ in range(args.counterparties)] + listed
+    history = synthetic_history(wallet, args.history, 10_000_000, counterparties, rng)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        store = AggregateStore(os.path.join(tmp, "aggregates.db"))
+        started = time.perf_counter()
+        store.fold(wallet, history, snapshot.malicious_index, snapshot.malicious_version)
+        initial_ms = (time.perf_counter() - started) * 1000
+
+        full_ms = timed(lambda: skill._analyze_transactions(history, wallet, snapshot), args.repeat)
+
+        incremental = []
+        last_block = int(history[-1]["blockNumber"])
+        for _ in range(args.repeat):
+            new = synthetic_history(wallet, args.new, last_block, counterparties, rng)
+            last_block = int(new[-1]["blockNumber"])
+            # What a rescreen fetches: everything from the last stored block on.
+            fetched = [tx for tx in history if int(tx["blockNumber"]) >= store.last_block(wallet)] + new
+            history += new
+            started = time.perf_counter()
+            result = store.fold(wallet, fetched, snapshot.malicious_index, snapshot.malicious_version)
+            incremental.append((time.perf_counter() - started) * 1000)
+        assert result["total_txs"] == len(history)
+
+        bumped = dict(snapshot.malicious_index)
+        bumped.pop(listed[0])
+        started = time.perf_counter()
+        store.fold(wallet, [], bumped, "bumped")
+        bump_ms = (time.perf_counter() - started) * 1000
+        store.close()
+
+    print(f"History {args.history:,} txs, {args.counterparties:,} counterparties, {args.new} new txs per rescreen\n")
+    print(f"{'step':<34} {'ms':>10}")
+    print(f"{'initial store (one-off)':<34} {initial_ms:>10.1f}")
+    print(f"{'full replay':<34} {full_ms:>10.1f}")
+    print(f"{'incremental rescreen':<34} {statistics.median(incremental):>10.2f}")
+    print(f"{'rescreen after dataset change':<34} {bump_ms:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
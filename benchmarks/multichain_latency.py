@@ -0,0 +1,87 @@
+"""
+Latency of a multi-chain screening: concurrent fan-out vs one chain at a time.
+
+Network calls are replaced by a stub that answers each chain's explorer
+requests after that chain's latency (`--latency-ms`, one value per chain in
+CHAINS order, or one value for all) and price requests after `--price-ms`.
+Caches are disabled so every screening hits the stub.
+
+- sequential:  one single-chain `execute` per chain, back to back
+- fan-out:     one `execute` with `chains=[...]`
+
+Usage:
+    python benchmarks/multichain_latency.py
+    python benchmarks/multichain_latency.py --latency-ms 300 800 200 150 150 150 --rate-limit 5
+"""
+import argparse
+import os
+import statistics
+import sys
+import time
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+
+
+def make_stub(latencies: dict, price_s: float):
+    def http_get(url, params=None, timeout=10):
+        if params is None:
+            time.sleep(price_s)
+            coin = url.split("ids=")[1].split("&")[0]
+            return {coin: {"usd": 1.0, "eur": 1.0}}
+        time.sleep(latencies[params["chainid"]])
+        if params.get("action") == "balance":
+            return {"status": "1", "result": str(10 ** 18)}
+        return {"status": "0", "message": "No transactions found", "result": []}
+
+    return http_get
+
+
+def main():
+    sys.path.insert(0, REPO_ROOT)
+    from skills.finance.wallet_screening.chains import CHAINS
+    from skills.finance.wallet_screening.skill import WalletScreeningSkill
+
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--latency-ms", type=float, nargs="+", default=[300, 600, 250, 150, 150, 150],
+                        help="Explorer latency per chain, in CHAINS order.")
+    parser.add_argument("--price-ms", type=float, default=100)
+    parser.add_argument("--rate-limit", type=float, default=0, help="EXPLORER_RATE_LIMIT (0 = unlimited).")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    chains = list(CHAINS)
+    latency_ms = args.latency_ms * len(chains) if len(args.latency_ms) == 1 else args.latency_ms
+    latencies = {CHAINS[c]["chain_id"]: ms / 1000 for c, ms in zip(chains, latency_ms)}
+
+    skill = WalletScreeningSkill({
+        "ETHERSCAN_API_KEY": "benchmark",
+        "EXPLORER_RATE_LIMIT": args.rate_limit,
+        "PRICE_CACHE_TTL": 0, "TX_CACHE_TTL": 0, "BALANCE_CACHE_TTL": 0, "REPORT_CACHE_TTL": 0,
+    })
+    skill._http_get = make_stub(latencies, args.price_ms / 1000)
+    skill._ensure_datasets()
+
+    def timed(fn):
+        runs = []
+        for i in range(args.repeat):
+            started = time.perf_counter()
+            fn("0x" + "%040x" % i)
+            runs.append((time.perf_counter() - started) * 1000)
+        return statistics.median(runs)
+
+    def sequential(address):
+        for chain in chains:
+            skill.execute({"address": address, "chains": [chain]})
+
+    def fan_out(address):
+        report = skill.execute({"address": address, "chains": chains})
+        assert not report["summary"]["partial"], report["metadata"]["data_status"]
+
+    print(f"{len(chains)} chains, slowest explorer {max(latency_ms):.0f} ms, price {args.price_ms:.0f} ms\n")
+    print(f"{'mode':<12} {'ms':>10}")
+    print(f"{'sequential':<12} {timed(sequential):>10.1f}")
+    print(f"{'fan-out':<12} {timed(fan_out):>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,195 @@
+"""
+Load test of `skillware serve` against a local upstream stub.
+
+Starts an HTTP stub that plays Etherscan V2 (txlist, balance, balancemulti)
+and CoinGecko with `--latency-ms` per call, then runs `python -m skillware
+serve` pointed at it, once without micro-batching (`--batch-window-ms 0
+--max-batch 1`) and once with it. `--clients` concurrent clients send
+`--requests` screenings in total. A `--hot` share of them goes to a few hot
+addresses, so concurrent requests for the same address occur; the rest
+are unique.
+
+For each mode it reports throughput, client latency, upstream calls per
+screening (by kind) and the server's /stats (coalesced requests, batch
+sizes, queue wait, partial reports).
+
+Usage:
+    python benchmarks/serve_loadtest.py
+    python benchmarks/serve_loadtest.py --clients 64 --requests 2000 --latency-ms 80
+"""
+import argparse
+import json
+import os
+import random
+import socket
+import statistics
+import subprocess
+import sys
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib import parse as urlparse, request as urlrequest
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+
+
+class _Server(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 512
+
+
+def start_upstream(latency_s: float):
+    """Etherscan/CoinGecko stub on a free port. Returns (server, call counter)."""
+    calls = Counter()
+    lock = threading.Lock()
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self):
+            url = urlparse.urlsplit(self.path)
+            query = {k: v[0] for k, v in urlparse.parse_qs(url.query).items()}
+            kind = "price" if url.path.endswith("/simple/price") else query.get("action", "?")
+            with lock:
+                calls[kind] += 1
+            time.sleep(latency_s)
+            if kind == "price":
+                body = {query["ids"]: {query["vs_currencies"]: 1000.0}}
+            elif kind == "balance":
+                body = {"status": "1", "message": "OK", "result": str(10 ** 18)}
+            elif kind == "balancemulti":
+                accounts = query["address"].split(",")
+                body = {"status": "1", "message": "OK",
+                        "result": [{"account": a, "balance": str(10 ** 18)} for a in accounts]}
+            else:
+                body = {"status": "0", "message": "No transactions found", "result": []}
+            payload = json.dumps(body).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+
+        def log_message(self, fmt, *args):
+            pass
+
+    server = _Server(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, calls
+
+
+def free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def http(method: str, url: str, body=None, timeout: float = 60.0):
+    data = json.dumps(body).encode() if body is not None else None
+    req = urlrequest.Request(url, data=data, method=method, headers={"Content-Type": "application/json"})
+    with urlrequest.urlopen(req, timeout=timeout) as resp:
+        return json.loads(resp.read())
+
+
+def start_serve(upstream: str, port: int, extra_args):
+    config = {
+        "ETHERSCAN_API_URL": f"{upstream}/v2/api",
+        "COINGECKO_API_URL": f"{upstream}/api/v3",
+        "EXPLORER_RATE_LIMIT": 0,
+        # Every screening reaches the upstreams, apart from what coalescing and batching save.
+        "REPORT_CACHE_TTL": 0, "TX_CACHE_TTL": 0,
+    }
+    cmd = [sys.executable, "-m", "skillware", "--env-file", os.devnull, "serve", "--port", str(port), *extra_args]
+    for key, value in config.items():
+        cmd += ["--config", f"{key}={value}"]
+    env = dict(os.environ, ETHERSCAN_API_KEY="loadtest",
+               PYTHONPATH=os.pathsep.join(filter(None, [REPO_ROOT, os.environ.get("PYTHONPATH")])))
+    proc = subprocess.Popen(cmd, cwd=REPO_ROOT, env=env)
+    base = f"http://127.0.0.1:{port}"
+    for _ in range(600):
+        try:
+            http("GET", f"{base}/health", timeout=1)
+            return proc, base
+        except OSError:
+            if proc.poll() is not None:
+                raise RuntimeError("skillware serve exited during startup")
+            time.sleep(0.1)
+    proc.kill()
+    raise RuntimeError("skillware serve did not start")
+
+
+def run_mode(name: str, extra_args, args, upstream: str, calls: Counter, rng: random.Random) -> dict:
+    proc, base = start_serve(upstream, free_port(), extra_args)
+    try:
+        hot = ["0x" + "%040x" % rng.getrandbits(160) for _ in range(5)]
+        addresses = [rng.choice(hot) if rng.random() < args.hot else "0x" + "%040x" % rng.getrandbits(160)
+                     for _ in range(args.requests)]
+        calls.clear()
+        latencies = []
+
+        def screen(address):
+            started = time.perf_counter()
+            report = http("POST", f"{base}/skills/finance/wallet_screening", {"address": address})
+            latencies.append((time.perf_counter() - started) * 1000)
+            return report
+
+        started = time.perf_counter()
+        with ThreadPoolExecutor(args.clients) as pool:
+            reports = list(pool.map(screen, addresses))
+        elapsed = time.perf_counter() - started
+        errors = sum(1 for r in reports if "error" in r)
+        stats = http("GET", f"{base}/stats")["skills"]["finance/wallet_screening"]
+    finally:
+        proc.terminate()
+        proc.wait()
+
+    latencies.sort()
+    return {
+        "mode": name,
+        "throughput": args.requests / elapsed,
+        "p50": statistics.median(latencies),
+        "p95": latencies[int(len(latencies) * 0.95) - 1],
+        "upstream": dict(calls),
+        "errors": errors,
+        "stats": stats,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=1000)
+    parser.add_argument("--clients", type=int, default=32)
+    parser.add_argument("--latency-ms", type=float, default=50.0, help="Upstream latency per call.")
+    parser.add_argument("--hot", type=float, default=0.3, help="Share of requests for the 5 hot addresses.")
+    parser.add_argument("--batch-window-ms", type=float, default=5.0)
+    parser.add_argument("--max-batch", type=int, default=20)
+    args = parser.parse_args()
+
+    upstream_server, calls = start_upstream(args.latency_ms / 1000)
+    upstream = f"http://127.0.0.1:{upstream_server.server_port}"
+    modes = [
+        ("unbatched", ["--batch-window-ms", "0", "--max-batch", "1"]),
+        ("micro-batched", ["--batch-window-ms", str(args.batch_window_ms), "--max-batch", str(args.max_batch)]),
+    ]
+    results = [run_mode(name, extra, args, upstream, calls, random.Random(11)) for name, extra in modes]
+    upstream_server.shutdown()
+
+    print(f"\n{args.requests} screenings, {args.clients} clients, upstream latency {args.latency_ms:.0f} ms, "
+          f"{args.hot:.0%} to hot addresses\n")
+    print(f"{'mode':<15} {'req/s':>8} {'p50 ms':>8} {'p95 ms':>8} {'calls/scr':>10} {'coalesced':>10} "
+          f"{'avg batch':>10} {'wait ms':>8} {'partial':>8} {'errors':>7}")
+    for r in results:
+        stats = r["stats"]
+        per_screening = sum(r["upstream"].values()) / args.requests
+        print(f"{r['mode']:<15} {r['throughput']:>8.1f} {r['p50']:>8.1f} {r['p95']:>8.1f} {per_screening:>10.2f} "
+              f"{stats['coalesced']:>10} {stats['avg_batch_size']:>10.2f} {stats['avg_queue_wait_ms']:>8.2f} "
+              f"{stats['partial']:>8} {r['errors']:>7}")
+    print()
+    for r in results:
+        print(f"{r['mode']:<15} upstream calls: {json.dumps(r['upstream'], sort_keys=True)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,214 @@
+"""
+Cache hit rate of screening nodes behind consistent-hash routing vs random routing.
+
+Starts `--nodes` local screening node processes. Each node is a small HTTP
+server wrapping its own WalletScreeningSkill, whose upstream calls are stubbed
+(`--latency-ms` each). A Zipf-distributed stream of screenings, where a few
+addresses are screened often and most rarely, is then sent either
+to a random node per request or through `ShardRouter`. Each policy starts with
+cold node processes.
+
+After the consistent-hash run a node joins and another leaves, and the script
+reports the fraction of addresses that changed owner (ideal: 1/N) and the hit
+rate of the next phase.
+
+Usage:
+    python benchmarks/sharding_simulation.py
+    python benchmarks/sharding_simulation.py --nodes 8 --addresses 5000 --requests 20000
+"""
+import argparse
+import json
+import multiprocessing
+import os
+import random
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from urllib import request as urlrequest
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+sys.path.insert(0, REPO_ROOT)
+
+
+def stub_http_get(latency_s: float, counter: list):
+    def http_get(url, params=None, timeout=10):
+        counter[0] += 1
+        time.sleep(latency_s)
+        if params is None:
+            return {"ethereum": {"usd": 3000.0, "eur": 2800.0}}
+        if params.get("action") == "balance":
+            return {"status": "1", "result": str(10 ** 18)}
+        wallet = params["address"].lower()
+        other = "0x" + "ab" * 20
+        return {"status": "1", "result": [
+            {"hash": "0x%064x" % i, "from": wallet, "to": other, "value": str(10 ** 16),
+             "gasUsed": "21000", "gasPrice": "20000000000", "isError": "0"}
+            for i in range(20)
+        ]}
+    return http_get
+
+
+def run_node(port_queue, latency_s: float):
+    from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+    from skills.finance.wallet_screening.skill import WalletScreeningSkill
+
+    upstream_calls = [0]
+    skill = WalletScreeningSkill({"ETHERSCAN_API_KEY": "benchmark", "EXPLORER_RATE_LIMIT": 0})
+    skill._http_get = stub_http_get(latency_s, upstream_calls)
+    skill._ensure_datasets()
+
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+
+        def do_GET(self):
+            self._reply({"cache": skill.cache_stats(), "upstream_calls": upstream_calls[0]})
+
+        def do_POST(self):
+            body = self.rfile.read(int(self.headers.get("Content-Length") or 0))
+            self._reply(skill.execute(json.loads(body)))
+
+        def _reply(self, payload):
+            data = json.dumps(payload).encode()
+            self.send_response(200)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def log_message(self, fmt, *args):
+            pass
+
+    class Server(ThreadingHTTPServer):
+        daemon_threads = True
+        request_queue_size = 128
+
+    server = Server(("127.0.0.1", 0), Handler)
+    port_queue.put(server.server_port)
+    server.serve_forever()
+
+
+def start_nodes(count: int, latency_s: float):
+    ctx = multiprocessing.get_context("spawn")
+    queue = ctx.Queue()
+    procs = [ctx.Process(target=run_node, args=(queue, latency_s), daemon=True) for _ in range(count)]
+    for proc in procs:
+        proc.start()
+    urls = [f"http://127.0.0.1:{queue.get(timeout=60)}" for _ in procs]
+    return procs, urls
+
+
+def stop_nodes(procs):
+    for proc in procs:
+        proc.terminate()
+        proc.join()
+
+
+def post(url: str, payload: dict) -> dict:
+    req = urlrequest.Request(url, data=json.dumps(payload).encode(), method="POST",
+                             headers={"Content-Type": "application/json"})
+    with urlrequest.urlopen(req, timeout=30) as resp:
+        return json.loads(resp.read())
+
+
+def node_totals(urls):
+    totals = {"hits": 0, "misses": 0, "upstream_calls": 0}
+    for url in urls:
+        with urlrequest.urlopen(url + "/stats", timeout=10) as resp:
+            stats = json.loads(resp.read())
+        totals["hits"] += stats["cache"]["report"]["hits"]
+        totals["misses"] += stats["cache"]["report"]["misses"]
+        totals["upstream_calls"] += stats["upstream_calls"]
+    return totals
+
+
+def run_phase(send, workload, urls, concurrency: int) -> dict:
+    before = node_totals(urls)
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        results = list(pool.map(send, workload))
+    elapsed = time.perf_counter() - started
+    after = node_totals(urls)
+    assert all("summary" in r for r in results), "a screening failed"
+    hits, misses = after["hits"] - before["hits"], after["misses"] - before["misses"]
+    return {
+        "hit_rate": hits / max(1, hits + misses),
+        "upstream_per_screening": (after["upstream_calls"] - before["upstream_calls"]) / len(workload),
+        "per_second": len(workload) / elapsed,
+    }
+
+
+def print_row(label: str, row: dict):
+    print(f"{label:<28} {row['hit_rate']:>9.1%} {row['upstream_per_screening']:>12.2f} {row['per_second']:>10.0f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--nodes", type=int, default=4)
+    parser.add_argument("--addresses", type=int, default=2000, help="Distinct addresses in the workload.")
+    parser.add_argument("--requests", type=int, default=6000, help="Screenings per phase.")
+    parser.add_argument("--zipf", type=float, default=1.1, help="Zipf exponent of address popularity.")
+    parser.add_argument("--latency-ms", type=float, default=2.0, help="Simulated latency per upstream call.")
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--vnodes", type=int, default=160)
+    args = parser.parse_args()
+
+    from skillware.core.sharding import ConsistentHashRing, ShardRouter
+
+    rng = random.Random(42)
+    addresses = ['0x' + '%040x' % rng.getrandbits(160) for _ in range(args.addresses)]
+    weights = [1 / (rank + 1) ** args.zipf for rank in range(args.addresses)]
+
+    def workload():
+        # Mixed case on purpose: routing must use the lowercased address.
+        picks = rng.choices(addresses, weights=weights, k=args.requests)
+        return [{"address": a if rng.random() < 0.5 else "0x" + a[2:].upper()} for a in picks]
+
+    latency_s = args.latency_ms / 1000
+    print(f"{args.nodes} nodes, {args.addresses:,} addresses, {args.requests:,} screenings per phase, "
+          f"zipf {args.zipf}\n")
+    print(f"{'phase':<28} {'hit rate':>9} {'upstream/scr':>12} {'screens/s':>10}")
+
+    # Random routing: any node may get any address.
+    procs, urls = start_nodes(args.nodes, latency_s)
+    try:
+        print_row("random", run_phase(lambda p: post(rng.choice(urls), p), workload(), urls, args.concurrency))
+    finally:
+        stop_nodes(procs)
+
+    # Consistent hashing through the router.
+    procs, urls = start_nodes(args.nodes + 1, latency_s)
+    spare = urls.pop()
+    try:
+        ring = ConsistentHashRing(urls, vnodes=args.vnodes)
+        router = ShardRouter(ring)
+        server = router.make_server(port=0)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        router_url = f"http://127.0.0.1:{server.server_port}"
+
+        def send(p):
+            return post(router_url, p)
+
+        all_urls = urls + [spare]
+        print_row("consistent hash", run_phase(send, workload(), all_urls, args.concurrency))
+
+        owners = {a: ring.node_for(a) for a in addresses}
+        load = [sum(1 for o in owners.values() if o == u) for u in urls]
+        ring.add_node(spare)
+        moved = sum(ring.node_for(a) != owners[a] for a in addresses) / len(addresses)
+        print_row(f"after join (moved {moved:.1%})", run_phase(send, workload(), all_urls, args.concurrency))
+
+        owners = {a: ring.node_for(a) for a in addresses}
+        ring.remove_node(urls[0])
+        moved = sum(ring.node_for(a) != owners[a] for a in addresses) / len(addresses)
+        print_row(f"after leave (moved {moved:.1%})", run_phase(send, workload(), all_urls, args.concurrency))
+        server.shutdown()
+    finally:
+        stop_nodes(procs)
+
+    print(f"\nIdeal movement: {1 / (args.nodes + 1):.1%} on join, {1 / (args.nodes + 1):.1%} on leave. "
+          f"Keys per node before join: min {min(load)}, max {max(load)} (mean {args.addresses / args.nodes:.0f}).")
+
+
+if __name__ == "__main__":
+    main()
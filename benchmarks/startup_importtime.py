@@ -0,0 +1,129 @@
+"""
+Startup budget check for short-lived workers.
+
+Runs `import skillware` and the loading of the `finance/wallet_screening`
+bundle in fresh interpreters under `python -X importtime`, and fails (exit 1)
+if either exceeds its time budget or pulls in a dependency that should be
+deferred until first use.
+
+Usage:
+    python benchmarks/startup_importtime.py
+    python benchmarks/startup_importtime.py --repeat 10 --import-budget-ms 15
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+
+SCENARIOS = {
+    "import skillware": {
+        "code": "import skillware",
+        "forbidden": ["yaml", "requests"],
+    },
+    "load wallet_screening bundle": {
+        "code": (
+            "from skillware.core.loader import SkillLoader\n"
+            "bundle = SkillLoader.load_skill('finance/wallet_screening')\n"
+            "skill = bundle['module'].WalletScreeningSkill()\n"
+            "SkillLoader.to_claude_tool(bundle)\n"
+        ),
+        # Schemas only: no HTTP client and no dataset parsing should happen here.
+        "forbidden": ["requests"],
+    },
+}
+
+# Wraps the scenario so the child reports its own wall time and loaded modules.
+CHILD_TEMPLATE = """
+import sys, time
+_t0 = time.perf_counter()
+{code}
+_elapsed = (time.perf_counter() - _t0) * 1000
+_skill = globals().get('skill')
+import json
+print(json.dumps({{
+    "wall_ms": _elapsed,
+    "modules": sorted(sys.modules),
+    "datasets_loaded": getattr(_skill, '_snapshot', None) is not None,
+}}))
+"""
+
+
+def parse_importtime(stderr: str) -> dict:
+    """
+    Parses `-X importtime` output into {module: cumulative_us} for top-level imports.
+    """
+    cumulative = {}
+    for line in stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        # Format: "import time: <self_us> | <cumulative_us> | <indented module name>"
+        _, cum_us, name = line[len("import time:"):].split("|")
+        # Nested imports are indented one extra space per level; keep the outermost ones.
+        if name.startswith("  "):
+            continue
+        cumulative[name.strip()] = int(cum_us)
+    return cumulative
+
+
+def run_scenario(code: str) -> dict:
+    env = dict(os.environ, PYTHONPATH=REPO_ROOT + os.pathsep + os.environ.get("PYTHONPATH", ""))
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", CHILD_TEMPLATE.format(code=code)],
+        cwd=REPO_ROOT, env=env, capture_output=True, text=True
+    )
+    if proc.returncode != 0:
+        errors = [line for line in proc.stderr.splitlines() if not line.startswith("import time:")]
+        raise RuntimeError("\n".join(errors[-5:]))
+    result = json.loads(proc.stdout.strip().splitlines()[-1])
+    result["import_us"] = parse_importtime(proc.stderr)
+    return result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--repeat", type=int, default=5, help="Fresh interpreters per scenario (median is reported).")
+    parser.add_argument("--import-budget-ms", type=float, default=20.0, help="Budget for `import skillware`.")
+    parser.add_argument("--bundle-budget-ms", type=float, default=150.0, help="Budget for loading the bundle.")
+    args = parser.parse_args()
+
+    budgets = {
+        "import skillware": args.import_budget_ms,
+        "load wallet_screening bundle": args.bundle_budget_ms,
+    }
+
+    failures = []
+    for name, scenario in SCENARIOS.items():
+        try:
+            runs = [run_scenario(scenario["code"]) for _ in range(args.repeat)]
+        except RuntimeError as e:
+            failures.append(f"{name}: scenario failed:\n{e}")
+            continue
+
+        wall_ms = statistics.median(r["wall_ms"] for r in runs)
+        heaviest = sorted(runs[-1]["import_us"].items(), key=lambda x: -x[1])[:5]
+        print(f"{name}: median {wall_ms:.1f} ms (budget {budgets[name]:.0f} ms)")
+        for module, us in heaviest:
+            print(f"    {us / 1000:8.2f} ms  {module}")
+
+        if wall_ms > budgets[name]:
+            failures.append(f"{name}: {wall_ms:.1f} ms exceeds budget of {budgets[name]:.0f} ms")
+        leaked = [m for m in scenario["forbidden"] if m in runs[-1]["modules"]]
+        if leaked:
+            failures.append(f"{name}: imported deferred dependencies eagerly: {', '.join(leaked)}")
+        if runs[-1]["datasets_loaded"]:
+            failures.append(f"{name}: datasets were parsed before the first execute()")
+
+    if failures:
+        print("\nStartup budget FAILED:")
+        for failure in failures:
+            print(f"  - {failure}")
+        sys.exit(1)
+    print("\nStartup budget OK.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,137 @@
+"""
+Thread scaling of one shared WalletScreeningSkill instance.
+
+Network calls are replaced by a stub that sleeps for `--latency-ms` and returns
+a synthetic transaction history of `--txs` entries, so the run measures how
+well a single instance overlaps I/O-bound screenings (plus the CPU cost of
+analysing each history) as worker threads are added.
+
+The same measurement is repeated under every free-threaded CPython found on
+PATH (python3.13t, python3.14t, ...) or passed with `--python`.
+
+Usage:
+    python benchmarks/thread_scaling.py
+    python benchmarks/thread_scaling.py --screenings 400 --workers 1 4 16 64
+    python benchmarks/thread_scaling.py --python /opt/python3.13t/bin/python3.13t
+"""
+import argparse
+import json
+import os
+import random
+import shutil
+import subprocess
+import sys
+import time
+
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), '..'))
+FREE_THREADED_CANDIDATES = ["python3.13t", "python3.14t", "python3.15t"]
+
+
+def make_stub(latency_s: float, tx_count: int):
+    rng = random.Random(7)
+    counterparties = ['0x' + '%040x' % rng.getrandbits(160) for _ in range(50)]
+
+    def http_get(url, params=None, timeout=10):
+        time.sleep(latency_s)
+        if params is None:
+            return {"ethereum": {"usd": 3000.0, "eur": 2800.0}}
+        if params.get("action") == "balance":
+            return {"status": "1", "result": str(10 ** 18)}
+        wallet = params["address"].lower()
+        txs = []
+        for i in range(tx_count):
+            other = counterparties[i % len(counterparties)]
+            outgoing = i % 2 == 0
+            txs.append({
+                "hash": "0x%064x" % i,
+                "from": wallet if outgoing else other,
+                "to": other if outgoing else wallet,
+                "value": str(10 ** 16 * (i % 7)),
+                "gasUsed": "21000",
+                "gasPrice": "20000000000",
+                "isError": "0",
+            })
+        return {"status": "1", "result": txs}
+
+    return http_get
+
+
+def run_child(args) -> dict:
+    sys.path.insert(0, REPO_ROOT)
+    from skills.finance.wallet_screening.skill import WalletScreeningSkill
+
+    # Caches off: every screening pays the full (stubbed) upstream cost.
+    skill = WalletScreeningSkill({
+        "ETHERSCAN_API_KEY": "benchmark",
+        "EXPLORER_RATE_LIMIT": 0,
+        "PRICE_CACHE_TTL": 0, "TX_CACHE_TTL": 0, "BALANCE_CACHE_TTL": 0, "REPORT_CACHE_TTL": 0,
+    })
+    skill._http_get = make_stub(args.latency_ms / 1000, args.txs)
+    skill.warm_up = skill._ensure_datasets  # the stub needs no HTTP client
+    skill.warm_up()
+
+    rng = random.Random(1)
+    params = [{"address": '0x' + '%040x' % rng.getrandbits(160), "time_budget": args.time_budget}
+              for _ in range(args.screenings)]
+
+    gil = getattr(sys, "_is_gil_enabled", lambda: True)()
+    rows = []
+    for workers in args.workers:
+        start = time.perf_counter()
+        results = skill.execute_many(params, max_workers=workers)
+        elapsed = time.perf_counter() - start
+        assert all("summary" in r for r in results)
+        partial = sum(1 for r in results if r["summary"]["partial"])
+        rows.append({"workers": workers, "seconds": elapsed, "per_second": len(params) / elapsed, "partial": partial})
+    return {"python": sys.version.split()[0], "executable": sys.executable, "gil": gil, "rows": rows}
+
+
+def print_result(result: dict):
+    label = "GIL" if result["gil"] else "free-threaded"
+    print(f"\n{result['executable']} (Python {result['python']}, {label})")
+    print(f"{'workers':>8} {'seconds':>9} {'screens/s':>10} {'speedup':>8} {'partial':>8}")
+    base = result["rows"][0]["per_second"]
+    for row in result["rows"]:
+        print(f"{row['workers']:>8} {row['seconds']:>9.2f} {row['per_second']:>10.1f} "
+              f"{row['per_second'] / base:>7.1f}x {row['partial']:>8}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--screenings", type=int, default=200)
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8, 16, 32])
+    parser.add_argument("--latency-ms", type=float, default=50.0, help="Simulated latency per upstream call.")
+    parser.add_argument("--txs", type=int, default=500, help="Synthetic transactions per wallet history.")
+    parser.add_argument("--time-budget", type=float, default=1.0,
+                        help="time_budget per screening; 'partial' counts reports that missed it.")
+    parser.add_argument("--python", action="append", default=[], help="Extra interpreter to benchmark.")
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        print(json.dumps(run_child(args)))
+        return
+
+    print_result(run_child(args))
+
+    interpreters = args.python + [p for p in map(shutil.which, FREE_THREADED_CANDIDATES) if p]
+    if not interpreters:
+        print("\nNo free-threaded CPython found on PATH (looked for: "
+              f"{', '.join(FREE_THREADED_CANDIDATES)}); pass one with --python.")
+    child_args = [
+        "--child", "--screenings", str(args.screenings), "--latency-ms", str(args.latency_ms),
+        "--txs", str(args.txs), "--time-budget", str(args.time_budget), "--workers", *map(str, args.workers)
+    ]
+    for interpreter in interpreters:
+        proc = subprocess.run(
+            [interpreter, "-X", "gil=0", os.path.abspath(__file__), *child_args],
+            capture_output=True, text=True
+        )
+        if proc.returncode != 0:
+            print(f"\n{interpreter}: failed\n{proc.stderr.strip()}")
+            continue
+        print_result(json.loads(proc.stdout.strip().splitlines()[-1]))
+
+
+if __name__ == "__main__":
+    main()
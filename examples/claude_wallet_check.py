@@ -7,6 +7,7 @@ sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 import anthropic
 from skillware.core.loader import SkillLoader
 from skillware.core.env import load_env_file
+from skillware.core.dispatcher import ToolDispatcher
 
 # Load Global Env (User should have ETHERSCAN_API_KEY and ANTHROPIC_API_KEY)
 load_env_file()
@@ -44,42 +45,37 @@ message = client.messages.create(
 )
 
 # 5. Handle Tool Use
-if message.stop_reason == "tool_use":
-    tool_use = next(block for block in message.content if block.type == "tool_use")
-    tool_name = tool_use.name
-    tool_input = tool_use.input
-    
-    print(f"\nClaude requested tool: {tool_name}")
-    print(f"Input: {tool_input}")
+# Claude may request several screenings in one turn; the dispatcher runs them
+# all concurrently and returns the tool_result blocks in the original order.
+dispatcher = ToolDispatcher()
+dispatcher.register_bundle(skill, wallet_skill, max_concurrency=4, timeout=60)
 
-    if tool_name == "wallet_screening":
-        # Execute the skill
-        result = wallet_skill.execute(tool_input)
-        
-        print("\nSkill Execution Result (Summary):")
-        print(json.dumps(result.get('summary', {}), indent=2))
+messages = [{"role": "user", "content": user_query}]
+while message.stop_reason == "tool_use":
+    for block in message.content:
+        if block.type == "tool_use":
+            print(f"\nClaude requested tool: {block.name}")
+            print(f"Input: {block.input}")
 
-        # Feed back to Claude
-        response = client.messages.create(
-            model="claude-3-opus-20240229",
-            max_tokens=1024,
-            system=skill['instructions'],
-            tools=tools,
-            messages=[
-                {"role": "user", "content": user_query},
-                {"role": "assistant", "content": message.content},
-                {
-                    "role": "user",
-                    "content": [
-                        {
-                            "type": "tool_result",
-                            "tool_use_id": tool_use.id,
-                            "content": json.dumps(result)
-                        }
-                    ],
-                },
-            ],
-        )
-        
-        print("\nAgent Final Response:")
-        print(response.content[0].text)
+    tool_results = dispatcher.dispatch_claude(message)
+
+    print("\nSkill Execution Result (Summary):")
+    for result in tool_results:
+        print(json.dumps(json.loads(result["content"]).get('summary', {}), indent=2))
+
+    # Feed back to Claude
+    messages += [
+        {"role": "assistant", "content": message.content},
+        {"role": "user", "content": tool_results},
+    ]
+    message = client.messages.create(
+        model="claude-3-opus-20240229",
+        max_tokens=1024,
+        system=skill['instructions'],
+        tools=tools,
+        messages=messages,
+    )
+
+print("\nAgent Final Response:")
+print(message.content[0].text)
+print(f"Tool latency stats: {dispatcher.stats}")
@@ -6,6 +6,7 @@ sys.path.append(os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 import google.generativeai as genai
 from skillware.core.loader import SkillLoader
 from skillware.core.env import load_env_file
+from skillware.core.dispatcher import ToolDispatcher
 
 # Load Global Env (User should create a .env file with ETHERSCAN_API_KEY and GOOGLE_API_KEY)
 load_env_file()
@@ -36,60 +37,37 @@ model = genai.GenerativeModel(
     system_instruction=skill_bundle['instructions'] # Inject the skill's cognitive map
 )
 
-chat = model.start_chat(enable_automatic_function_calling=True)
+chat = model.start_chat()
 
 # 4. Run the Agent Loop
 user_query = "Can you screen this wallet for me? 0xd8dA6BF26964aF9D7eEd9e03E53415D37aA96045" # Vitalik's address as example
 print(f"User: {user_query}")
 
-# Create a function map for manual execution if automatic calling wasn't enabled 
-# (though the library handles it, describing it here for clarity)
-function_map = {
-    'wallet_screening': wallet_skill.execute
-}
-
-# In a real loop, you would handle the tool call response. 
-# Here we simulate the key steps or let the library's auto-function calling work if supported by the client lib version.
-# Note: Python client support for auto-execution might vary, so we define a simple runner.
+# Map tool names to skill instances. The dispatcher runs every function call
+# of a turn concurrently (e.g. five wallets at once) and keeps their order.
+dispatcher = ToolDispatcher()
+dispatcher.register_bundle(skill_bundle, wallet_skill, max_concurrency=4, timeout=60)
 
 # Send initial message
 response = chat.send_message(user_query)
 
-# Simple loop to handle tool calls (depth 1 for demo, but loop is better)
-while response.candidates and response.candidates[0].content.parts:
-    part = response.candidates[0].content.parts[0]
-    
-    # Check if the model wants to call a function
-    if part.function_call:
-        fn_name = part.function_call.name
-        fn_args = dict(part.function_call.args)
-        
-        print(f"🤖 Agent wants to call: {fn_name}")
-        
-        if fn_name == 'wallet_screening':
-            # Execute the skill logic
-            print("⚙️ Executing skill locally...")
-            api_result = wallet_skill.execute(fn_args)
-            
-            # Send the result back to the model
-            print("📤 Sending result back to Agent...")
-            response = chat.send_message(
-                [
-                    {
-                        "function_response": {
-                            "name": fn_name,
-                            "response": {'result': api_result}
-                        }
-                    }
-                ]
-            )
-        else:
-            print(f"Unknown function: {fn_name}")
-            break
-    else:
+# Loop until the model stops calling functions
+while True:
+    calls = dispatcher.gemini_calls(response)
+    if not calls:
         # No function call, just text
         break
 
+    for call in calls:
+        print(f"🤖 Agent wants to call: {call.name}")
+
+    # Execute the skill logic
+    print(f"⚙️ Executing {len(calls)} call(s) locally...")
+    function_responses = dispatcher.to_gemini_parts(dispatcher.dispatch(calls))
+
+    # Send the results back to the model
+    print("📤 Sending results back to Agent...")
+    response = chat.send_message(function_responses)
+
 print("\n💬 Agent Final Response:")
 print(response.text)
-
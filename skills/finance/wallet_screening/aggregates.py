@@ -0,0 +1,332 @@
+import hashlib
+import hmac
+import json
+import os
+import sqlite3
+import threading
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple, Union
+
+from skillware.core.audit import stored_key
+
+# (seq, tx_hash, other_party, direction, value_eth); `seq` is the position in the wallet's history.
+Interaction = Tuple[int, Optional[str], str, str, float]
+
+TOP_COUNTERPARTIES = 10
+
+
+def interaction_record(entry: Interaction, malicious_map: Mapping[str, Mapping]) -> Dict[str, Any]:
+    """Expands a stored interaction with the contract details of the current dataset."""
+    _, tx_hash, other_party, direction, value_eth = entry
+    contract_info = malicious_map.get(other_party, {})
+    return {
+        'tx_hash': tx_hash,
+        'other_party': other_party,
+        'direction': direction,
+        'contract_name': contract_info.get('name'),
+        'severity': contract_info.get('severity'),
+        'jurisdictions': list(contract_info.get('jurisdictions_blocked', ())),
+        'value_eth': value_eth
+    }
+
+
+def _malicious_party(from_addr: str, to_addr: str, malicious_map: Mapping[str, Any]) -> Optional[str]:
+    if to_addr and to_addr in malicious_map:
+        return to_addr
+    if from_addr and from_addr in malicious_map:
+        return from_addr
+    return None
+
+
+class TransactionAggregate:
+    """
+    Running totals over a wallet's transactions, folded one transaction at a time.
+
+    Used directly for a one-off analysis of a full history, and by
+    `AggregateStore` to fold only the transactions a rescreen has not seen.
+    `start_seq` continues the history numbering of a stored aggregate.
+    """
+
+    def __init__(self, wallet: str, malicious_map: Mapping[str, Mapping], start_seq: int = 0,
+                 keep_transfers: bool = False):
+        self.wallet = wallet.lower()
+        self.malicious_map = malicious_map
+        self.seq = start_seq
+        self.tx_count = 0
+        self.value_in = 0.0
+        self.value_out = 0.0
+        self.gas_paid = 0.0
+        # counterparty -> [count, seq of first interaction]; insertion order breaks count ties.
+        self.counterparties: Dict[str, List[int]] = {}
+        self.interactions: List[Interaction] = []
+        # (seq, tx_hash, direction, counterparty, value_eth) of successful txs, for persistence.
+        self.transfers: Optional[List[Tuple[int, Optional[str], str, str, float]]] = (
+            [] if keep_transfers else None
+        )
+
+    def add(self, tx: Mapping[str, Any]) -> None:
+        seq = self.seq
+        self.seq += 1
+        self.tx_count += 1
+
+        from_addr = tx.get('from', '').lower()
+        to_addr = tx.get('to', '').lower() if tx.get('to') else ''
+        try:
+            value_eth = int(tx.get('value', '0')) / 1e18
+        except (TypeError, ValueError):
+            value_eth = 0.0
+        if tx.get('isError', '0') == '1':
+            return
+
+        # Gas
+        if from_addr == self.wallet:
+            try:
+                self.gas_paid += int(tx.get('gasUsed', '0')) * int(tx.get('gasPrice', '0')) / 1e18
+            except (TypeError, ValueError):
+                pass
+
+        # Malicious Check
+        other_party = _malicious_party(from_addr, to_addr, self.malicious_map)
+        if other_party:
+            direction = 'out' if from_addr == self.wallet else 'in'
+            self.interactions.append((seq, tx.get('hash'), other_party, direction, value_eth))
+
+        # Flow
+        if to_addr == self.wallet:
+            self.value_in += value_eth
+            counterparty = from_addr
+        elif from_addr == self.wallet:
+            self.value_out += value_eth
+            counterparty = to_addr
+        else:
+            counterparty = None
+
+        if counterparty:
+            self.counterparties.setdefault(counterparty, [0, seq])[0] += 1
+
+        if self.transfers is not None:
+            if from_addr == self.wallet:
+                self.transfers.append((seq, tx.get('hash'), 'out', to_addr, value_eth))
+            else:
+                self.transfers.append((seq, tx.get('hash'), 'in', from_addr, value_eth))
+
+    def analysis(self) -> Dict[str, Any]:
+        counterparty_counts = {c: v[0] for c, v in self.counterparties.items()}
+        most_interacted = None
+        if counterparty_counts:
+            most_interacted = max(counterparty_counts.items(), key=lambda x: x[1])
+        return {
+            'total_txs': self.tx_count,
+            'value_in': self.value_in,
+            'value_out': self.value_out,
+            'gas_paid': self.gas_paid,
+            'malicious_interactions': [interaction_record(i, self.malicious_map) for i in self.interactions],
+            'counterparty_counts': counterparty_counts,
+            'most_interacted': most_interacted
+        }
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS wallets (
+    address TEXT PRIMARY KEY,
+    last_block INTEGER NOT NULL,
+    last_block_hashes TEXT NOT NULL,
+    tx_count INTEGER NOT NULL,
+    value_in REAL NOT NULL,
+    value_out REAL NOT NULL,
+    gas_paid REAL NOT NULL,
+    malicious_version TEXT,
+    malicious TEXT NOT NULL,
+    updated_at TEXT NOT NULL
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS counterparties (
+    address TEXT NOT NULL,
+    counterparty TEXT NOT NULL,
+    count INTEGER NOT NULL,
+    first_seq INTEGER NOT NULL,
+    PRIMARY KEY (address, counterparty)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS counterparties_by_count ON counterparties (address, count DESC, first_seq);
+CREATE TABLE IF NOT EXISTS transfers (
+    address TEXT NOT NULL,
+    seq INTEGER NOT NULL,
+    tx_hash TEXT,
+    direction TEXT NOT NULL,
+    counterparty TEXT NOT NULL,
+    value_eth REAL NOT NULL,
+    PRIMARY KEY (address, seq)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS transfers_by_counterparty ON transfers (address, counterparty);
+"""
+
+
+def _block(tx: Mapping[str, Any]) -> int:
+    try:
+        return int(tx.get('blockNumber', 0))
+    except (TypeError, ValueError):
+        return 0
+
+
+class AggregateStore:
+    """
+    Persistent per-address transaction aggregates (SQLite).
+
+    For every screened wallet the store keeps the totals of `_analyze_transactions`
+    (value in/out, gas, counterparty counts, malicious interactions), the last
+    block they cover and the successful transfers. A rescreen fetches from
+    `last_block(address)` onwards and `fold` adds only transactions not seen
+    before: later blocks, or unseen hashes within the last covered block.
+
+    Malicious interactions are tagged with the malicious-contract dataset
+    version. When it changes they are rebuilt from the stored transfers of the
+    counterparties now listed, not by replaying the history.
+
+    Wallets are stored under an HMAC of their address, never the address
+    itself (transfers keep a direction instead of the from/to pair). The key
+    comes from `key`, the SKILLWARE_AGGREGATES_KEY environment variable, or
+    `<db_path>.key` (created on first use). Counterparty addresses and
+    transaction hashes are stored as they are: reports return them (top
+    counterparties, malicious interactions, which name the wallet itself if
+    it is a listed contract), so the store has to reproduce them. They are public on-chain data, but they can lead back to the wallet,
+    so keep the file as private as the reports themselves.
+    """
+
+    def __init__(self, db_path: str, key: Optional[Union[str, bytes]] = None):
+        self.db_path = db_path
+        key = key or os.environ.get("SKILLWARE_AGGREGATES_KEY") or stored_key(f"{db_path}.key")
+        self._key = key.encode() if isinstance(key, str) else key
+        # Reads share the connection with `fold`, so they take the lock too and
+        # never see a transaction that has not been committed yet.
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def wallet_key(self, address: str) -> str:
+        return hmac.new(self._key, address.strip().lower().encode(), hashlib.sha256).hexdigest()[:32]
+
+    def last_block(self, address: str) -> int:
+        """The `startblock` for the next fetch: 0 for an unknown wallet."""
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT last_block FROM wallets WHERE address = ?", (self.wallet_key(address),)
+            ).fetchone()
+        return row[0] if row else 0
+
+    def fold(self, address: str, txs: Optional[Iterable[Mapping[str, Any]]], malicious_map: Mapping[str, Mapping],
+             malicious_version: str) -> Optional[Dict[str, Any]]:
+        """
+        Folds the unseen transactions of `txs` (sorted ascending, fetched from
+        `last_block`) into the stored aggregate and returns the full analysis,
+        including `updated_at` of the last successful fold.
+
+        `txs=None` stands for a failed fetch: the stored aggregate is returned
+        unchanged (None for an unknown wallet) and nothing is written.
+        """
+        wallet, wallet_key = address.lower(), self.wallet_key(address)
+        # New transactions are selected against the state read under the lock, so
+        # concurrent rescreens of one wallet never count a transaction twice.
+        with self._lock, self._conn:
+            row = self._conn.execute(
+                "SELECT last_block, last_block_hashes, tx_count, value_in, value_out, gas_paid, "
+                "malicious_version, malicious, updated_at FROM wallets WHERE address = ?", (wallet_key,)
+            ).fetchone()
+            if row:
+                (last_block, last_hashes, tx_count, value_in, value_out, gas_paid,
+                 stored_version, malicious, updated_at) = row
+                last_hashes = set(json.loads(last_hashes))
+                malicious = [tuple(i) for i in json.loads(malicious)]
+            elif txs is None:
+                return None
+            else:
+                last_block, last_hashes, tx_count, value_in, value_out, gas_paid = 0, set(), 0, 0.0, 0.0, 0.0
+                stored_version, malicious = malicious_version, []
+
+            if stored_version != malicious_version:
+                malicious = self._recompute_malicious(wallet, wallet_key, malicious_map)
+            if txs is None:
+                return self._analysis(wallet_key, tx_count, value_in, value_out, gas_paid, malicious,
+                                      malicious_map, updated_at)
+
+            delta = TransactionAggregate(wallet, malicious_map, start_seq=tx_count, keep_transfers=True)
+            for tx in txs:
+                block = _block(tx)
+                if block < last_block or (block == last_block and tx.get('hash') in last_hashes):
+                    continue
+                delta.add(tx)
+                if block > last_block:
+                    last_block, last_hashes = block, set()
+                last_hashes.add(tx.get('hash'))
+
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO transfers (address, seq, tx_hash, direction, counterparty, value_eth) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                [(wallet_key, *t) for t in delta.transfers]
+            )
+            self._conn.executemany(
+                "INSERT INTO counterparties (address, counterparty, count, first_seq) VALUES (?, ?, ?, ?) "
+                "ON CONFLICT (address, counterparty) DO UPDATE SET count = count + excluded.count",
+                [(wallet_key, c, count, first_seq) for c, (count, first_seq) in delta.counterparties.items()]
+            )
+            malicious.extend(delta.interactions)
+            value_in, value_out, gas_paid = value_in + delta.value_in, value_out + delta.value_out, gas_paid + delta.gas_paid
+            tx_count += delta.tx_count
+            updated_at = datetime.now().isoformat()
+            self._conn.execute(
+                "INSERT OR REPLACE INTO wallets (address, last_block, last_block_hashes, tx_count, value_in, "
+                "value_out, gas_paid, malicious_version, malicious, updated_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (wallet_key, last_block, json.dumps(sorted(h for h in last_hashes if h)), tx_count,
+                 value_in, value_out, gas_paid, malicious_version, json.dumps(malicious), updated_at)
+            )
+            return self._analysis(wallet_key, tx_count, value_in, value_out, gas_paid, malicious, malicious_map,
+                                  updated_at)
+
+    def _analysis(self, wallet_key: str, tx_count: int, value_in: float, value_out: float, gas_paid: float,
+                  malicious: List[Interaction], malicious_map: Mapping[str, Mapping], updated_at: str) -> Dict[str, Any]:
+        top = self._conn.execute(
+            "SELECT counterparty, count FROM counterparties WHERE address = ? "
+            "ORDER BY count DESC, first_seq LIMIT ?", (wallet_key, TOP_COUNTERPARTIES)
+        ).fetchall()
+        return {
+            'total_txs': tx_count,
+            'value_in': value_in,
+            'value_out': value_out,
+            'gas_paid': gas_paid,
+            'malicious_interactions': [interaction_record(i, malicious_map) for i in malicious],
+            # Only the top counterparties; the full counts stay in the store.
+            'counterparty_counts': dict(top),
+            'most_interacted': tuple(top[0]) if top else None,
+            'updated_at': updated_at
+        }
+
+    def _recompute_malicious(self, wallet: str, wallet_key: str,
+                             malicious_map: Mapping[str, Mapping]) -> List[Interaction]:
+        if wallet in malicious_map:
+            # A listed wallet makes every one of its transfers an interaction.
+            rows = self._conn.execute(
+                "SELECT seq, tx_hash, direction, counterparty, value_eth FROM transfers WHERE address = ? ORDER BY seq",
+                (wallet_key,)
+            ).fetchall()
+        else:
+            listed = [c for (c,) in self._conn.execute(
+                "SELECT DISTINCT counterparty FROM transfers WHERE address = ?", (wallet_key,)
+            ) if c in malicious_map]
+            rows = []
+            for i in range(0, len(listed), 500):
+                chunk = listed[i:i + 500]
+                rows += self._conn.execute(
+                    "SELECT seq, tx_hash, direction, counterparty, value_eth FROM transfers "
+                    f"WHERE address = ? AND counterparty IN ({','.join('?' * len(chunk))})", [wallet_key, *chunk]
+                ).fetchall()
+            rows.sort()
+
+        interactions: List[Interaction] = []
+        for seq, tx_hash, direction, counterparty, value_eth in rows:
+            from_addr, to_addr = (wallet, counterparty) if direction == 'out' else (counterparty, wallet)
+            other_party = _malicious_party(from_addr, to_addr, malicious_map)
+            if other_party:
+                interactions.append((seq, tx_hash, other_party, direction, value_eth))
+        return interactions
@@ -0,0 +1,62 @@
+from typing import Any, List, Optional
+
+# Etherscan V2 serves every supported EVM chain from one endpoint and API key, selected by `chainid`.
+ETHERSCAN_V2_URL = "https://api.etherscan.io/v2/api"
+COINGECKO_URL = "https://api.coingecko.com/api/v3"
+
+DEFAULT_CHAIN = "ethereum"
+
+CHAINS = {
+    "ethereum": {"chain_id": 1, "native": "ETH", "coingecko_id": "ethereum"},
+    "bsc": {"chain_id": 56, "native": "BNB", "coingecko_id": "binancecoin"},
+    "polygon": {"chain_id": 137, "native": "POL", "coingecko_id": "polygon-ecosystem-token"},
+    "arbitrum": {"chain_id": 42161, "native": "ETH", "coingecko_id": "ethereum"},
+    "base": {"chain_id": 8453, "native": "ETH", "coingecko_id": "ethereum"},
+    "optimism": {"chain_id": 10, "native": "ETH", "coingecko_id": "ethereum"},
+}
+
+# `network` values seen in the normalized datasets, lowercased, mapped to a chain key.
+NETWORK_ALIASES = {
+    "ethereum": "ethereum", "eth": "ethereum", "erc20": "ethereum",
+    "bsc": "bsc", "bnb": "bsc", "binance smart chain": "bsc", "bep20": "bsc",
+    "polygon": "polygon", "matic": "polygon",
+    "arbitrum": "arbitrum", "arbitrum one": "arbitrum",
+    "base": "base",
+    "optimism": "optimism",
+}
+# Networks whose addresses can never be an EVM address.
+NON_EVM_NETWORKS = ("bitcoin", "tron", "solana", "litecoin", "monero")
+
+# Index key for entries that are not tied to one chain (no `network`, "Unknown", exchanges such as "NOBITEX").
+ANY_NETWORK = "*"
+
+
+def network_key(network: Optional[str]) -> str:
+    """
+    Maps a dataset `network` value to a chain key ("BSC" -> "bsc"), a non-EVM
+    network name ("Bitcoin" -> "bitcoin") or ANY_NETWORK.
+    """
+    if not isinstance(network, str) or not network.strip():
+        return ANY_NETWORK
+    name = network.strip().lower()
+    if name in NETWORK_ALIASES:
+        return NETWORK_ALIASES[name]
+    return name if name in NON_EVM_NETWORKS else ANY_NETWORK
+
+
+def parse_chains(value: Any) -> List[str]:
+    """
+    Normalizes a `chains` parameter (a list, a comma-separated string or "all")
+    to chain keys; empty if not given. Raises ValueError for unknown chains.
+    """
+    if not value:
+        return []
+    if value == "all":
+        return list(CHAINS)
+    if isinstance(value, str):
+        value = value.split(",")
+    chains = list(dict.fromkeys(str(c).strip().lower() for c in value if str(c).strip()))
+    unknown = [c for c in chains if c not in CHAINS]
+    if unknown:
+        raise ValueError(f"Unsupported chain(s): {', '.join(unknown)}. Supported: {', '.join(CHAINS)}.")
+    return chains
@@ -0,0 +1,246 @@
+import math
+import re
+import unicodedata
+from bisect import bisect_left, bisect_right
+from collections import Counter
+from types import MappingProxyType
+from typing import Any, Dict, FrozenSet, Iterable, List, Mapping, Optional, Tuple
+
+# --- Normalization ---
+
+# Letters NFKD does not decompose into ASCII.
+_LATIN_SPECIAL = {
+    'ı': 'i', 'ß': 'ss', 'ø': 'o', 'æ': 'ae', 'œ': 'oe', 'ł': 'l', 'đ': 'd', 'ð': 'd', 'þ': 'th', 'ħ': 'h',
+}
+
+# Simplified phonetic transliteration of scripts found in sanctions lists.
+_HEBREW = {
+    'א': 'a', 'ב': 'b', 'ג': 'g', 'ד': 'd', 'ה': 'h', 'ו': 'u', 'ז': 'z', 'ח': 'h', 'ט': 't', 'י': 'i',
+    'כ': 'k', 'ך': 'k', 'ל': 'l', 'מ': 'm', 'ם': 'm', 'נ': 'n', 'ן': 'n', 'ס': 's', 'ע': 'a', 'פ': 'f',
+    'ף': 'f', 'צ': 'ts', 'ץ': 'ts', 'ק': 'k', 'ר': 'r', 'ש': 'sh', 'ת': 't',
+}
+_ARABIC = {
+    'ا': 'a', 'أ': 'a', 'إ': 'i', 'آ': 'a', 'ب': 'b', 'ت': 't', 'ث': 'th', 'ج': 'j', 'ح': 'h', 'خ': 'kh',
+    'د': 'd', 'ذ': 'dh', 'ر': 'r', 'ز': 'z', 'س': 's', 'ش': 'sh', 'ص': 's', 'ض': 'd', 'ط': 't', 'ظ': 'z',
+    'ع': 'a', 'غ': 'gh', 'ف': 'f', 'ق': 'q', 'ك': 'k', 'ل': 'l', 'م': 'm', 'ن': 'n', 'ه': 'h', 'ة': 'a',
+    'و': 'w', 'ي': 'y', 'ى': 'a', 'ء': '', 'ئ': 'y', 'ؤ': 'w',
+}
+_CYRILLIC = {
+    'а': 'a', 'б': 'b', 'в': 'v', 'г': 'g', 'д': 'd', 'е': 'e', 'ё': 'e', 'ж': 'zh', 'з': 'z', 'и': 'i',
+    'й': 'y', 'к': 'k', 'л': 'l', 'м': 'm', 'н': 'n', 'о': 'o', 'п': 'p', 'р': 'r', 'с': 's', 'т': 't',
+    'у': 'u', 'ф': 'f', 'х': 'kh', 'ц': 'ts', 'ч': 'ch', 'ш': 'sh', 'щ': 'shch', 'ъ': '', 'ы': 'y',
+    'ь': '', 'э': 'e', 'ю': 'yu', 'я': 'ya', 'і': 'i', 'ї': 'yi', 'є': 'ye', 'ґ': 'g',
+}
+_TRANSLITERATION = str.maketrans({**_LATIN_SPECIAL, **_HEBREW, **_ARABIC, **_CYRILLIC})
+_NON_ALNUM = re.compile(r'[^a-z0-9]+')
+
+
+def normalize_name(name: str) -> str:
+    """
+    Lowercases, transliterates Hebrew/Arabic/Cyrillic, strips diacritics and
+    punctuation: 'Mali̇k Murat Hafizoğlu' -> 'malik murat hafizoglu'.
+    """
+    text = name.lower().translate(_TRANSLITERATION)
+    text = unicodedata.normalize('NFKD', text)
+    text = ''.join(ch for ch in text if not unicodedata.combining(ch))
+    return _NON_ALNUM.sub(' ', text).strip()
+
+
+def name_ngrams(normalized: str, n: int = 3) -> FrozenSet[str]:
+    """Character n-grams of each token, padded so short tokens and word edges count."""
+    grams = set()
+    for token in normalized.split():
+        padded = f" {token} "
+        if len(padded) <= n:
+            grams.add(padded)
+        for i in range(len(padded) - n + 1):
+            grams.add(padded[i:i + n])
+    return frozenset(grams)
+
+
+def normalize_email(email: str) -> str:
+    return email.strip().lower()
+
+
+def normalize_phone(phone: str) -> str:
+    # Digits only, without the international "00" / trunk "0" prefixes.
+    return re.sub(r'\D', '', phone).lstrip('0')
+
+
+def normalize_id(number: str) -> str:
+    return re.sub(r'[^0-9A-Za-z]', '', number).upper()
+
+
+# --- Index ---
+
+_NAME_PROPS = ('name', 'alias')
+
+
+class IdentityIndex:
+    """
+    Prebuilt identity screening index over FtM `Person` / `LegalEntity` records.
+
+    - Names and aliases are normalized (see `normalize_name`) and split into
+      character trigrams. An inverted index maps each trigram to the name
+      variants containing it.
+    - Email, phone and ID/passport numbers (including linked `Passport` and
+      `Identification` entities) go into exact hash indexes.
+
+    A name query only looks at the postings of its rarest trigrams (prefix
+    filtering), since any variant reaching the Dice `threshold` must share at
+    least one of them. Candidates whose best possible score is below the
+    threshold are then dropped before exact scoring. Results equal a full scan
+    while touching only a small fraction of the index.
+    """
+
+    def __init__(self, entities: Iterable[Mapping[str, Any]]):
+        entities = list(entities)
+        linked_ids: Dict[str, List[str]] = {}
+        for entity in entities:
+            if entity.get('schema') in ('Passport', 'Identification'):
+                props = entity.get('properties', {})
+                for holder in props.get('holder', ()):
+                    linked_ids.setdefault(holder, []).extend(props.get('number', ()))
+
+        records: List[Mapping[str, Any]] = []
+        variants: List[Tuple[int, str, FrozenSet[str]]] = []  # (record, display name, grams)
+        postings: Dict[str, List[int]] = {}
+        exact: Dict[str, Dict[str, List[int]]] = {'email': {}, 'phone': {}, 'id_number': {}}
+
+        for entity in entities:
+            if entity.get('schema') not in ('Person', 'LegalEntity'):
+                continue
+            props = entity.get('properties', {})
+            record_id = len(records)
+            names = [n for prop in _NAME_PROPS for n in props.get(prop, ())]
+            records.append(MappingProxyType({
+                'entity_id': entity.get('id'),
+                'schema': entity.get('schema'),
+                'name': names[0] if names else entity.get('caption'),
+                'datasets': tuple(entity.get('datasets', ())),
+            }))
+
+            for name in dict.fromkeys(names):
+                grams = name_ngrams(normalize_name(name))
+                if not grams:
+                    continue
+                variant_id = len(variants)
+                variants.append((record_id, name, grams))
+                for gram in grams:
+                    postings.setdefault(gram, []).append(variant_id)
+
+            ids = list(props.get('idNumber', ())) + list(props.get('passportNumber', ()))
+            ids += linked_ids.get(entity.get('id'), [])
+            for field, values, normalize in (
+                ('email', props.get('email', ()), normalize_email),
+                ('phone', props.get('phone', ()), normalize_phone),
+                ('id_number', ids, normalize_id),
+            ):
+                for value in values:
+                    key = normalize(value)
+                    if key and record_id not in exact[field].setdefault(key, []):
+                        exact[field][key].append(record_id)
+
+        self.records = tuple(records)
+        self.variants = tuple(variants)
+        self.variant_sizes = tuple(len(grams) for _, _, grams in variants)
+        # Postings are sorted by name size so a query can bisect to the size range
+        # that can still reach its threshold; `posting_sizes` holds the sort keys.
+        sorted_postings = {
+            g: tuple(sorted(ids, key=self.variant_sizes.__getitem__)) for g, ids in postings.items()
+        }
+        self.postings = MappingProxyType(sorted_postings)
+        self.posting_sizes = MappingProxyType({
+            g: tuple(self.variant_sizes[i] for i in ids) for g, ids in sorted_postings.items()
+        })
+        self.exact = MappingProxyType({
+            field: MappingProxyType({k: tuple(v) for k, v in index.items()}) for field, index in exact.items()
+        })
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def search(self, name: Optional[str] = None, email: Optional[str] = None, phone: Optional[str] = None,
+               id_number: Optional[str] = None, threshold: float = 0.5, limit: int = 10) -> Dict[str, Any]:
+        """
+        Returns {"matches": [...], "candidates_considered": n}. Matches are ranked
+        by score: 1.0 for exact email/phone/ID hits, otherwise the trigram Dice
+        similarity of the best matching name variant.
+        """
+        scores: Dict[int, float] = {}
+        matched_on: Dict[int, Dict[str, float]] = {}
+        matched_names: Dict[int, str] = {}
+        considered = 0
+
+        for field, value, normalize in (
+            ('email', email, normalize_email),
+            ('phone', phone, normalize_phone),
+            ('id_number', id_number, normalize_id),
+        ):
+            key = normalize(value) if value else ''
+            for record_id in self.exact[field].get(key, ()) if key else ():
+                scores[record_id] = 1.0
+                matched_on.setdefault(record_id, {})[field] = 1.0
+
+        if name:
+            name_hits, considered = self._search_name(name, threshold)
+            for record_id, (score, variant) in name_hits.items():
+                scores[record_id] = max(scores.get(record_id, 0.0), score)
+                matched_on.setdefault(record_id, {})['name'] = round(score, 4)
+                matched_names[record_id] = variant
+
+        ranked = sorted(scores.items(), key=lambda x: (-x[1], x[0]))[:limit]
+        matches = []
+        for record_id, score in ranked:
+            record = self.records[record_id]
+            match = {
+                'entity_id': record['entity_id'],
+                'schema': record['schema'],
+                'name': record['name'],
+                'datasets': list(record['datasets']),
+                'score': round(score, 4),
+                # Per-field scores, e.g. {"name": 0.91, "email": 1.0}
+                'matched_on': matched_on[record_id],
+            }
+            if record_id in matched_names:
+                match['matched_name'] = matched_names[record_id]
+            matches.append(match)
+        return {'matches': matches, 'candidates_considered': considered}
+
+    def _search_name(self, name: str, threshold: float) -> Tuple[Dict[int, Tuple[float, str]], int]:
+        query = name_ngrams(normalize_name(name))
+        if not query:
+            return {}, 0
+        threshold = min(max(threshold, 0.01), 1.0)
+
+        # Dice = 2c / (|q| + |d|) >= t with c <= |d| implies c >= t|q| / (2 - t).
+        # A variant sharing fewer than that many grams cannot qualify, so it must
+        # contain one of the (|q| - min_common + 1) rarest query grams.
+        min_common = max(1, math.ceil(threshold * len(query) / (2 - threshold) - 1e-9))
+        by_rarity = sorted(query, key=lambda g: len(self.postings.get(g, ())))
+        prefix_len = len(query) - min_common + 1
+        # Dice >= t also bounds the variant size: t|q|/(2-t) <= |d| <= (2-t)|q|/t.
+        min_size = threshold * len(query) / (2 - threshold)
+        max_size = (2 - threshold) * len(query) / threshold
+        prefix_hits: Counter = Counter()
+        for gram in by_rarity[:prefix_len]:
+            ids = self.postings.get(gram, ())
+            if ids:
+                gram_sizes = self.posting_sizes[gram]
+                lo = bisect_left(gram_sizes, min_size - 1e-9)
+                hi = bisect_right(gram_sizes, max_size + 1e-9)
+                prefix_hits.update(ids[lo:hi])
+
+        # Upper bound on shared grams: prefix hits plus every gram outside the prefix.
+        rest = len(query) - prefix_len
+        sizes = self.variant_sizes
+        best: Dict[int, Tuple[float, str]] = {}
+        for variant_id, hits in prefix_hits.items():
+            total = len(query) + sizes[variant_id]
+            if 2 * (hits + rest) < threshold * total:
+                continue
+            record_id, display, grams = self.variants[variant_id]
+            score = 2 * len(query & grams) / total
+            if score >= threshold and score > best.get(record_id, (0.0, ''))[0]:
+                best[record_id] = (score, display)
+        return best, len(prefix_hits)
@@ -1,7 +1,9 @@
 import os
+import sys
 import csv
 import json
 import shutil
+import subprocess
 from datetime import datetime
 
 # Paths relative to this script (skillware/skills/finance/wallet_screening/maintenance/)
@@ -11,6 +13,9 @@ PAST_NORM_DIR = os.path.join(BASE_DIR, 'past_norm')
 # Data goes up one level to the skill's data folder
 DATASETS_DIR = os.path.abspath(os.path.join(BASE_DIR, '..', 'data'))
 LOGS_DIR = os.path.join(BASE_DIR, 'norm_logs')
+REPO_ROOT = os.path.abspath(os.path.join(BASE_DIR, '..', '..', '..', '..'))
+# Optional: watch list database to delta-rescreen after new datasets land
+MONITOR_DB = os.environ.get('SKILLWARE_MONITOR_DB')
 
 os.makedirs(NEW_NORM_DIR, exist_ok=True)
 os.makedirs(PAST_NORM_DIR, exist_ok=True)
@@ -68,6 +73,12 @@ def normalize_file(filepath):
         # Try to guess structure or skip
         return [], None
 
+def sync_monitor(db_path):
+    """Runs `skillware monitor sync` so watched addresses are alerted on the new data. Returns its exit code."""
+    cmd = [sys.executable, '-m', 'skillware', 'monitor', '--db', os.path.abspath(db_path),
+           'sync', '--skill', os.path.dirname(BASE_DIR)]
+    return subprocess.run(cmd, cwd=REPO_ROOT).returncode
+
 def main():
     print(f"Scanning for new files in: {NEW_NORM_DIR}")
     log_entries = []
@@ -103,5 +114,9 @@ def main():
             logf.write(entry + '\n')
     print(f"Normalization complete. Log saved to {logpath}")
 
+    if MONITOR_DB and any(entry.startswith('Normalized') for entry in log_entries):
+        return sync_monitor(MONITOR_DB)
+    return 0
+
 if __name__ == '__main__':
-    main()
+    sys.exit(main())
@@ -1,17 +1,192 @@
+import copy
 import json
 import os
-import requests
 import glob
-from typing import Any, Dict, List, Optional
+import hashlib
+import threading
+import time
+from functools import partial
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional, Tuple
 from datetime import datetime
 from skillware.core.base_skill import BaseSkill
+from skillware.core.audit import AuditLog, identity_subject
+from skillware.core.cache import TTLCache
+from skillware.core.ratelimit import RateLimiter
+from .aggregates import AggregateStore, TransactionAggregate
+from .chains import ANY_NETWORK, CHAINS, COINGECKO_URL, DEFAULT_CHAIN, ETHERSCAN_V2_URL, network_key, parse_chains
+from .identity_index import IdentityIndex
+
+MALICIOUS_CONTRACTS_FILE = 'malicious_scs_2025.json'
+SANCTIONS_ENTITIES_FILE = 'entities.ftm.json'
+
+# Identity screening (name/email/phone/ID) instead of an address.
+IDENTITY_FIELDS = ('name', 'email', 'phone', 'id_number')
+# Name similarity at or above this (or any exact email/phone/ID hit) raises the risk flag.
+STRONG_MATCH_SCORE = 0.85
+
+# Zero-width characters that some published lists leave around addresses.
+_INVISIBLE = '\u200b\u200c\u200d\ufeff'
+
+# Total time budget (seconds) of an address screening unless the caller passes `time_budget`.
+DEFAULT_TIME_BUDGET = 30.0
+# Time kept free after the network stages for analysis, the aggregate fold and the
+# report: the measured cost of that work (see `_finish_s`), at most half the budget.
+INITIAL_FINISH_ESTIMATE = 0.05
+# Threads running network stages, shared by every call of one instance.
+STAGE_WORKERS = 256
+
+# Addresses per Etherscan `balancemulti` call.
+BALANCEMULTI_LIMIT = 20
+
+
+def _freeze(value: Any) -> Any:
+    """Recursively converts dicts/lists into read-only mappings/tuples."""
+    if isinstance(value, dict):
+        return MappingProxyType({k: _freeze(v) for k, v in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+class DatasetSnapshot:
+    """
+    An immutable, pre-indexed view of the screening datasets.
+
+    Entries are frozen on load and never mutated afterwards, so a single
+    snapshot can be shared by any number of concurrent `execute` calls.
+    Lookups go through address indexes built once at load time instead of
+    scanning every entry per screening.
+    """
+
+    __slots__ = (
+        'version', 'malicious_contracts', 'sanctions_entities', 'additional_datasets',
+        'malicious_version', 'malicious_index', 'malicious_indexes', 'sanctions_index', 'additional_index', 'network_indexes',
+        '_identity_index', '_identity_lock'
+    )
+
+    def __init__(self, malicious_contracts: List[Dict], sanctions_entities: List[Dict],
+                 additional_datasets: List[Tuple[str, Dict]], version: str = ''):
+        self.version = version
+        self.malicious_contracts = tuple(_freeze(c) for c in malicious_contracts)
+        self.sanctions_entities = tuple(_freeze(e) for e in sanctions_entities)
+        # (source_file, entry) pairs; the source is kept beside the entry, not inside it.
+        self.additional_datasets = tuple((src, _freeze(e)) for src, e in additional_datasets)
+
+        self.malicious_index = MappingProxyType(
+            {c['address'].lower(): c for c in self.malicious_contracts if c.get('address')}
+        )
+        # The malicious-contract list names Ethereum contracts: the same address on
+        # another chain is a different contract. Entries without a `network`
+        # field therefore count for DEFAULT_CHAIN only.
+        malicious_by_network: Dict[str, Dict[str, Mapping]] = {}
+        for addr, contract in self.malicious_index.items():
+            network = network_key(contract.get('network')) if contract.get('network') else DEFAULT_CHAIN
+            malicious_by_network.setdefault(network, {})[addr] = contract
+        self.malicious_indexes = MappingProxyType(
+            {network: MappingProxyType(index) for network, index in malicious_by_network.items()}
+        )
+        # Stored per-address aggregates only rebuild malicious interactions when this changes.
+        self.malicious_version = hashlib.sha256(
+            "\n".join(sorted(self.malicious_index)).encode()
+        ).hexdigest()[:16]
+        self.sanctions_index = self._build_index(
+            ((SANCTIONS_ENTITIES_FILE, e) for e in self.sanctions_entities), core=True
+        )
+        self.additional_index = self._build_index(self.additional_datasets)
+        # The same listings split by their `network` field (see chains.network_key).
+        self.network_indexes = self._build_network_indexes(self.sanctions_index, self.additional_index)
+        # Built on first identity query (or warm_up); wallet-only workers never pay for it.
+        self._identity_index: Optional[IdentityIndex] = None
+        self._identity_lock = threading.Lock()
+
+    @property
+    def identity_index(self) -> IdentityIndex:
+        if self._identity_index is None:
+            with self._identity_lock:
+                if self._identity_index is None:
+                    self._identity_index = IdentityIndex(self.sanctions_entities)
+        return self._identity_index
+
+    def flagged_addresses(self) -> Dict[str, Tuple[str, ...]]:
+        """
+        Every address that is listed directly (sanctions entry or known malicious
+        contract), mapped to the sorted source files that list it.
+        """
+        flagged: Dict[str, set] = {}
+        for index in (self.sanctions_index, self.additional_index):
+            for addr, pairs in index.items():
+                flagged.setdefault(addr, set()).update(src for src, _ in pairs)
+        for addr in self.malicious_index:
+            flagged.setdefault(addr, set()).add(MALICIOUS_CONTRACTS_FILE)
+        return {addr: tuple(sorted(sources)) for addr, sources in flagged.items()}
+
+    @staticmethod
+    def _entry_addresses(entry: Mapping, core: bool = False) -> List[str]:
+        # Mirrors the precedence of the original linear scans. Core FtM entities:
+        # the `addresses` list, then `properties.address`. Additional datasets:
+        # `address`, then `properties.address`, then the `addresses` list.
+        if core and 'addresses' in entry:
+            candidates = list(entry['addresses'])
+        elif not core and 'address' in entry:
+            candidates = [entry['address']]
+        elif 'properties' in entry and 'address' in entry['properties']:
+            candidates = [entry['properties']['address']]
+        elif not core and 'addresses' in entry and isinstance(entry['addresses'], tuple):
+            candidates = list(entry['addresses'])
+        else:
+            return []
+        return [a.strip().strip(_INVISIBLE).lower() for a in candidates if isinstance(a, str) and a]
+
+    @classmethod
+    def _build_index(cls, pairs, core: bool = False) -> Mapping[str, Tuple[Tuple[str, Mapping], ...]]:
+        index: Dict[str, List[Tuple[str, Mapping]]] = {}
+        for source_file, entry in pairs:
+            if not isinstance(entry, Mapping):
+                continue
+            # dict.fromkeys de-duplicates while preserving order.
+            for addr in dict.fromkeys(cls._entry_addresses(entry, core)):
+                index.setdefault(addr, []).append((source_file, entry))
+        return MappingProxyType({k: tuple(v) for k, v in index.items()})
+
+    @staticmethod
+    def _build_network_indexes(*indexes) -> Mapping[str, Mapping[str, Tuple[Tuple[str, Mapping], ...]]]:
+        by_network: Dict[str, Dict[str, List[Tuple[str, Mapping]]]] = {}
+        for index in indexes:
+            for addr, pairs in index.items():
+                for source_file, entry in pairs:
+                    network = network_key(entry.get('network'))
+                    by_network.setdefault(network, {}).setdefault(addr, []).append((source_file, entry))
+        return MappingProxyType({
+            network: MappingProxyType({k: tuple(v) for k, v in index.items()})
+            for network, index in by_network.items()
+        })
+
+    def chain_malicious(self, chain: str) -> Mapping[str, Mapping]:
+        """Known malicious contracts on `chain`: those listed for it plus chain-agnostic ones."""
+        listed, anywhere = self.malicious_indexes.get(chain), self.malicious_indexes.get(ANY_NETWORK)
+        if not anywhere:
+            return listed or MappingProxyType({})
+        return MappingProxyType({**anywhere, **(listed or {})})
+
+    def chain_listings(self, address: str, chain: str) -> Tuple[Tuple[str, Mapping], ...]:
+        """Listings that apply to `address` on `chain`: those for that chain plus chain-agnostic ones."""
+        address = address.lower()
+        return (self.network_indexes.get(chain, {}).get(address, ())
+                + self.network_indexes.get(ANY_NETWORK, {}).get(address, ()))
+
 
 class WalletScreeningSkill(BaseSkill):
     """
     A specific implementation of a compliance skill that screens Ethereum wallets
     against sanctions lists and malicious contract databases.
+
+    The skill is thread-safe: datasets live in an immutable `DatasetSnapshot`,
+    so one instance can serve concurrent `execute` calls (see `execute_many`).
     """
 
+    thread_safe = True
+
     def __init__(self, config: Optional[Dict[str, Any]] = None):
         super().__init__(config)
         self.etherscan_api_key = os.environ.get("ETHERSCAN_API_KEY")
@@ -20,21 +195,186 @@ class WalletScreeningSkill(BaseSkill):
 
         # Config
         self.data_dir = os.path.join(os.path.dirname(__file__), 'data')
-        self.coingecko_url_eur = "https://api.coingecko.com/api/v3/simple/price?ids=ethereum&vs_currencies=eur"
-        self.coingecko_url_usd = "https://api.coingecko.com/api/v3/simple/price?ids=ethereum&vs_currencies=usd"
-
-        # Load Core Datasets
-        self.malicious_contracts = self._load_json_file('malicious_scs_2025.json') or []
-        self.sanctions_entities = self._load_json_lines('entities.ftm.json') or []
-        
-        # Load Additional Datasets dynamically (normalized files, etc.)
-        self.additional_datasets = self._load_additional_datasets()
+        self.explorer_url = self.config.get("ETHERSCAN_API_URL", ETHERSCAN_V2_URL)
+        self.coingecko_url = self.config.get("COINGECKO_API_URL", COINGECKO_URL)
+
+        # Explorer endpoint per chain: (url, api key, rate limiter). Etherscan V2 limits
+        # requests per API key across all chains, so chains sharing an endpoint and key
+        # share one bucket (EXPLORER_RATE_LIMIT requests/s; 0 disables it). A chain gets
+        # its own bucket only with its own url or api_key in CHAIN_EXPLORERS.
+        overrides = self.config.get("CHAIN_EXPLORERS", {})
+        unknown = [c for c in overrides if c not in CHAINS]
+        if unknown:
+            raise ValueError(f"CHAIN_EXPLORERS: unsupported chain(s): {', '.join(unknown)}.")
+        default_rate = float(self.config.get("EXPLORER_RATE_LIMIT", 5))
+        limiters: Dict[Tuple[str, Optional[str]], Optional[RateLimiter]] = {}
+        self._explorers: Dict[str, Tuple[str, Optional[str], Optional[RateLimiter]]] = {}
+        for chain in CHAINS:
+            override = overrides.get(chain, {})
+            own_endpoint = bool(override.get("url") or override.get("api_key"))
+            if "rate_limit" in override and not own_endpoint:
+                raise ValueError(
+                    f"CHAIN_EXPLORERS['{chain}']: a rate_limit needs the chain's own url or api_key; "
+                    f"chains sharing the default endpoint share EXPLORER_RATE_LIMIT."
+                )
+            endpoint = (override.get("url") or self.explorer_url, override.get("api_key") or self.etherscan_api_key)
+            if endpoint not in limiters:
+                rate = float(override.get("rate_limit", default_rate))
+                limiters[endpoint] = RateLimiter(rate) if rate > 0 else None
+            self._explorers[chain] = (*endpoint, limiters[endpoint])
+
+        # Datasets are loaded lazily on the first `execute` (or via `warm_up`),
+        # so processes that only need tool schemas never pay the parsing cost.
+        self._datasets_lock = threading.Lock()
+        self._snapshot: Optional[DatasetSnapshot] = None
+
+        # In-flight upstream requests by (cache, key): concurrent stages needing
+        # the same value wait on one request (see `_shared_fetch`).
+        self._shared: Dict[Tuple[int, Any], Any] = {}
+        self._shared_lock = threading.RLock()
+        # Bounded executor for network stages, created on first use (see `_spawn`).
+        self._stage_workers = int(self.config.get("STAGE_WORKERS", STAGE_WORKERS))
+        self._stage_pool = None
+        # Recent peak of the post-fetch work of a screening (seconds), reserved from the budget.
+        self._finish_s = INITIAL_FINISH_ESTIMATE
+
+        # Per-process caches. Behind the consistent-hash router
+        # (skillware.core.sharding) each node sees a stable slice of addresses.
+        cache_size = int(self.config.get("CACHE_SIZE", 10000))
+        self.price_cache = TTLCache(maxsize=64, ttl=float(self.config.get("PRICE_CACHE_TTL", 60)))
+        self.tx_cache = TTLCache(cache_size, ttl=float(self.config.get("TX_CACHE_TTL", 300)))
+        self.balance_cache = TTLCache(cache_size, ttl=float(self.config.get("BALANCE_CACHE_TTL", 60)))
+        self.report_cache = TTLCache(cache_size, ttl=float(self.config.get("REPORT_CACHE_TTL", 60)))
+
+        # Optional persistent per-address aggregates: rescreens only fold in new transactions.
+        aggregates_db = self.config.get("AGGREGATES_DB") or os.environ.get("SKILLWARE_AGGREGATES_DB")
+        self.aggregates: Optional[AggregateStore] = AggregateStore(aggregates_db) if aggregates_db else None
+
+        # Optional local audit log of every verdict (addresses and identities are stored hashed).
+        audit_dir = self.config.get("AUDIT_DIR") or os.environ.get("SKILLWARE_AUDIT_DIR")
+        self.audit: Optional[AuditLog] = AuditLog(audit_dir) if audit_dir else None
 
     @property
     def manifest(self) -> Dict[str, Any]:
         return {}
 
+    @property
+    def snapshot(self) -> DatasetSnapshot:
+        return self._ensure_datasets()
+
+    @property
+    def malicious_contracts(self) -> Tuple[Mapping, ...]:
+        return self.snapshot.malicious_contracts
+
+    @property
+    def sanctions_entities(self) -> Tuple[Mapping, ...]:
+        return self.snapshot.sanctions_entities
+
+    @property
+    def additional_datasets(self) -> Tuple[Tuple[str, Mapping], ...]:
+        return self.snapshot.additional_datasets
+
+    def warm_up(self) -> None:
+        """
+        Loads the bundled datasets, the identity index and the HTTP client ahead
+        of the first call.
+        """
+        self._ensure_datasets().identity_index
+        import requests  # noqa: F401
+
+    def dataset_version(self) -> str:
+        """
+        Content fingerprint of the files in `data_dir`. Cheap to compute (no
+        parsing), so callers can detect dataset updates before reloading.
+        """
+        digest = hashlib.sha256()
+        for path in sorted(glob.glob(os.path.join(self.data_dir, '*.json'))):
+            digest.update(os.path.basename(path).encode('utf-8') + b'\0')
+            with open(path, 'rb') as f:
+                for chunk in iter(lambda: f.read(1 << 20), b''):
+                    digest.update(chunk)
+        return digest.hexdigest()[:16]
+
+    def reload_datasets(self) -> DatasetSnapshot:
+        """
+        Loads the datasets from disk again and swaps the new snapshot in atomically.
+        Calls already running keep the snapshot they started with.
+        """
+        snapshot = self._load_snapshot()
+        with self._datasets_lock:
+            self._snapshot = snapshot
+        return snapshot
+
+    def flagged_addresses(self) -> Dict[str, Tuple[str, ...]]:
+        """Directly listed addresses of the current snapshot (see `DatasetSnapshot.flagged_addresses`)."""
+        return self.snapshot.flagged_addresses()
+
+    def prefetch(self, params_list: List[Dict[str, Any]]) -> None:
+        """
+        Starts the balance lookups of calls about to run together as Etherscan
+        `balancemulti` requests (per chain, up to 20 addresses each). The balance
+        stages of those calls wait on them (see `_shared_fetch`) instead of
+        fetching one address at a time; an address missing from a failed
+        `balancemulti` falls back to a single lookup. Returns immediately.
+        """
+        if len(params_list) < 2 or not self.etherscan_api_key:
+            return
+        from concurrent.futures import Future
+
+        budgets, wanted = [], {}
+        for params in params_list:
+            address = params.get('address')
+            if not self._validate_eth_address(address):
+                continue
+            try:
+                chains = parse_chains(params.get('chains')) or [DEFAULT_CHAIN]
+                budgets.append(float(params.get('time_budget') or self.config.get("TIME_BUDGET", DEFAULT_TIME_BUDGET)))
+            except (TypeError, ValueError):
+                continue
+            for chain in chains:
+                if self.balance_cache.get((chain, address.lower())) is None:
+                    wanted.setdefault(chain, {})[address.lower()] = None
+        timeout = min((b for b in budgets if b > 0), default=DEFAULT_TIME_BUDGET)
+
+        for chain, addresses in wanted.items():
+            futures = {}
+            with self._shared_lock:
+                for address in addresses:
+                    key = (id(self.balance_cache), (chain, address))
+                    if key not in self._shared:
+                        futures[address] = Future()
+                        self._share(self.balance_cache, (chain, address), futures[address])
+            # A single balance is no cheaper in bulk.
+            if len(futures) < 2:
+                for address, future in futures.items():
+                    self._spawn(self._fetch_eth_balance, address, timeout, chain).add_done_callback(
+                        partial(self._forward_result, future))
+                continue
+            chunk_list = list(futures)
+            for i in range(0, len(chunk_list), BALANCEMULTI_LIMIT):
+                chunk = {a: futures[a] for a in chunk_list[i:i + BALANCEMULTI_LIMIT]}
+                self._spawn(self._fetch_balances, list(chunk), timeout, chain).add_done_callback(
+                    partial(self._resolve_balances, chain, chunk, time.monotonic() + timeout))
+
+    def _resolve_balances(self, chain: str, futures: Dict[str, Any], deadline: float, multi) -> None:
+        balances = (multi.result() if multi.exception() is None else None) or {}
+        for address, future in futures.items():
+            if balances.get(address) is not None:
+                future.set_result(balances[address])
+            else:
+                remaining = max(0.05, deadline - time.monotonic())
+                self._spawn(self._fetch_eth_balance, address, remaining, chain).add_done_callback(
+                    partial(self._forward_result, future))
+
+    @staticmethod
+    def _forward_result(target, source) -> None:
+        target.set_result(source.result() if source.exception() is None else None)
+
     def execute(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        if not params.get('address') and any(params.get(f) for f in IDENTITY_FIELDS):
+            return self._screen_identity(params)
+
+        started = time.monotonic()
         address = params.get('address')
         if not address or not self._validate_eth_address(address):
             return {"error": "Invalid Ethereum address provided."}
@@ -42,32 +382,249 @@ class WalletScreeningSkill(BaseSkill):
         if not self.etherscan_api_key:
             return {"error": "Missing ETHERSCAN_API_KEY environment variable."}
 
-        # 1. Fetch Data
-        txs = self._get_eth_transactions(address)
-        eth_balance = self._get_eth_balance(address)
-        eth_usd = self._get_price(self.coingecko_url_usd, "usd")
-        eth_eur = self._get_price(self.coingecko_url_eur, "eur")
+        try:
+            budget = float(params.get('time_budget') or self.config.get("TIME_BUDGET", DEFAULT_TIME_BUDGET))
+        except (TypeError, ValueError):
+            budget = 0.0
+        if budget <= 0:
+            return {"error": "'time_budget' must be a positive number of seconds."}
+        deadline = started + budget
 
-        # 2. Sanctions Check (Core + Additional)
-        sanctions_hits = self._check_against_sanctions(address)
-        sanctions_hits.extend(self._check_against_additional_sanctions(address))
-        
-        # 3. Analyze Transactions
-        analysis = self._analyze_transactions(txs, address)
-
-        # 4. Construct Rich Report
-        return self._generate_report_data(
-            address=address,
-            analysis=analysis,
-            sanctions_hits=sanctions_hits,
-            eth_balance=eth_balance,
-            eth_usd=eth_usd,
-            eth_eur=eth_eur,
-            txs_count=len(txs)
+        try:
+            chains = parse_chains(params.get('chains'))
+        except ValueError as e:
+            return {"error": str(e)}
+
+        # Pin one snapshot for the whole call.
+        snapshot = self._ensure_datasets()
+        report_key = (address.lower(), snapshot.version, tuple(chains) if chains else None)
+        cached = self.report_cache.get(report_key)
+        if cached is not None:
+            report = copy.deepcopy(cached)
+            if self.audit:
+                self.audit.record(report)
+            return report
+
+        # All network stages (of every chain) run concurrently within the budget.
+        # A stage that fails or misses the deadline falls back to its last cached
+        # value (marked stale) or is reported as unavailable (None), never as zero.
+        reserve = min(budget / 2, self._finish_s)
+        reports = self._screen_chains(address, chains or [DEFAULT_CHAIN], snapshot, deadline - reserve, deadline,
+                                      per_network=bool(chains))
+        if chains:
+            report = self._merge_chain_reports(address, reports, snapshot)
+        else:
+            report = reports[DEFAULT_CHAIN]
+        report["metadata"]["time_budget_s"] = budget
+        report["metadata"]["elapsed_ms"] = round((time.monotonic() - started) * 1000, 1)
+        # Only reports built entirely from fresh data are cached.
+        if not report["summary"]["partial"]:
+            self.report_cache.set(report_key, copy.deepcopy(report))
+        if self.audit:
+            self.audit.record(report)
+        return report
+
+    def _screen_chains(self, address: str, chains: List[str], snapshot: DatasetSnapshot, fetch_deadline: float,
+                       deadline: float, per_network: bool) -> Dict[str, Dict[str, Any]]:
+        """
+        Fetches (until `fetch_deadline`) and analyzes `address` on every chain
+        concurrently; returns one report per chain. With `per_network`, each
+        chain only reports the listings for that chain (plus chain-agnostic
+        ones); otherwise all listings of the address apply.
+        """
+        wallet = address.lower()
+        stages: Dict[Any, Tuple[TTLCache, Any, Any, float]] = {}
+        startblocks = {}
+        for chain in chains:
+            # The aggregate store covers the default chain only.
+            startblocks[chain] = self.aggregates.last_block(address) if self.aggregates and chain == DEFAULT_CHAIN else 0
+            stages[(chain, "transactions")] = (
+                self.tx_cache, (chain, wallet, startblocks[chain]),
+                partial(self._fetch_eth_transactions, address, startblocks[chain], chain=chain), 15
+            )
+            stages[(chain, "balance")] = (
+                self.balance_cache, (chain, wallet), partial(self._fetch_eth_balance, address, chain=chain), 10
+            )
+        for coin in dict.fromkeys(CHAINS[c]["coingecko_id"] for c in chains):
+            for currency in ("usd", "eur"):
+                stages[(coin, currency)] = (
+                    self.price_cache, (coin, currency), partial(self._fetch_price, coin, currency), 10
+                )
+        fetched = self._run_stages(stages, fetch_deadline)
+
+        finish_started = time.monotonic()
+        reports = {}
+        for chain in chains:
+            coin = CHAINS[chain]["coingecko_id"]
+            txs, tx_status = fetched[(chain, "transactions")]
+            balance, balance_status = fetched[(chain, "balance")]
+            data_status = {
+                "transactions": tx_status,
+                "balance": balance_status,
+                "price_usd": fetched[(coin, "usd")][1],
+                "price_eur": fetched[(coin, "eur")][1],
+            }
+
+            # Sanctions Check: local, always part of the verdict.
+            if per_network:
+                sanctions_hits = [self._make_hit(src, e) for src, e in snapshot.chain_listings(address, chain)]
+            else:
+                sanctions_hits = self._check_against_sanctions(address, snapshot)
+                sanctions_hits.extend(self._check_against_additional_sanctions(address, snapshot))
+
+            # Analyze Transactions. Per chain, only the contracts known on that chain count.
+            malicious = snapshot.chain_malicious(chain) if per_network else snapshot.malicious_index
+            if self.aggregates and chain == DEFAULT_CHAIN:
+                if txs is not None and time.monotonic() >= deadline:
+                    # No time left to fold: the fetched transactions stay cached for the next rescreen.
+                    txs, tx_status = None, {"status": "unavailable", "reason": "deadline"}
+                    data_status["transactions"] = tx_status
+                # Without a fresh fetch the stored aggregate is reported as stale.
+                # A chain's list that differs from the full one is versioned apart, so switching
+                # between single- and multi-chain screenings rebuilds the stored interactions.
+                version = snapshot.malicious_version
+                if len(malicious) != len(snapshot.malicious_index):
+                    version = f"{version}:{chain}"
+                analysis = self.aggregates.fold(address, txs, malicious, version)
+                if txs is None and analysis is not None:
+                    age = (datetime.now() - datetime.fromisoformat(analysis['updated_at'])).total_seconds()
+                    data_status["transactions"] = {"status": "stale", "age_s": round(age, 1), "reason": tx_status["reason"]}
+            else:
+                analysis = self._analyze_transactions(txs, address, snapshot, malicious) if txs is not None else None
+
+            reports[chain] = self._generate_report_data(
+                address=address,
+                analysis=analysis,
+                sanctions_hits=sanctions_hits,
+                eth_balance=balance,
+                eth_usd=fetched[(coin, "usd")][0],
+                eth_eur=fetched[(coin, "eur")][0],
+                txs_count=analysis['total_txs'] if analysis else None,
+                snapshot=snapshot,
+                data_status=data_status
+            )
+        # A decaying peak: one slow fold raises the reserve at once, and it relaxes over later calls.
+        self._finish_s = max(time.monotonic() - finish_started, self._finish_s * 0.9, INITIAL_FINISH_ESTIMATE)
+        return reports
+
+    def _merge_chain_reports(self, address: str, reports: Dict[str, Dict[str, Any]],
+                             snapshot: DatasetSnapshot) -> Dict[str, Any]:
+        def total(key):
+            values = [r["summary"][key] for r in reports.values() if r["summary"][key] is not None]
+            return sum(values) if values else None
+
+        sanctions_hits = self._check_against_sanctions(address, snapshot)
+        sanctions_hits.extend(self._check_against_additional_sanctions(address, snapshot))
+        return {
+            "metadata": {
+                "screening_time": datetime.now().isoformat(),
+                "wallet_address": address,
+                "data_sources_count": len(snapshot.additional_datasets) + 2,
+                "chains": list(reports),
+                "data_status": {chain: r["metadata"]["data_status"] for chain, r in reports.items()}
+            },
+            "summary": {
+                "risk_flag": bool(sanctions_hits) or any(r["summary"]["risk_flag"] for r in reports.values()),
+                "sanctioned_entity_match": bool(sanctions_hits),
+                "sanctioned_on_chains": [c for c, r in reports.items() if r["summary"]["sanctioned_entity_match"]],
+                "malicious_interaction_count": total("malicious_interaction_count"),
+                "balance_usd": total("balance_usd"),
+                "total_transactions": total("total_transactions"),
+                "active_chains": [c for c, r in reports.items() if r["summary"]["total_transactions"]],
+                "partial": any(r["summary"]["partial"] for r in reports.values())
+            },
+            "risk_details": {
+                # Every listing of the address, whatever its network.
+                "sanctions_hits": self._summarize_sanctions(sanctions_hits),
+                "malicious_interactions": [
+                    dict(i, chain=chain) for chain, r in reports.items()
+                    for i in r["risk_details"]["malicious_interactions"] or ()
+                ]
+            },
+            # Per-chain reports; `*_eth` amounts are in the chain's `native` asset.
+            "chains": {
+                chain: {"native": CHAINS[chain]["native"], **{k: v for k, v in r.items() if k != "metadata"}}
+                for chain, r in reports.items()
+            }
+        }
+
+    def cache_stats(self) -> Dict[str, Dict[str, Any]]:
+        return {
+            "price": self.price_cache.stats(),
+            "transactions": self.tx_cache.stats(),
+            "balance": self.balance_cache.stats(),
+            "report": self.report_cache.stats(),
+        }
+
+    def _screen_identity(self, params: Dict[str, Any]) -> Dict[str, Any]:
+        try:
+            threshold = float(params.get('threshold', 0.5))
+            limit = int(params.get('limit', 10))
+        except (TypeError, ValueError):
+            return {"error": "'threshold' and 'limit' must be numbers."}
+        if limit < 1:
+            return {"error": "'limit' must be at least 1."}
+
+        index = self._ensure_datasets().identity_index
+        started = time.perf_counter()
+        result = index.search(
+            name=params.get('name'),
+            email=params.get('email'),
+            phone=params.get('phone'),
+            id_number=params.get('id_number'),
+            threshold=threshold,
+            limit=limit
         )
+        search_ms = (time.perf_counter() - started) * 1000
+
+        matches = result['matches']
+        strong = [m for m in matches if m['score'] >= STRONG_MATCH_SCORE]
+        report = {
+            "metadata": {
+                "screening_time": datetime.now().isoformat(),
+                "mode": "identity",
+                # Field names only: the queried personal data is not echoed back.
+                "queried_fields": [f for f in IDENTITY_FIELDS if params.get(f)],
+                "indexed_records": len(index),
+                "candidates_considered": result['candidates_considered'],
+                "search_ms": round(search_ms, 3)
+            },
+            "summary": {
+                "risk_flag": bool(strong),
+                "sanctioned_entity_match": bool(strong),
+                "match_count": len(matches),
+                "best_score": matches[0]['score'] if matches else 0.0
+            },
+            "risk_details": {
+                "identity_matches": matches
+            }
+        }
+        if self.audit:
+            field = next(f for f in IDENTITY_FIELDS if params.get(f))
+            self.audit.record(report, subject=identity_subject(field, params[field]))
+        return report
 
     # --- Loader Helpers ---
 
+    def _ensure_datasets(self) -> DatasetSnapshot:
+        snapshot = self._snapshot
+        if snapshot is not None:
+            return snapshot
+        with self._datasets_lock:
+            if self._snapshot is None:
+                self._snapshot = self._load_snapshot()
+            return self._snapshot
+
+    def _load_snapshot(self) -> DatasetSnapshot:
+        return DatasetSnapshot(
+            # Load Core Datasets
+            malicious_contracts=self._load_json_file(MALICIOUS_CONTRACTS_FILE) or [],
+            sanctions_entities=self._load_json_lines(SANCTIONS_ENTITIES_FILE) or [],
+            # Load Additional Datasets dynamically (normalized files, etc.)
+            additional_datasets=self._load_additional_datasets(),
+            version=self.dataset_version()
+        )
+
     def _load_json_file(self, filename: str) -> Any:
         path = os.path.join(self.data_dir, filename)
         if os.path.exists(path):
@@ -89,10 +646,10 @@ class WalletScreeningSkill(BaseSkill):
                             pass
         return entities
 
-    def _load_additional_datasets(self) -> List[Dict]:
-        """Loads all other JSON files in data_dir not explicitly loaded."""
+    def _load_additional_datasets(self) -> List[Tuple[str, Dict]]:
+        """Loads all other JSON files in data_dir not explicitly loaded, as (source_file, entry) pairs."""
         all_entries = []
-        exclude = ['malicious_scs_2025.json', 'entities.ftm.json']
+        exclude = [MALICIOUS_CONTRACTS_FILE, SANCTIONS_ENTITIES_FILE]
         for fname in glob.glob(os.path.join(self.data_dir, '*.json')):
             if os.path.basename(fname) in exclude:
                 continue
@@ -112,181 +669,219 @@ class WalletScreeningSkill(BaseSkill):
                                     data.append(json.loads(line))
                                 except: pass
                     
-                    # Tag entries with source file
+                    # Pair entries with their source file
                     if isinstance(data, list):
                         for entry in data:
                             if isinstance(entry, dict):
-                                entry['__source_file__'] = base_name
-                                all_entries.append(entry)
+                                all_entries.append((base_name, entry))
             except Exception as e:
                 print(f"Error loading {fname}: {e}")
         return all_entries
 
     # --- API Helpers ---
 
+    def _http_get(self, url: str, params: Optional[Dict[str, Any]] = None, timeout: float = 10) -> Any:
+        # Deferred import: only processes that actually hit the network pay for `requests`.
+        import requests
+        resp = requests.get(url, params=params, timeout=timeout)
+        return resp.json()
+
     def _validate_eth_address(self, address: str) -> bool:
         return isinstance(address, str) and address.startswith("0x") and len(address) == 42
 
-    def _get_price(self, url: str, currency: str) -> float:
+    def _spawn(self, fn, *args):
+        """
+        Runs `fn(*args)` on the instance's stage executor and returns its Future.
+        It is sized for the stages of many concurrent screenings (`STAGE_WORKERS`,
+        4 per single-chain call) so stages rarely queue, while the thread count
+        stays bounded under `serve`/`bulk` load.
+        """
+        if self._stage_pool is None:
+            from concurrent.futures import ThreadPoolExecutor
+
+            with self._shared_lock:
+                if self._stage_pool is None:
+                    self._stage_pool = ThreadPoolExecutor(self._stage_workers,
+                                                          thread_name_prefix="wallet-screening-stage")
+        return self._stage_pool.submit(fn, *args)
+
+    @staticmethod
+    def _until(fetch, timeout: float, deadline: float):
+        """
+        `fetch` with at most `timeout` and what is left before `deadline` when it
+        starts. A stage that only starts after its deadline is skipped (None).
+        """
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            return None
+        return fetch(min(timeout, max(0.05, remaining)))
+
+    def _run_stages(self, stages: Dict[str, Tuple[TTLCache, Any, Any, float]],
+                    deadline: float) -> Dict[str, Tuple[Any, Dict[str, Any]]]:
+        """
+        Runs network stages concurrently and waits for them until `deadline`
+        (a `time.monotonic()` value).
+
+        `stages` maps a name to (cache, key, fetch, timeout), where `fetch(timeout)`
+        returns a value or None on failure. Returns {name: (value, status)}; status
+        is {"status": "fresh"}, {"status": "stale", "age_s", "reason"} or
+        {"status": "unavailable", "reason"} with a value of None. No request
+        outlives the deadline: a stage still running then finishes within it in
+        the background and refreshes the cache, and one that had not started yet
+        is skipped.
+        """
+        from concurrent.futures import wait
+
+        results: Dict[str, Tuple[Any, Dict[str, Any]]] = {}
+        pending = {}
+        for name, (cache, key, fetch, timeout) in stages.items():
+            value = cache.get(key)
+            if value is not None:
+                results[name] = (value, {"status": "fresh"})
+                continue
+            pending[name] = self._shared_fetch(cache, key, partial(self._until, fetch, timeout, deadline))
+
+        if pending:
+            wait(list(pending.values()), timeout=max(0.0, deadline - time.monotonic()))
+        for name, future in pending.items():
+            value = future.result() if future.done() and not future.exception() else None
+            if value is not None:
+                results[name] = (value, {"status": "fresh"})
+                continue
+            reason = "error" if future.done() else "deadline"
+            cache, key = stages[name][:2]
+            stale = cache.get_stale(key)
+            if stale is not None:
+                results[name] = (stale[0], {"status": "stale", "age_s": round(stale[1], 1), "reason": reason})
+            else:
+                results[name] = (None, {"status": "unavailable", "reason": reason})
+        return {name: results[name] for name in stages}
+
+    def _shared_fetch(self, cache: TTLCache, key: Any, fetch):
+        """
+        Future for `fetch()`, or for the request already in flight for
+        the same cache key (the price of a coin wanted by concurrent screenings,
+        or a balance started by `prefetch`).
+        """
+        with self._shared_lock:
+            future = self._shared.get((id(cache), key))
+            if future is None:
+                future = self._spawn(fetch)
+                self._share(cache, key, future)
+        return future
+
+    def _share(self, cache: TTLCache, key: Any, future) -> None:
+        """Registers an in-flight request; its result is cached and the entry dropped when it finishes."""
+        with self._shared_lock:
+            self._shared[(id(cache), key)] = future
+        future.add_done_callback(partial(self._finish_shared, cache, key))
+
+    def _finish_shared(self, cache: TTLCache, key: Any, future) -> None:
+        if not future.cancelled() and future.exception() is None and future.result() is not None:
+            cache.set(key, future.result())
+        with self._shared_lock:
+            if self._shared.get((id(cache), key)) is future:
+                del self._shared[(id(cache), key)]
+
+    def _explorer_get(self, chain: str, params: Dict[str, Any], timeout: float) -> Optional[Any]:
+        """Explorer request for `chain`, within its endpoint's rate limit. None if the limit would miss `timeout`."""
+        url, api_key, limiter = self._explorers[chain]
+        if limiter:
+            waited = time.monotonic()
+            if not limiter.acquire(timeout):
+                return None
+            timeout = max(0.05, timeout - (time.monotonic() - waited))
+        params = {"chainid": CHAINS[chain]["chain_id"], **params, "apikey": api_key}
+        return self._http_get(url, params=params, timeout=timeout)
+
+    def _fetch_price(self, coin: str, currency: str, timeout: float = 10) -> Optional[float]:
         try:
-            resp = requests.get(url, timeout=10)
-            data = resp.json()
-            return data.get("ethereum", {}).get(currency, 0.0)
-        except:
-            return 0.0
-
-    def _get_eth_transactions(self, address: str) -> List[Dict]:
-        url = "https://api.etherscan.io/api"
+            data = self._http_get(f"{self.coingecko_url}/simple/price?ids={coin}&vs_currencies={currency}",
+                                  timeout=timeout)
+            return float(data[coin][currency])
+        except Exception:
+            return None
+
+    def _fetch_eth_transactions(self, address: str, startblock: int = 0, timeout: float = 15,
+                                chain: str = DEFAULT_CHAIN) -> Optional[List[Dict]]:
         params = {
             "module": "account",
             "action": "txlist",
             "address": address,
-            "startblock": 0,
+            "startblock": startblock,
             "endblock": 99999999,
             "sort": "asc",
-            "apikey": self.etherscan_api_key
         }
         try:
-            resp = requests.get(url, params=params, timeout=15)
-            data = resp.json()
+            data = self._explorer_get(chain, params, timeout)
+            if data is None:
+                return None
             if data.get("status") == "1":
                 return data["result"]
+            if data.get("message") == "No transactions found":
+                return []
         except Exception:
             pass
-        return []
+        return None
 
-    def _get_eth_balance(self, address: str) -> float:
-        url = "https://api.etherscan.io/api"
+    def _fetch_eth_balance(self, address: str, timeout: float = 10, chain: str = DEFAULT_CHAIN) -> Optional[float]:
         params = {
             "module": "account",
             "action": "balance",
             "address": address,
             "tag": "latest",
-            "apikey": self.etherscan_api_key
         }
         try:
-            resp = requests.get(url, params=params, timeout=10)
-            data = resp.json()
-            if data.get("status") == "1":
+            data = self._explorer_get(chain, params, timeout)
+            if data is not None and data.get("status") == "1":
                 return int(data["result"]) / 1e18
-        except:
+        except Exception:
             pass
-        return 0.0
+        return None
 
-    # --- Logic Helpers ---
+    def _fetch_balances(self, addresses: List[str], timeout: float = 10,
+                        chain: str = DEFAULT_CHAIN) -> Optional[Dict[str, float]]:
+        """Balances of up to BALANCEMULTI_LIMIT addresses in one call, keyed by lowercased address."""
+        params = {
+            "module": "account",
+            "action": "balancemulti",
+            "address": ",".join(addresses),
+            "tag": "latest",
+        }
+        try:
+            data = self._explorer_get(chain, params, timeout)
+            if data is not None and data.get("status") == "1":
+                return {item["account"].lower(): int(item["balance"]) / 1e18 for item in data["result"]}
+        except Exception:
+            pass
+        return None
 
-    def _check_against_sanctions(self, address: str) -> List[Dict]:
-        hits = []
-        lower_addr = address.lower()
-        for entity in self.sanctions_entities:
-            matches = False
-            if "addresses" in entity:
-                 if any(a.lower() == lower_addr for a in entity["addresses"]):
-                     matches = True
-            elif "properties" in entity and "address" in entity["properties"]:
-                 if entity["properties"]["address"].lower() == lower_addr:
-                     matches = True
-            
-            if matches:
-                entity['__source_file__'] = 'entities.ftm.json'
-                hits.append(entity)
-        return hits
-
-    def _check_against_additional_sanctions(self, address: str) -> List[Dict]:
-        hits = []
-        lower_addr = address.lower()
-        for entry in self.additional_datasets:
-            addr = None
-            if 'address' in entry:
-                addr = entry['address']
-            elif 'properties' in entry and 'address' in entry['properties']:
-                addr = entry['properties']['address']
-            elif 'addresses' in entry and isinstance(entry['addresses'], list):
-                for a in entry['addresses']:
-                    if a.lower() == lower_addr:
-                        addr = a
-                        break
-            
-            if addr and addr.lower() == lower_addr:
-                hits.append(entry)
-        return hits
-
-    def _analyze_transactions(self, txs: List[Dict], wallet_addr: str) -> Dict[str, Any]:
-        wallet_addr = wallet_addr.lower()
-        value_in = 0.0
-        value_out = 0.0
-        gas_paid = 0.0
-        counterparty_counts = {}
-        malicious_interactions = []
-        
-        malicious_map = {c['address'].lower(): c for c in self.malicious_contracts}
+    # --- Logic Helpers ---
 
+    @staticmethod
+    def _make_hit(source_file: str, entry: Mapping) -> Dict:
+        # Hit records are fresh dicts; the shared snapshot entry is never touched.
+        hit = dict(entry)
+        hit['__source_file__'] = source_file
+        return hit
+
+    def _check_against_sanctions(self, address: str, snapshot: Optional[DatasetSnapshot] = None) -> List[Dict]:
+        snapshot = snapshot or self.snapshot
+        return [self._make_hit(src, e) for src, e in snapshot.sanctions_index.get(address.lower(), ())]
+
+    def _check_against_additional_sanctions(self, address: str,
+                                            snapshot: Optional[DatasetSnapshot] = None) -> List[Dict]:
+        snapshot = snapshot or self.snapshot
+        return [self._make_hit(src, e) for src, e in snapshot.additional_index.get(address.lower(), ())]
+
+    def _analyze_transactions(self, txs: List[Dict], wallet_addr: str, snapshot: Optional[DatasetSnapshot] = None,
+                              malicious: Optional[Mapping[str, Mapping]] = None) -> Dict[str, Any]:
+        if malicious is None:
+            malicious = (snapshot or self.snapshot).malicious_index
+        aggregate = TransactionAggregate(wallet_addr, malicious)
         for tx in txs:
-            from_addr = tx.get('from', '').lower()
-            to_addr = tx.get('to', '').lower() if tx.get('to') else ''
-            
-            try:
-                value_eth = int(tx.get('value', '0')) / 1e18
-            except:
-                value_eth = 0.0
-            
-            is_error = tx.get('isError', '0') == '1'
-            if is_error:
-                continue
-
-            # Gas
-            if from_addr == wallet_addr:
-                try:
-                    gas = int(tx.get('gasUsed', '0')) * int(tx.get('gasPrice', '0')) / 1e18
-                    gas_paid += gas
-                except:
-                    pass
-
-            # Malicious Check
-            other_party = None
-            if to_addr and to_addr in malicious_map:
-                other_party = to_addr
-            elif from_addr and from_addr in malicious_map:
-                other_party = from_addr
-            
-            if other_party:
-                contract_info = malicious_map[other_party]
-                malicious_interactions.append({
-                    'tx_hash': tx.get('hash'),
-                    'other_party': other_party,
-                    'direction': 'out' if from_addr == wallet_addr else 'in',
-                    'contract_name': contract_info.get('name'),
-                    'severity': contract_info.get('severity'),
-                    'jurisdictions': contract_info.get('jurisdictions_blocked', []),
-                    'value_eth': value_eth
-                })
-
-            # Flow
-            if to_addr == wallet_addr:
-                value_in += value_eth
-                counterparty = from_addr
-            elif from_addr == wallet_addr:
-                value_out += value_eth
-                counterparty = to_addr
-            else:
-                counterparty = None
-            
-            if counterparty:
-                counterparty_counts[counterparty] = counterparty_counts.get(counterparty, 0) + 1
-
-        most_interacted = None
-        if counterparty_counts:
-            most_interacted = max(counterparty_counts.items(), key=lambda x: x[1])
-
-        return {
-            'total_txs': len(txs),
-            'value_in': value_in,
-            'value_out': value_out,
-            'gas_paid': gas_paid,
-            'malicious_interactions': malicious_interactions,
-            'counterparty_counts': counterparty_counts,
-            'most_interacted': most_interacted
-        }
+            aggregate.add(tx)
+        return aggregate.analysis()
 
     def _summarize_sanctions(self, hits: List[Dict]) -> List[Dict]:
         summary = []
@@ -300,45 +895,60 @@ class WalletScreeningSkill(BaseSkill):
                 'jurisdiction': jurisdiction,
                 'reason': reason,
                 'source_file': source_file,
+                'network': entity.get('network'),
                 # 'entity': entity # simplified for AI token usage, normally full entity is heavy
             })
         return summary
 
-    def _generate_report_data(self, address, analysis, sanctions_hits, eth_balance, eth_usd, eth_eur, txs_count):
-        pnl = analysis['value_out'] - analysis['value_in'] - analysis['gas_paid']
-        pnl_pct = ((pnl) / analysis['value_in'] * 100) if analysis['value_in'] > 0 else 0.0
+    def _generate_report_data(self, address, analysis, sanctions_hits, eth_balance, eth_usd, eth_eur, txs_count,
+                              snapshot=None, data_status=None):
+        # Values that depend on an unavailable stage are None ("unknown"), never 0.
+        def usd(eth):
+            return None if eth is None or eth_usd is None else eth * eth_usd
+
+        available = analysis is not None
+        if available:
+            pnl = analysis['value_out'] - analysis['value_in'] - analysis['gas_paid']
+            pnl_pct = ((pnl) / analysis['value_in'] * 100) if analysis['value_in'] > 0 else 0.0
+        else:
+            analysis = dict.fromkeys(('value_in', 'value_out', 'gas_paid', 'malicious_interactions', 'most_interacted'))
+            pnl = pnl_pct = None
 
         # Create structured summaries
         sanctions_summary = self._summarize_sanctions(sanctions_hits)
         
         # Format Top Counterparties
         top_counterparties = sorted(
-            [(k, v) for k, v in analysis.get('counterparty_counts', {}).items()], 
+            [(k, v) for k, v in (analysis.get('counterparty_counts') or {}).items()], 
             key=lambda x: -x[1]
-        )[:10]
+        )[:10] if available else None
 
+        data_status = data_status or {}
         return {
             "metadata": {
                 "screening_time": datetime.now().isoformat(),
                 "wallet_address": address,
-                "data_sources_count": len(self.additional_datasets) + 2
+                "data_sources_count": len((snapshot or self.snapshot).additional_datasets) + 2,
+                "data_status": data_status
             },
             "summary": {
                 "risk_flag": bool(sanctions_hits) or bool(analysis['malicious_interactions']),
                 "sanctioned_entity_match": bool(sanctions_hits),
-                "malicious_interaction_count": len(analysis['malicious_interactions']),
+                "malicious_interaction_count": len(analysis['malicious_interactions']) if available else None,
                 "balance_eth": eth_balance,
-                "balance_usd": eth_balance * eth_usd,
-                "total_transactions": txs_count
+                "balance_usd": usd(eth_balance),
+                "total_transactions": txs_count,
+                # True if any figure is stale or unavailable (see metadata.data_status).
+                "partial": any(v.get("status") != "fresh" for v in data_status.values())
             },
             "financial_analysis": {
                 "value_in_eth": analysis['value_in'],
-                "value_in_usd": analysis['value_in'] * eth_usd,
+                "value_in_usd": usd(analysis['value_in']),
                 "value_out_eth": analysis['value_out'],
-                "value_out_usd": analysis['value_out'] * eth_usd,
+                "value_out_usd": usd(analysis['value_out']),
                 "gas_paid_eth": analysis['gas_paid'],
                 "pnl_eth": pnl,
-                "pnl_usd": pnl * eth_usd,
+                "pnl_usd": usd(pnl),
                 "pnl_percent": pnl_pct
             },
             "risk_details": {
@@ -0,0 +1,5 @@
+import sys
+
+from skillware.cli import main
+
+sys.exit(main())
@@ -0,0 +1,257 @@
+"""
+Command-line entry point: `python -m skillware <command>`.
+"""
+import argparse
+import inspect
+import os
+import sys
+from typing import Any, Dict, List, Optional
+
+from skillware.core.base_skill import BaseSkill
+
+DEFAULT_SKILL = "finance/wallet_screening"
+
+
+def instantiate_skill(skill_path: str, config: Optional[Dict[str, Any]] = None) -> BaseSkill:
+    """
+    Loads a skill bundle and instantiates the BaseSkill subclass defined in its module.
+    """
+    from skillware.core.loader import SkillLoader
+    bundle = SkillLoader.load_skill(skill_path)
+    module = bundle.get("module")
+    for _, obj in inspect.getmembers(module, inspect.isclass):
+        if issubclass(obj, BaseSkill) and obj is not BaseSkill and obj.__module__ == module.__name__:
+            return obj(config)
+    raise ImportError(f"No BaseSkill subclass found in skill '{skill_path}'")
+
+
+def cmd_screen(args: argparse.Namespace) -> int:
+    from skillware.core.bulk import BulkScreener
+
+    skill = instantiate_skill(args.skill)
+    output_format = args.output_format or ("csv" if args.output.lower().endswith(".csv") else "jsonl")
+    screener = BulkScreener(
+        skill,
+        output_path=args.output,
+        output_format=output_format,
+        concurrency=args.concurrency,
+        checkpoint_path=args.checkpoint,
+        checkpoint_every=args.checkpoint_every,
+        field=args.field,
+        progress=None if args.quiet else sys.stderr,
+    )
+    stats = screener.run(args.input, input_format=args.input_format, restart=args.restart)
+    if stats.get("interrupted"):
+        print(f"Interrupted after {stats['records_done']:,} records; re-run the same command to resume.",
+              file=sys.stderr)
+        return 130
+    return 0
+
+
+def cmd_monitor(args: argparse.Namespace) -> int:
+    import json
+    from skillware.core.bulk import iter_addresses, open_input
+    from skillware.core.monitor import WatchlistMonitor
+
+    with WatchlistMonitor(args.db) as monitor:
+        if args.action in ("watch", "unwatch"):
+            with open_input(args.input) as source:
+                addresses = (a for _, a in iter_addresses(source, args.input_format, args.input, args.field))
+                if args.action == "unwatch":
+                    print(f"Removed {monitor.unwatch(addresses):,} addresses.", file=sys.stderr)
+                    return 0
+                added, alerts = monitor.watch(addresses)
+            print(f"Watching {added:,} new addresses ({monitor.watched_count():,} total).", file=sys.stderr)
+        elif args.action == "sync":
+            skill = instantiate_skill(args.skill)
+            if not hasattr(skill, "flagged_addresses"):
+                raise ValueError(f"Skill '{args.skill}' does not support monitoring.")
+            # The version check is a cheap file hash; datasets are only parsed on change.
+            if skill.dataset_version() == monitor.dataset_version and not args.force:
+                print(f"Dataset version {monitor.dataset_version} already synced.", file=sys.stderr)
+                return 0
+            flagged = skill.flagged_addresses()
+            alerts = monitor.sync(flagged, skill.snapshot.version, force=args.force)
+            print(f"Synced dataset version {skill.snapshot.version} ({len(flagged):,} flagged addresses, "
+                  f"{len(alerts):,} alerts).", file=sys.stderr)
+        elif args.action == "alerts":
+            alerts = monitor.alerts(since_id=args.since)
+        else:
+            print(json.dumps({
+                "db": args.db,
+                "watched": monitor.watched_count(),
+                "dataset_version": monitor.dataset_version,
+            }))
+            return 0
+
+    for alert in alerts:
+        print(json.dumps(alert))
+    return 0
+
+
+def cmd_route(args: argparse.Namespace) -> int:
+    from skillware.core.sharding import ConsistentHashRing, ShardRouter
+
+    if not args.node:
+        raise ValueError("At least one --node is required.")
+    router = ShardRouter(ConsistentHashRing(args.node, vnodes=args.vnodes), timeout=args.timeout)
+    router.serve(args.host, args.port)
+    return 0
+
+
+def cmd_audit(args: argparse.Namespace) -> int:
+    import json
+    from skillware.core.audit import AuditLog
+
+    if not os.path.isdir(args.dir):
+        raise FileNotFoundError(f"No audit directory at {args.dir}")
+    risk_flag = {"yes": True, "no": False}.get(args.risk_flag)
+    audit = AuditLog(args.dir)
+    for row in audit.query(address=args.address, address_hash=args.address_hash, since=args.since,
+                           until=args.until, risk_flag=risk_flag, name=args.name, entity_id=args.entity_id):
+        print(json.dumps(row))
+    return 0
+
+
+def parse_config(items: List[str]) -> Dict[str, Any]:
+    """KEY=VALUE pairs; values are parsed as JSON where possible (numbers, booleans, objects)."""
+    import json
+
+    config = {}
+    for item in items:
+        key, sep, value = item.partition("=")
+        if not sep or not key:
+            raise ValueError(f"Expected KEY=VALUE, got '{item}'.")
+        try:
+            config[key] = json.loads(value)
+        except ValueError:
+            config[key] = value
+    return config
+
+
+def cmd_serve(args: argparse.Namespace) -> int:
+    from skillware.core.server import SkillServer
+
+    config = parse_config(args.config)
+    skills = {path: instantiate_skill(path, config) for path in args.skill or [DEFAULT_SKILL]}
+    server = SkillServer(skills, batch_window=args.batch_window_ms / 1000, max_batch=args.max_batch,
+                         workers=args.workers, timeout=args.timeout)
+    server.serve(args.host, args.port)
+    return 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog="skillware", description="Skillware command-line tools.")
+    parser.add_argument("--env-file", default=".env", help="Environment file to load (default: .env).")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    screen = commands.add_parser(
+        "screen",
+        help="Bulk-screen addresses from CSV/JSONL/stdin.",
+        description="Streams addresses through a skill, writing results incrementally. "
+                    "Interrupted runs resume from their checkpoint when re-run with the same arguments."
+    )
+    screen.add_argument("input", nargs="?", default="-", help="Input file, or '-' for stdin (default).")
+    screen.add_argument("-o", "--output", required=True, help="Output file (.jsonl or .csv).")
+    screen.add_argument("--output-format", choices=["jsonl", "csv"], help="Default: inferred from --output.")
+    screen.add_argument("--input-format", choices=["auto", "csv", "jsonl", "text"], default="auto")
+    screen.add_argument("--field", default="address", help="CSV column / JSON key holding the address.")
+    screen.add_argument("-c", "--concurrency", type=int, default=8, help="Concurrent screenings (default: 8).")
+    screen.add_argument("--checkpoint", help="Checkpoint file (default: <output>.checkpoint.json).")
+    screen.add_argument("--checkpoint-every", type=int, default=500, help="Records between checkpoints.")
+    screen.add_argument("--restart", action="store_true", help="Ignore an existing checkpoint and start over.")
+    screen.add_argument("--skill", default=DEFAULT_SKILL, help=f"Skill to run (default: {DEFAULT_SKILL}).")
+    screen.add_argument("-q", "--quiet", action="store_true", help="Do not print progress.")
+    screen.set_defaults(func=cmd_screen)
+
+    monitor = commands.add_parser(
+        "monitor",
+        help="Watch addresses and alert on dataset updates.",
+        description="Keeps a persistent watch list. `sync` diffs the flagged addresses of the current "
+                    "dataset against the last synced version and prints alerts (JSONL) for watched "
+                    "addresses in the delta."
+    )
+    monitor.add_argument("--db", default="watchlist.db", help="Watch list database (default: watchlist.db).")
+    actions = monitor.add_subparsers(dest="action", required=True)
+    for action, help_text in (("watch", "Add addresses to the watch list."),
+                              ("unwatch", "Remove addresses from the watch list.")):
+        sub = actions.add_parser(action, help=help_text)
+        sub.add_argument("input", nargs="?", default="-", help="Input file, or '-' for stdin (default).")
+        sub.add_argument("--input-format", choices=["auto", "csv", "jsonl", "text"], default="auto")
+        sub.add_argument("--field", default="address", help="CSV column / JSON key holding the address.")
+    sync = actions.add_parser("sync", help="Apply the current dataset version and print new alerts.")
+    sync.add_argument("--skill", default=DEFAULT_SKILL, help=f"Skill providing the datasets (default: {DEFAULT_SKILL}).")
+    sync.add_argument("--force", action="store_true", help="Re-alert every watched address that is flagged now, even if the dataset version is unchanged.")
+    alerts = actions.add_parser("alerts", help="Print stored alerts.")
+    alerts.add_argument("--since", type=int, default=0, help="Only alerts with an id greater than this.")
+    actions.add_parser("status", help="Print watch list size and synced dataset version.")
+    monitor.set_defaults(func=cmd_monitor)
+
+    route = commands.add_parser(
+        "route",
+        help="Run a consistent-hash router in front of screening nodes.",
+        description="Forwards each request to the node that owns its address (lowercased) on a "
+                    "consistent-hash ring, so each node's caches hold a stable partition. Nodes can "
+                    "join or leave at runtime via POST /_router/nodes."
+    )
+    route.add_argument("--node", action="append", default=[], help="Node base URL (repeatable).")
+    route.add_argument("--host", default="127.0.0.1")
+    route.add_argument("--port", type=int, default=8700)
+    route.add_argument("--vnodes", type=int, default=160, help="Virtual nodes per node (default: 160).")
+    route.add_argument("--timeout", type=float, default=30.0, help="Upstream timeout in seconds.")
+    route.set_defaults(func=cmd_route)
+
+    serve = commands.add_parser(
+        "serve",
+        help="Serve skills over HTTP from one long-running process.",
+        description="Load skills once and serve POST /skills/<skill path> with request coalescing "
+                    "and micro-batching. GET /stats reports queueing and batching counters.",
+    )
+    serve.add_argument("--skill", action="append", default=[],
+                       help=f"Skill to load (repeatable, default: {DEFAULT_SKILL}).")
+    serve.add_argument("--config", action="append", default=[], metavar="KEY=VALUE",
+                       help="Skill config entry, e.g. EXPLORER_RATE_LIMIT=10 (repeatable).")
+    serve.add_argument("--host", default="127.0.0.1")
+    serve.add_argument("--port", type=int, default=8701)
+    serve.add_argument("--batch-window-ms", type=float, default=5.0,
+                       help="How long a batch collects requests (default: 5 ms; 0 disables waiting).")
+    serve.add_argument("--max-batch", type=int, default=20, help="Largest batch (default: 20).")
+    serve.add_argument("--workers", type=int, default=32, help="Requests executed concurrently (default: 32).")
+    serve.add_argument("--timeout", type=float, default=60.0, help="Per-request timeout in seconds.")
+    serve.set_defaults(func=cmd_serve)
+
+    audit = commands.add_parser(
+        "audit",
+        help="Query the audit log of screening verdicts.",
+        description="Print the audit rows (JSONL) matching all given filters. "
+                    "Uses SKILLWARE_AUDIT_KEY or <dir>/audit.key to hash --address and --name.",
+    )
+    audit.add_argument("--dir", default=os.environ.get("SKILLWARE_AUDIT_DIR", "audit"),
+                       help="Audit directory (default: $SKILLWARE_AUDIT_DIR or ./audit).")
+    audit.add_argument("--address", help="Wallet address (hashed before matching).")
+    audit.add_argument("--address-hash", help="Stored address hash.")
+    audit.add_argument("--name", help="Name queried by an identity screening (hashed before matching).")
+    audit.add_argument("--entity-id", help="Entity matched by an identity screening.")
+    audit.add_argument("--since", help="ISO date/time, inclusive.")
+    audit.add_argument("--until", help="ISO date/time, exclusive.")
+    audit.add_argument("--risk-flag", choices=["yes", "no"])
+    audit.set_defaults(func=cmd_audit)
+
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = build_parser().parse_args(argv)
+
+    from skillware.core.env import load_env_file
+    load_env_file(args.env_file)
+
+    try:
+        return args.func(args)
+    except (FileNotFoundError, ImportError, ValueError) as e:
+        print(f"skillware {args.command}: {e}", file=sys.stderr)
+        return 2
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,377 @@
+import atexit
+import base64
+import glob
+import gzip
+import hashlib
+import hmac
+import json
+import os
+import queue
+import secrets
+import threading
+import time
+import zlib
+from datetime import date, datetime
+from typing import Any, Dict, Iterator, List, Mapping, Optional, Union
+
+# Bloom filter over the address hashes of one segment: 10 bits per row of
+# `segment_max_rows` and 4 probes, about 1% false positives when full.
+_BLOOM_BITS_PER_ROW = 10
+_BLOOM_PROBES = 4
+
+_STOP = object()
+
+Moment = Union[str, date, datetime, None]
+
+
+def _bloom_hashes(value: str) -> List[int]:
+    digest = hashlib.blake2b(value.encode(), digest_size=4 * _BLOOM_PROBES).digest()
+    return [int.from_bytes(digest[i:i + 4], "big") for i in range(0, len(digest), 4)]
+
+
+def _complete_members(path: str) -> Iterator[bytes]:
+    """
+    Decompressed gzip members of a segment, one per written batch. Stops at
+    the last complete member, so a truncated tail (a crashed writer, or a batch
+    being appended while we read) is skipped instead of failing the query.
+    """
+    with open(path, "rb") as f:
+        decompressor, parts, data = zlib.decompressobj(31), [], b""
+        while True:
+            data = data or f.read(1 << 16)
+            if not data:
+                return
+            try:
+                parts.append(decompressor.decompress(data))
+            except zlib.error:
+                return
+            data = b""
+            if decompressor.eof:
+                yield b"".join(parts)
+                data = decompressor.unused_data
+                decompressor, parts = zlib.decompressobj(31), []
+
+
+def stored_key(path: str) -> bytes:
+    """The HMAC key kept in `path`, created (owner-readable only) on first use."""
+    try:
+        fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+    except FileExistsError:
+        with open(path) as f:
+            return f.read().strip().encode()
+    key = secrets.token_hex(32)
+    with os.fdopen(fd, "w") as f:
+        f.write(key)
+    return key.encode()
+
+
+def identity_subject(field: str, value: Any) -> str:
+    """
+    What an identity screening is recorded under: the first queried field
+    (`name`, `email`, ...) and its value, ignoring case and spacing.
+    """
+    return f"{field}:{' '.join(str(value).split()).lower()}"
+
+
+def _moment(value: Moment) -> Optional[str]:
+    if value is None or isinstance(value, str):
+        return value
+    return value.isoformat()
+
+
+class _Segment:
+    """
+    The segment being written: one gzip member is appended per batch. Its
+    index is written once, when the segment is rotated or the log closed;
+    until then queries scan it.
+    """
+
+    def __init__(self, path: str, max_rows: int):
+        self.path = path
+        self.opened = time.monotonic()
+        self.rows = 0
+        self.risk_flag_rows = 0
+        self.first_ts: Optional[str] = None
+        self.last_ts: Optional[str] = None
+        self.bloom = bytearray(max(128, -(-max_rows * _BLOOM_BITS_PER_ROW // 8)))
+
+    def append(self, rows: List[Dict[str, Any]]):
+        payload = "".join(json.dumps(row, separators=(",", ":")) + "\n" for row in rows).encode()
+        with open(self.path, "ab") as f:
+            f.write(gzip.compress(payload))
+        bits = len(self.bloom) * 8
+        for row in rows:
+            for h in _bloom_hashes(row["address_hash"]):
+                pos = h % bits
+                self.bloom[pos >> 3] |= 1 << (pos & 7)
+        self.rows += len(rows)
+        self.risk_flag_rows += sum(1 for row in rows if row["risk_flag"])
+        first, last = min(row["ts"] for row in rows), max(row["ts"] for row in rows)
+        self.first_ts = min(self.first_ts or first, first)
+        self.last_ts = max(self.last_ts or last, last)
+
+    def write_index(self):
+        if not self.rows:
+            return
+        index = {
+            "rows": self.rows,
+            "risk_flag_rows": self.risk_flag_rows,
+            "first_ts": self.first_ts,
+            "last_ts": self.last_ts,
+            "bloom": base64.b64encode(bytes(self.bloom)).decode(),
+        }
+        tmp = self.path + ".idx.tmp"
+        with open(tmp, "w") as f:
+            json.dump(index, f)
+        os.replace(tmp, self.path + ".idx")
+
+    @property
+    def size(self) -> int:
+        return os.path.getsize(self.path) if os.path.exists(self.path) else 0
+
+
+class AuditLog:
+    """
+    Append-only local audit log of screening verdicts.
+
+    `record()` only queues a compact row (summary figures, sanctions hits or
+    matched entity ids, and an HMAC of the address or queried identity, never
+    the address or identity itself) and never blocks: if
+    the queue is full the row is dropped and counted in `stats()`. A
+    background thread writes queued rows in batches to gzip-compressed JSONL
+    segments, rotating on size, row count or age. A finished segment gets an
+    `.idx` sidecar (timestamp range, flagged-row count, Bloom filter of
+    address hashes sized to `segment_max_rows`) that lets `query()` skip it
+    without opening it; segments without one are scanned.
+
+    The HMAC key comes from `key`, the SKILLWARE_AUDIT_KEY environment
+    variable, or `<directory>/audit.key` (created on first use). Keep it:
+    without it recorded addresses cannot be looked up again.
+    """
+
+    def __init__(self, directory: str, key: Optional[Union[str, bytes]] = None, batch_size: int = 1000,
+                 flush_interval: float = 2.0, segment_max_bytes: int = 64 << 20, segment_max_rows: int = 100_000,
+                 segment_max_age: float = 3600.0, queue_size: int = 100_000):
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+        key = key or os.environ.get("SKILLWARE_AUDIT_KEY") or stored_key(os.path.join(directory, "audit.key"))
+        self._key = key.encode() if isinstance(key, str) else key
+        self.batch_size = batch_size
+        self.flush_interval = flush_interval
+        self.segment_max_bytes = segment_max_bytes
+        self.segment_max_rows = segment_max_rows
+        self.segment_max_age = segment_max_age
+
+        self._queue: "queue.Queue[Any]" = queue.Queue(maxsize=queue_size)
+        self._segment: Optional[_Segment] = None
+        self._stats = {"recorded": 0, "dropped": 0, "written": 0, "batches": 0, "segments": 0, "errors": 0}
+        self._stats_lock = threading.Lock()
+        self._closed = False
+        # The writer thread starts with the first record, so query-only use stays passive.
+        self._thread: Optional[threading.Thread] = None
+        self._thread_lock = threading.Lock()
+
+    def address_hash(self, address: str) -> str:
+        return hmac.new(self._key, address.strip().lower().encode(), hashlib.sha256).hexdigest()[:32]
+
+    # --- Recording ---
+
+    def record(self, report: Mapping[str, Any], subject: Optional[str] = None) -> bool:
+        """
+        Queues the verdict of a screening report. Returns False if it was dropped.
+
+        Address reports are recorded under their wallet address. Identity reports
+        (`metadata.mode == "identity"`) carry no queried data, so the caller
+        passes their `subject` (see `identity_subject`); it is hashed like an
+        address, and the row keeps the matched entity ids.
+        """
+        metadata = report.get("metadata", {})
+        summary = report.get("summary", {})
+        subject = subject or metadata.get("wallet_address")
+        if self._closed or not subject:
+            return False
+        row = {
+            "ts": datetime.now().isoformat(timespec="milliseconds"),
+            "address_hash": self.address_hash(subject),
+            "risk_flag": bool(summary.get("risk_flag")),
+            "sanctioned": bool(summary.get("sanctioned_entity_match")),
+        }
+        if metadata.get("mode") == "identity":
+            matches = report.get("risk_details", {}).get("identity_matches") or []
+            row.update({
+                "mode": "identity",
+                "match_count": summary.get("match_count"),
+                "best_score": summary.get("best_score"),
+                "entity_ids": [m.get("entity_id") for m in matches],
+            })
+        else:
+            hits = report.get("risk_details", {}).get("sanctions_hits") or []
+            row.update({
+                "malicious_interaction_count": summary.get("malicious_interaction_count"),
+                "balance_usd": summary.get("balance_usd"),
+                "total_transactions": summary.get("total_transactions"),
+                "partial": bool(summary.get("partial")),
+                "chains": metadata.get("chains"),
+                "sanctions_hits": [
+                    {k: hit.get(k) for k in ("label", "jurisdiction", "source_file", "network")} for hit in hits
+                ],
+            })
+        if self._thread is None:
+            self._start()
+        try:
+            self._queue.put_nowait(row)
+        except queue.Full:
+            self._count("dropped")
+            return False
+        self._count("recorded")
+        return True
+
+    def _start(self):
+        with self._thread_lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="skillware-audit", daemon=True)
+                self._thread.start()
+                atexit.register(self.close)
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Blocks until everything recorded so far is written. Returns False on timeout."""
+        if self._closed or self._thread is None:
+            return True
+        done = threading.Event()
+        self._queue.put(done)
+        return done.wait(timeout)
+
+    def close(self):
+        if self._closed:
+            return
+        self._closed = True
+        if self._thread is not None:
+            self._queue.put(_STOP)
+            self._thread.join()
+        if self._segment is not None:
+            self._segment.write_index()
+
+    def stats(self) -> Dict[str, int]:
+        with self._stats_lock:
+            return dict(self._stats, queued=self._queue.qsize())
+
+    def _count(self, key: str, n: int = 1):
+        with self._stats_lock:
+            self._stats[key] += n
+
+    def _run(self):
+        batch: List[Dict[str, Any]] = []
+        waiters: List[threading.Event] = []
+        batch_started = 0.0
+        while True:
+            timeout = self.flush_interval - (time.monotonic() - batch_started) if batch else None
+            try:
+                item = self._queue.get(timeout=max(0.0, timeout) if timeout is not None else None)
+            except queue.Empty:
+                item = None
+
+            if isinstance(item, dict):
+                if not batch:
+                    batch_started = time.monotonic()
+                batch.append(item)
+                if len(batch) < self.batch_size:
+                    continue
+            elif isinstance(item, threading.Event):
+                waiters.append(item)
+
+            if batch:
+                self._write(batch)
+                batch = []
+            for waiter in waiters:
+                waiter.set()
+            waiters = []
+            if item is _STOP:
+                return
+
+    def _write(self, rows: List[Dict[str, Any]]):
+        segment = self._segment
+        if (segment is None or segment.rows >= self.segment_max_rows or segment.size >= self.segment_max_bytes
+                or time.monotonic() - segment.opened >= self.segment_max_age):
+            if segment is not None:
+                segment.write_index()
+            stamp = datetime.now().strftime("%Y%m%dT%H%M%S")
+            path = os.path.join(self.directory, f"audit-{stamp}-{os.getpid()}-{self._stats['segments']:04d}.jsonl.gz")
+            segment = self._segment = _Segment(path, self.segment_max_rows)
+            self._count("segments")
+        try:
+            segment.append(rows)
+        except OSError:
+            self._count("errors")
+            return
+        self._count("written", len(rows))
+        self._count("batches")
+
+    # --- Queries ---
+
+    def segments(self) -> List[str]:
+        return sorted(glob.glob(os.path.join(self.directory, "audit-*.jsonl.gz")))
+
+    def query(self, address: Optional[str] = None, address_hash: Optional[str] = None, since: Moment = None,
+              until: Moment = None, risk_flag: Optional[bool] = None, name: Optional[str] = None,
+              entity_id: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Yields written rows matching every given predicate, oldest first.
+        `since` is inclusive and `until` exclusive; both take datetimes, dates
+        or ISO strings. `name` finds identity screenings by queried name and
+        `entity_id` those that matched an entity. Rows still queued are not
+        visible until flushed.
+        """
+        if address:
+            address_hash = self.address_hash(address)
+        elif name:
+            address_hash = self.address_hash(identity_subject("name", name))
+        entity_text = None if entity_id is None else json.dumps(entity_id)
+        since, until = _moment(since), _moment(until)
+        probes = _bloom_hashes(address_hash) if address_hash else None
+        flag_text = None if risk_flag is None else '"risk_flag":%s' % json.dumps(risk_flag)
+
+        for path in self.segments():
+            if not self._may_match(path, probes, since, until, risk_flag):
+                continue
+            for member in _complete_members(path):
+                for line in member.decode().splitlines():
+                    # Cheap text tests before parsing (rows are written with compact separators).
+                    if address_hash and address_hash not in line:
+                        continue
+                    if flag_text and flag_text not in line:
+                        continue
+                    if entity_text and entity_text not in line:
+                        continue
+                    row = json.loads(line)
+                    if since and row["ts"] < since:
+                        continue
+                    if until and row["ts"] >= until:
+                        continue
+                    if risk_flag is not None and row["risk_flag"] != risk_flag:
+                        continue
+                    if entity_id is not None and entity_id not in row.get("entity_ids", ()):
+                        continue
+                    yield row
+
+    @staticmethod
+    def _may_match(path: str, probes: Optional[List[int]], since: Optional[str], until: Optional[str],
+                   risk_flag: Optional[bool]) -> bool:
+        try:
+            with open(path + ".idx") as f:
+                index = json.load(f)
+        except (OSError, ValueError):
+            return True  # no usable index: scan the segment
+        if since and index["last_ts"] < since:
+            return False
+        if until and index["first_ts"] >= until:
+            return False
+        if risk_flag is True and not index["risk_flag_rows"]:
+            return False
+        if risk_flag is False and index["risk_flag_rows"] == index["rows"]:
+            return False
+        if probes:
+            bloom = base64.b64decode(index["bloom"])
+            bits = len(bloom) * 8
+            if not all(bloom[(h % bits) >> 3] & (1 << ((h % bits) & 7)) for h in probes):
+                return False
+        return True
@@ -1,10 +1,14 @@
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Optional
+from typing import Any, Dict, Iterable, List, Optional
 
 class BaseSkill(ABC):
     """
     The foundational class for all Skillware skills.
     """
+
+    # Skills that set this to True guarantee that a single instance can serve
+    # concurrent `execute` calls (no per-call mutation of shared state).
+    thread_safe: bool = False
     
     def __init__(self, config: Optional[Dict[str, Any]] = None):
         self.config = config or {}
@@ -25,6 +29,38 @@ class BaseSkill(ABC):
         """
         pass
 
+    def execute_many(self, params_list: Iterable[Dict[str, Any]], max_workers: Optional[int] = None) -> List[Any]:
+        """
+        Executes the skill for each params dict and returns results in input order.
+        Thread-safe skills share this instance across a thread pool; other skills
+        run sequentially.
+        """
+        params_list = list(params_list)
+        if not self.thread_safe or max_workers == 1 or len(params_list) < 2:
+            return [self.execute(params) for params in params_list]
+
+        from concurrent.futures import ThreadPoolExecutor
+        self.warm_up()
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            return list(pool.map(self.execute, params_list))
+
+    def warm_up(self) -> None:
+        """
+        Optional hook to load datasets, clients or models ahead of the first
+        `execute` call. Skills load lazily by default; long-running hosts can
+        call this at startup to move that cost out of the request path.
+        """
+        pass
+
+    def prefetch(self, params_list: List[Dict[str, Any]]) -> None:
+        """
+        Optional hook for batching hosts (`skillware serve`): called with the
+        params of calls about to run concurrently, before they start. Skills can
+        begin shared upstream requests here (one multi-address lookup instead
+        of one per call) that those calls then wait on. Must not block.
+        """
+        pass
+
     def validate_params(self, params: Dict[str, Any]) -> bool:
         """
         Validates input parameters against the manifest schema.
@@ -0,0 +1,329 @@
+import contextlib
+import csv
+import io
+import json
+import os
+import signal
+import sys
+import threading
+import time
+from collections import deque
+from datetime import datetime
+from typing import Any, Dict, Iterator, Optional, TextIO, Tuple
+
+from skillware.core.base_skill import BaseSkill
+
+# Flat columns written in CSV mode (JSONL keeps the full report).
+CSV_COLUMNS = [
+    "address", "risk_flag", "sanctioned_entity_match", "malicious_interaction_count",
+    "balance_eth", "balance_usd", "total_transactions", "partial", "sanctions_sources", "error"
+]
+
+
+def open_input(input_path: str):
+    """Opens an input file for reading, or wraps stdin for '-'."""
+    if input_path == "-":
+        # Do not let the `with` block close the real stdin.
+        return contextlib.nullcontext(io.TextIOWrapper(sys.stdin.buffer, encoding="utf-8-sig"))
+    return open(input_path, "r", encoding="utf-8-sig", newline="")
+
+
+def detect_format(first_line: str, input_path: str) -> str:
+    """Guesses csv/jsonl/text from the file extension, then from the first line."""
+    ext = os.path.splitext(input_path)[1].lower()
+    if ext == ".csv":
+        return "csv"
+    if ext in (".jsonl", ".ndjson", ".json"):
+        return "jsonl"
+    stripped = first_line.strip()
+    if stripped.startswith("{") or stripped.startswith('"'):
+        return "jsonl"
+    if "," in stripped:
+        return "csv"
+    return "text"
+
+
+def iter_addresses(source: TextIO, input_format: str = "auto", input_path: str = "-",
+                   field: str = "address") -> Iterator[Tuple[int, str]]:
+    """
+    Yields (record_index, address). Blank lines are skipped but malformed
+    records still consume an index so checkpoints stay stable.
+    """
+    first = source.readline()
+    if input_format == "auto":
+        input_format = detect_format(first, input_path)
+
+    def lines():
+        if first:
+            yield first
+        yield from source
+
+    index = 0
+    if input_format == "csv":
+        reader = csv.reader(lines())
+        header = next(reader, None) or []
+        column = header.index(field) if field in header else None
+        if column is None:
+            # Headerless CSV: the first row is data, addresses are in the first column.
+            column = 0
+            if header:
+                yield index, header[0].strip()
+                index += 1
+        for row in reader:
+            if not row:
+                continue
+            yield index, row[column].strip() if column < len(row) else ""
+            index += 1
+    elif input_format == "jsonl":
+        for line in lines():
+            if not line.strip():
+                continue
+            try:
+                value = json.loads(line)
+            except ValueError:
+                value = ""
+            if isinstance(value, dict):
+                value = value.get(field, "")
+            yield index, str(value).strip()
+            index += 1
+    elif input_format == "text":
+        for line in lines():
+            if line.strip():
+                yield index, line.strip()
+                index += 1
+    else:
+        raise ValueError(f"Unsupported input format: {input_format}")
+
+
+class BulkScreener:
+    """
+    Streams addresses through a skill and writes results incrementally.
+
+    Input is read lazily (CSV, JSONL or one address per line, from a file or
+    stdin) and at most `concurrency * 4` calls are in flight at any time, so
+    memory stays flat regardless of input size. Results are written in input
+    order, which makes the checkpoint a single number: how many input records
+    have been written. An interrupted run resumes from that record after
+    truncating any partially written output.
+    """
+
+    def __init__(self, skill: BaseSkill, output_path: str, output_format: str = "jsonl",
+                 concurrency: int = 8, checkpoint_path: Optional[str] = None,
+                 checkpoint_every: int = 500, field: str = "address",
+                 progress: Optional[TextIO] = sys.stderr):
+        if output_format not in ("jsonl", "csv"):
+            raise ValueError(f"Unsupported output format: {output_format}")
+        self.skill = skill
+        self.output_path = output_path
+        self.output_format = output_format
+        # Skills that are not thread-safe are screened one call at a time.
+        self.concurrency = max(1, concurrency) if skill.thread_safe else 1
+        self.checkpoint_path = checkpoint_path or f"{output_path}.checkpoint.json"
+        self.checkpoint_every = max(1, checkpoint_every)
+        self.field = field
+        self.progress = progress
+
+    # --- Public API ---
+
+    def run(self, input_path: str = "-", input_format: str = "auto", restart: bool = False) -> Dict[str, Any]:
+        """
+        Screens every record of `input_path` ('-' for stdin). Returns run stats.
+        """
+        checkpoint = {} if restart else self._read_checkpoint()
+        if checkpoint and checkpoint.get("input") != os.path.abspath(input_path) and input_path != "-":
+            raise ValueError(
+                f"Checkpoint {self.checkpoint_path} belongs to {checkpoint.get('input')}; "
+                f"pass restart=True (--restart) to start over."
+            )
+        done = checkpoint.get("records_done", 0)
+        resume_bytes = checkpoint.get("output_bytes", 0)
+        if done or resume_bytes:
+            size = os.path.getsize(self.output_path) if os.path.exists(self.output_path) else None
+            if size is None or size < resume_bytes:
+                found = "is missing" if size is None else f"has {size} bytes, expected at least {resume_bytes}"
+                raise ValueError(
+                    f"Cannot resume: {self.output_path} {found}, so the {done} records already screened "
+                    f"would be lost; pass restart=True (--restart) to start over."
+                )
+        total = self._count_records(input_path, input_format)
+
+        out = self._open_output(resume_bytes)
+        stats = {"screened": 0, "flagged": 0, "errors": 0, "resumed_from": done}
+        self._started = time.monotonic()
+        self._last_report = self._started
+
+        from concurrent.futures import ThreadPoolExecutor
+        self.skill.warm_up()
+        pending: deque = deque()
+        pool = ThreadPoolExecutor(max_workers=self.concurrency)
+        previous_handlers = self._install_stop_handlers()
+        finished = False
+        try:
+            with self._open_input(input_path) as source:
+                records = iter_addresses(source, input_format, input_path, self.field)
+                for index, address in records:
+                    if self._stop_requested:
+                        break
+                    if index < done:
+                        continue
+                    pending.append((address, pool.submit(self._screen, address)))
+                    # Bounded window: write finished results in order before reading further.
+                    while len(pending) >= self.concurrency * 4 or (pending and pending[0][1].done()):
+                        done = self._write_next(out, pending, stats, done)
+                        self._maybe_checkpoint(out, input_path, done, total, stats)
+                # On a stop request, unfinished calls are dropped; they are re-read on resume.
+                while pending and not self._stop_requested:
+                    done = self._write_next(out, pending, stats, done)
+                    self._maybe_checkpoint(out, input_path, done, total, stats)
+            finished = not self._stop_requested
+            stats["interrupted"] = self._stop_requested
+        finally:
+            self._restore_handlers(previous_handlers)
+            pool.shutdown(wait=False, cancel_futures=True)
+            self._save_checkpoint(out, input_path, done, complete=finished)
+            self._report(done, total, stats, final=True)
+            out.close()
+
+        stats["records_done"] = done
+        return stats
+
+    # --- Input ---
+
+    def _open_input(self, input_path: str):
+        return open_input(input_path)
+
+    def _count_records(self, input_path: str, input_format: str) -> Optional[int]:
+        """Counts non-blank lines of a regular file for ETA; unknown for stdin."""
+        if input_path == "-" or not os.path.isfile(input_path):
+            return None
+        count = 0
+        with open(input_path, "rb") as f:
+            for line in f:
+                if line.strip():
+                    count += 1
+        is_csv = input_format == "csv" or (input_format == "auto" and input_path.lower().endswith(".csv"))
+        if is_csv and count:
+            with open(input_path, "r", encoding="utf-8-sig", newline="") as f:
+                header = next(csv.reader(f), [])
+            if self.field in header:
+                count -= 1
+        return count
+
+    # --- Screening & Output ---
+
+    def _screen(self, address: str) -> Dict[str, Any]:
+        try:
+            return self.skill.execute({"address": address})
+        except Exception as e:
+            # Skills should not raise, but one bad record must not kill a bulk run.
+            return {"error": f"{type(e).__name__}: {e}"}
+
+    def _open_output(self, resume_bytes: int) -> TextIO:
+        # `run` has checked that a resumed output still holds `resume_bytes`.
+        if resume_bytes:
+            # Drop anything written after the last checkpoint (possibly a partial line).
+            with open(self.output_path, "r+b") as f:
+                f.truncate(resume_bytes)
+            out = open(self.output_path, "a", encoding="utf-8", newline="")
+        else:
+            out = open(self.output_path, "w", encoding="utf-8", newline="")
+        self._csv = csv.DictWriter(out, fieldnames=CSV_COLUMNS) if self.output_format == "csv" else None
+        if self._csv and out.tell() == 0:
+            self._csv.writeheader()
+        return out
+
+    def _write_next(self, out: TextIO, pending: deque, stats: Dict[str, Any], done: int) -> int:
+        address, future = pending.popleft()
+        report = future.result() if not future.cancelled() else {"error": "Screening was cancelled."}
+        summary = report.get("summary", {})
+        stats["screened"] += 1
+        stats["flagged"] += int(bool(summary.get("risk_flag")))
+        stats["errors"] += int("error" in report)
+
+        if self._csv:
+            self._csv.writerow({
+                "address": address,
+                "risk_flag": summary.get("risk_flag"),
+                "sanctioned_entity_match": summary.get("sanctioned_entity_match"),
+                "malicious_interaction_count": summary.get("malicious_interaction_count"),
+                "balance_eth": summary.get("balance_eth"),
+                "balance_usd": summary.get("balance_usd"),
+                "total_transactions": summary.get("total_transactions"),
+                "partial": summary.get("partial"),
+                "sanctions_sources": ";".join(
+                    sorted({h.get("source_file", "") for h in report.get("risk_details", {}).get("sanctions_hits", [])})
+                ),
+                "error": report.get("error", ""),
+            })
+        else:
+            out.write(json.dumps({"address": address, **report}, default=str) + "\n")
+        return done + 1
+
+    # --- Checkpointing & Progress ---
+
+    def _install_stop_handlers(self) -> Dict[int, Any]:
+        """
+        Turns SIGINT/SIGTERM into a stop flag that the run loop checks between
+        writes, so an interrupt never lands half-way through writing a record.
+        """
+        self._stop_requested = False
+        if threading.current_thread() is not threading.main_thread():
+            return {}
+
+        def request_stop(signum, frame):
+            self._stop_requested = True
+
+        return {sig: signal.signal(sig, request_stop) for sig in (signal.SIGINT, signal.SIGTERM)}
+
+    @staticmethod
+    def _restore_handlers(previous: Dict[int, Any]) -> None:
+        for sig, handler in previous.items():
+            signal.signal(sig, handler)
+
+    def _read_checkpoint(self) -> Dict[str, Any]:
+        if not os.path.exists(self.checkpoint_path):
+            return {}
+        with open(self.checkpoint_path, "r", encoding="utf-8") as f:
+            checkpoint = json.load(f)
+        return {} if checkpoint.get("complete") else checkpoint
+
+    def _maybe_checkpoint(self, out: TextIO, input_path: str, done: int, total: Optional[int], stats) -> None:
+        if stats["screened"] % self.checkpoint_every == 0:
+            self._save_checkpoint(out, input_path, done)
+        self._report(done, total, stats)
+
+    def _save_checkpoint(self, out: TextIO, input_path: str, done: int, complete: bool = False) -> None:
+        out.flush()
+        os.fsync(out.fileno())
+        checkpoint = {
+            "input": os.path.abspath(input_path) if input_path != "-" else "-",
+            "output": os.path.abspath(self.output_path),
+            "records_done": done,
+            "output_bytes": os.fstat(out.fileno()).st_size,
+            "complete": complete,
+            "updated_at": datetime.now().isoformat(),
+        }
+        # Write-then-rename so a crash never leaves a torn checkpoint behind.
+        tmp_path = f"{self.checkpoint_path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            json.dump(checkpoint, f)
+        os.replace(tmp_path, self.checkpoint_path)
+
+    def _report(self, done: int, total: Optional[int], stats: Dict[str, Any], final: bool = False) -> None:
+        if not self.progress:
+            return
+        now = time.monotonic()
+        if not final and now - self._last_report < 1.0:
+            return
+        self._last_report = now
+        elapsed = max(now - self._started, 1e-9)
+        rate = stats["screened"] / elapsed
+        position = f"{done:,}/{total:,}" if total is not None else f"{done:,}"
+        eta = ""
+        if total is not None and rate > 0:
+            remaining = max(total - done, 0) / rate
+            eta = f" | ETA {int(remaining // 3600)}h{int(remaining % 3600 // 60):02d}m{int(remaining % 60):02d}s"
+        line = (f"\rscreened {position} | {rate:,.1f}/s{eta} | "
+                f"flagged {stats['flagged']:,} | errors {stats['errors']:,}")
+        self.progress.write(line + ("\n" if final else ""))
+        self.progress.flush()
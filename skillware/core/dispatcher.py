@@ -0,0 +1,227 @@
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from typing import Any, Dict, List, Optional
+
+from skillware.core.base_skill import BaseSkill
+
+
+class ToolCall:
+    """
+    A single tool invocation requested by a model, normalized across providers.
+    """
+
+    __slots__ = ('name', 'args', 'call_id')
+
+    def __init__(self, name: str, args: Dict[str, Any], call_id: Optional[str] = None):
+        self.name = name
+        self.args = args
+        self.call_id = call_id
+
+    def __repr__(self) -> str:
+        return f"ToolCall(name={self.name!r}, call_id={self.call_id!r})"
+
+
+class ToolResult:
+    """
+    The outcome of one ToolCall: the skill output plus timing and status.
+    `status` is one of "ok", "error", "timeout" or "unknown_tool".
+    """
+
+    __slots__ = ('call', 'output', 'status', 'latency_ms')
+
+    def __init__(self, call: ToolCall, output: Any, status: str, latency_ms: float):
+        self.call = call
+        self.output = output
+        self.status = status
+        self.latency_ms = latency_ms
+
+    @property
+    def is_error(self) -> bool:
+        return self.status != "ok" or (isinstance(self.output, dict) and "error" in self.output)
+
+    def __repr__(self) -> str:
+        return f"ToolResult(name={self.call.name!r}, status={self.status!r}, latency_ms={self.latency_ms:.1f})"
+
+
+def _get(obj: Any, key: str, default: Any = None) -> Any:
+    """Reads `key` from SDK objects and plain dicts alike."""
+    if isinstance(obj, dict):
+        return obj.get(key, default)
+    return getattr(obj, key, default)
+
+
+class ToolDispatcher:
+    """
+    Runs every tool call of a model turn concurrently and returns the results
+    in the original order, formatted for the provider.
+
+    Each registered skill has its own executor, sized to its concurrency
+    limit, and its own timeout, so a slow or saturated skill never delays calls
+    to another one. A call that exceeds its timeout is reported back to the
+    model as an error. If it had not started yet it is cancelled; otherwise its
+    worker is left to finish in the background and keeps holding the skill's
+    slot, so the limit reflects real load. Per-call latency is recorded on every
+    ToolResult and aggregated in `stats`.
+
+    Usage (Claude):
+        dispatcher = ToolDispatcher()
+        dispatcher.register("wallet_screening", wallet_skill, max_concurrency=4, timeout=20)
+        tool_results = dispatcher.dispatch_claude(message)
+        messages.append({"role": "user", "content": tool_results})
+    """
+
+    def __init__(self, default_timeout: float = 30.0, default_concurrency: int = 4):
+        self.default_timeout = default_timeout
+        self.default_concurrency = default_concurrency
+        self._skills: Dict[str, Dict[str, Any]] = {}
+        self._stats_lock = threading.Lock()
+        self.stats: Dict[str, Dict[str, float]] = {}
+
+    # --- Registry ---
+
+    def register(self, name: str, skill: BaseSkill, max_concurrency: Optional[int] = None,
+                 timeout: Optional[float] = None) -> None:
+        """
+        Maps a tool name (as declared to the model) to a skill instance.
+        Skills that are not `thread_safe` are limited to one call at a time.
+        """
+        limit = max_concurrency or self.default_concurrency
+        if not skill.thread_safe:
+            limit = 1
+        previous = self._skills.get(name)
+        self._skills[name] = {
+            "skill": skill,
+            "pool": ThreadPoolExecutor(max_workers=limit, thread_name_prefix=f"skillware-dispatch-{name}"),
+            "timeout": timeout if timeout is not None else self.default_timeout,
+        }
+        if previous:
+            previous["pool"].shutdown(wait=False)
+
+    def register_bundle(self, skill_bundle: Dict[str, Any], skill: BaseSkill, **kwargs) -> None:
+        """Registers a skill under the tool name from its bundle manifest."""
+        self.register(skill_bundle.get('manifest', {}).get('name', 'unknown_tool'), skill, **kwargs)
+
+    def shutdown(self) -> None:
+        for entry in self._skills.values():
+            entry["pool"].shutdown(wait=False)
+
+    # --- Dispatch ---
+
+    def dispatch(self, calls: List[ToolCall]) -> List[ToolResult]:
+        """
+        Executes all calls concurrently and returns ToolResults in input order.
+        """
+        started = time.monotonic()
+        futures = []
+        for call in calls:
+            entry = self._skills.get(call.name)
+            futures.append(entry["pool"].submit(self._run, entry, call) if entry else None)
+
+        results = []
+        for call, future in zip(calls, futures):
+            if future is None:
+                results.append(ToolResult(call, {"error": f"Unknown tool: {call.name}"}, "unknown_tool", 0.0))
+                continue
+            # Every call's timeout counts from dispatch start, so waiting on earlier
+            # calls never extends the budget of later ones.
+            timeout = self._skills[call.name]["timeout"]
+            remaining = max(0.0, started + timeout - time.monotonic())
+            try:
+                result = future.result(timeout=remaining)
+            except FutureTimeoutError:
+                # Still queued behind the skill's limit: drop it rather than run it for nobody.
+                future.cancel()
+                result = ToolResult(
+                    call, {"error": f"Tool '{call.name}' timed out after {timeout:g}s."},
+                    "timeout", (time.monotonic() - started) * 1000
+                )
+            results.append(result)
+            self._record(result)
+        return results
+
+    def dispatch_claude(self, message: Any) -> List[Dict[str, Any]]:
+        """
+        Takes a Claude message (or its `content` list) and returns the
+        `tool_result` blocks for the next user turn, in `tool_use` order.
+        """
+        return self.to_claude_results(self.dispatch(self.claude_calls(message)))
+
+    def dispatch_gemini(self, response: Any) -> List[Dict[str, Any]]:
+        """
+        Takes a Gemini response (or a list of parts) and returns the
+        `function_response` parts to send back, in function call order.
+        """
+        return self.to_gemini_parts(self.dispatch(self.gemini_calls(response)))
+
+    # --- Provider Adapters ---
+
+    @staticmethod
+    def claude_calls(message: Any) -> List[ToolCall]:
+        content = message if isinstance(message, list) else _get(message, 'content', [])
+        return [
+            ToolCall(_get(block, 'name'), dict(_get(block, 'input') or {}), _get(block, 'id'))
+            for block in content if _get(block, 'type') == 'tool_use'
+        ]
+
+    @staticmethod
+    def gemini_calls(response: Any) -> List[ToolCall]:
+        if isinstance(response, list):
+            parts = response
+        else:
+            candidates = _get(response, 'candidates') or []
+            parts = _get(_get(candidates[0], 'content'), 'parts', []) if candidates else []
+        calls = []
+        for part in parts:
+            fn = _get(part, 'function_call')
+            if fn and _get(fn, 'name'):
+                calls.append(ToolCall(_get(fn, 'name'), dict(_get(fn, 'args') or {}), _get(fn, 'id') or None))
+        return calls
+
+    @staticmethod
+    def to_claude_results(results: List[ToolResult]) -> List[Dict[str, Any]]:
+        blocks = []
+        for result in results:
+            block = {
+                "type": "tool_result",
+                "tool_use_id": result.call.call_id,
+                "content": json.dumps(result.output, default=str),
+            }
+            if result.is_error:
+                block["is_error"] = True
+            blocks.append(block)
+        return blocks
+
+    @staticmethod
+    def to_gemini_parts(results: List[ToolResult]) -> List[Dict[str, Any]]:
+        parts = []
+        for result in results:
+            function_response = {"name": result.call.name, "response": {"result": result.output}}
+            if result.call.call_id:
+                function_response["id"] = result.call.call_id
+            parts.append({"function_response": function_response})
+        return parts
+
+    # --- Internals ---
+
+    @staticmethod
+    def _run(entry: Dict[str, Any], call: ToolCall) -> ToolResult:
+        started = time.monotonic()
+        try:
+            output, status = entry["skill"].execute(call.args), "ok"
+        except Exception as e:
+            # Skills should not raise, but one failing call must not sink the whole turn.
+            output, status = {"error": f"{type(e).__name__}: {e}"}, "error"
+        return ToolResult(call, output, status, (time.monotonic() - started) * 1000)
+
+    def _record(self, result: ToolResult) -> None:
+        with self._stats_lock:
+            stats = self.stats.setdefault(result.call.name, {
+                "calls": 0, "errors": 0, "timeouts": 0, "total_ms": 0.0, "max_ms": 0.0
+            })
+            stats["calls"] += 1
+            stats["errors"] += int(result.is_error)
+            stats["timeouts"] += int(result.status == "timeout")
+            stats["total_ms"] += result.latency_ms
+            stats["max_ms"] = max(stats["max_ms"], result.latency_ms)
@@ -0,0 +1,26 @@
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional
+
+
+class SkillwareHTTPServer(ThreadingHTTPServer):
+    """Threaded HTTP server behind `skillware serve` and `skillware route`."""
+
+    daemon_threads = True
+    # The default backlog of 5 resets connections under modest client concurrency.
+    request_queue_size = 128
+
+
+def read_body(handler: BaseHTTPRequestHandler) -> Optional[bytes]:
+    """
+    The request body (empty without a Content-Length), or None if the header is
+    not a non-negative integer. The body cannot be delimited then, so the
+    connection is marked to close after the reply.
+    """
+    try:
+        length = int(handler.headers.get("Content-Length") or 0)
+    except ValueError:
+        length = -1
+    if length < 0:
+        handler.close_connection = True
+        return None
+    return handler.rfile.read(length) if length else b""
@@ -1,9 +1,14 @@
 import os
-import yaml
+import re
+import sys
 import json
+import importlib
 import importlib.util
 from typing import Dict, Any, Type, Optional
 
+# NOTE: Heavy dependencies (e.g. `yaml`) are imported inside the functions that
+# need them so that `import skillware` stays cheap for short-lived processes.
+
 class SkillLoader:
     """
     Utility to load skills dynamically or by path, bundling their
@@ -27,29 +32,31 @@ class SkillLoader:
         if not os.path.exists(skill_path):
             raise FileNotFoundError(f"Skill not found at {skill_path}")
 
-            # Load Manifest
-            manifest = {}
-            manifest_path = os.path.join(skill_path, 'manifest.yaml')
-            if os.path.exists(manifest_path):
-                with open(manifest_path, 'r', encoding='utf-8') as f:
-                    manifest = yaml.safe_load(f)
+        # Load Manifest
+        manifest = {}
+        manifest_path = os.path.join(skill_path, 'manifest.yaml')
+        if os.path.exists(manifest_path):
+            import yaml
+            with open(manifest_path, 'r', encoding='utf-8') as f:
+                manifest = yaml.safe_load(f) or {}
 
-            # Check Dependencies
-            if 'requirements' in manifest:
-                missing = []
-                for req in manifest['requirements']:
-                    # Simple check for package name. Complex version parsing (>=1.0) 
-                    # requires packaging.utils or similar, but keeping it deps-free for now.
-                    # We strip version specifiers for the import check.
-                    pkg_name = req.split('>')[0].split('<')[0].split('=')[0].strip()
-                    if not importlib.util.find_spec(pkg_name):
-                        missing.append(req)
-                
-                if missing:
-                    raise ImportError(
-                        f"Skill '{manifest.get('name')}' requires missing packages: {', '.join(missing)}. "
-                        f"Please run: pip install {' '.join(missing)}"
-                    )
+        # Check Dependencies
+        if 'requirements' in manifest:
+            missing = []
+            for req in manifest['requirements']:
+                # Simple check for package name. Complex version parsing (>=1.0) 
+                # requires packaging.utils or similar, but keeping it deps-free for now.
+                # We strip version specifiers for the import check.
+                # find_spec() only locates the package, it does not import it.
+                pkg_name = req.split('>')[0].split('<')[0].split('=')[0].strip()
+                if not importlib.util.find_spec(pkg_name):
+                    missing.append(req)
+            
+            if missing:
+                raise ImportError(
+                    f"Skill '{manifest.get('name')}' requires missing packages: {', '.join(missing)}. "
+                    f"Please run: pip install {' '.join(missing)}"
+                )
 
         # Load Instructions
         instructions = ""
@@ -66,11 +73,8 @@ class SkillLoader:
                  card = json.load(f)
 
         # Load Python Module
-        skill_file = os.path.join(skill_path, 'skill.py')
-        spec = importlib.util.spec_from_file_location("skill_module", skill_file)
-        if spec and spec.loader:
-            module = importlib.util.module_from_spec(spec)
-            spec.loader.exec_module(module)
+        module = SkillLoader._import_skill_module(skill_path, manifest.get('name'))
+        if module is not None:
             # Find the class that inherits from BaseSkill? 
             # For now assume the user looks for the exported class or we inspect.
             # We'll just return the module and let the user instantiate the known class name
@@ -84,6 +88,39 @@ class SkillLoader:
         
         return {}
 
+    @staticmethod
+    def _import_skill_module(skill_path: str, name: Optional[str] = None):
+        """
+        Imports `skill.py`. Skills shipped as packages (with an `__init__.py`)
+        are imported as such, so `skill.py` can use relative imports of its
+        sibling modules. Every call re-executes the skill's modules from disk,
+        like a plain file load, so a second `load_skill` picks up changes.
+        """
+        skill_file = os.path.join(skill_path, 'skill.py')
+        init_file = os.path.join(skill_path, '__init__.py')
+        package_name = "skillware_skill_" + re.sub(r'\W', '_', name or os.path.basename(os.path.normpath(skill_path)))
+
+        if os.path.exists(init_file):
+            spec = importlib.util.spec_from_file_location(
+                package_name, init_file, submodule_search_locations=[os.path.abspath(skill_path)]
+            )
+            if not (spec and spec.loader):
+                return None
+            # Drop submodules cached by an earlier load so they are read again.
+            for cached in [m for m in sys.modules if m.startswith(package_name + ".")]:
+                del sys.modules[cached]
+            package = importlib.util.module_from_spec(spec)
+            sys.modules[package_name] = package
+            spec.loader.exec_module(package)
+            return importlib.import_module(f"{package_name}.skill")
+
+        spec = importlib.util.spec_from_file_location("skill_module", skill_file)
+        if spec and spec.loader:
+            module = importlib.util.module_from_spec(spec)
+            spec.loader.exec_module(module)
+            return module
+        return None
+
     @staticmethod
     def to_gemini_tool(skill_bundle: Dict[str, Any]) -> Dict[str, Any]:
         """
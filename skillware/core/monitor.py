@@ -0,0 +1,203 @@
+import sqlite3
+import threading
+from datetime import datetime
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional, Sequence, Tuple
+
+# SQLite caps the number of bound parameters per statement; stay well below it.
+_BATCH = 500
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS watched (
+    address TEXT PRIMARY KEY,
+    added_at TEXT NOT NULL
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS flagged (
+    address TEXT PRIMARY KEY,
+    sources TEXT NOT NULL
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS state (
+    key TEXT PRIMARY KEY,
+    value TEXT
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS alerts (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    created_at TEXT NOT NULL,
+    dataset_version TEXT,
+    address TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    sources TEXT NOT NULL
+);
+"""
+
+
+def _chunks(items: Sequence[Any], size: int = _BATCH) -> Iterator[Sequence[Any]]:
+    for i in range(0, len(items), size):
+        yield items[i:i + size]
+
+
+class WatchlistMonitor:
+    """
+    Persistent watch list with delta rescreening on dataset updates.
+
+    The monitor keeps the set of watched addresses and the flagged set it last
+    saw in a SQLite file. When the dataset version changes, `sync` diffs the
+    new flagged set against the stored one and looks up only the changed
+    addresses in the watch list (by primary key). The watch list is never
+    scanned, so millions of watched addresses cost nothing per update.
+
+    Alert kinds:
+    - `listed`: a watched address became flagged (or was already flagged when it
+      was added to the watch list).
+    - `sources_changed`: a watched, flagged address is now listed by a different
+      set of sources.
+    - `delisted`: a watched address is no longer flagged.
+    """
+
+    def __init__(self, db_path: str):
+        self.db_path = db_path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        self._conn.close()
+
+    def __enter__(self) -> "WatchlistMonitor":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    # --- Watch List ---
+
+    def watch(self, addresses: Iterable[str]) -> Tuple[int, List[Dict[str, Any]]]:
+        """
+        Adds addresses to the watch list. Returns (newly_watched_count, alerts)
+        where alerts cover new addresses that are already flagged.
+        """
+        now = datetime.now().isoformat()
+        added = 0
+        alerts: List[Dict[str, Any]] = []
+        batch: List[str] = []
+        for address in addresses:
+            address = address.strip().lower()
+            if address:
+                batch.append(address)
+            if len(batch) >= _BATCH:
+                n, a = self._watch_batch(batch, now)
+                added, alerts = added + n, alerts + a
+                batch = []
+        if batch:
+            n, a = self._watch_batch(batch, now)
+            added, alerts = added + n, alerts + a
+        return added, alerts
+
+    def unwatch(self, addresses: Iterable[str]) -> int:
+        removed = 0
+        rows = [(a.strip().lower(),) for a in addresses if a.strip()]
+        with self._lock, self._conn:
+            for chunk in _chunks(rows):
+                removed += self._conn.executemany("DELETE FROM watched WHERE address = ?", chunk).rowcount
+        return removed
+
+    def watched_count(self) -> int:
+        return self._conn.execute("SELECT COUNT(*) FROM watched").fetchone()[0]
+
+    # --- Dataset Sync ---
+
+    @property
+    def dataset_version(self) -> Optional[str]:
+        row = self._conn.execute("SELECT value FROM state WHERE key = 'dataset_version'").fetchone()
+        return row[0] if row else None
+
+    def sync(self, flagged: Mapping[str, Sequence[str]], version: str, force: bool = False) -> List[Dict[str, Any]]:
+        """
+        Applies a new flagged set ({address: sources}) for `version` and returns
+        the alerts for watched addresses in the delta. A no-op if `version` was
+        already synced, unless `force` is set: a forced sync re-screens every
+        watched address against the whole flagged set and re-emits a `listed`
+        alert for each one that is flagged (plus `delisted` for the delta).
+        """
+        if version and version == self.dataset_version and not force:
+            return []
+
+        flagged = {a.lower(): ";".join(sorted(s)) for a, s in flagged.items()}
+        previous = dict(self._conn.execute("SELECT address, sources FROM flagged"))
+        listed = [a for a in flagged if a not in previous]
+        changed = [a for a in flagged if a in previous and previous[a] != flagged[a]]
+        delisted = [a for a in previous if a not in flagged]
+
+        # Lookups stay by primary key: the flagged set is probed against the watch list.
+        alert_listed, alert_changed = (list(flagged), []) if force else (listed, changed)
+        now = datetime.now().isoformat()
+        alerts = (
+            [self._alert(now, version, a, "listed", flagged[a]) for a in self._watched_subset(alert_listed)]
+            + [self._alert(now, version, a, "sources_changed", flagged[a])
+               for a in self._watched_subset(alert_changed)]
+            + [self._alert(now, version, a, "delisted", previous[a]) for a in self._watched_subset(delisted)]
+        )
+
+        with self._lock, self._conn:
+            self._conn.executemany("DELETE FROM flagged WHERE address = ?", [(a,) for a in delisted])
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO flagged (address, sources) VALUES (?, ?)",
+                [(a, flagged[a]) for a in listed + changed]
+            )
+            self._conn.execute(
+                "INSERT OR REPLACE INTO state (key, value) VALUES ('dataset_version', ?)", (version,)
+            )
+            self._store_alerts(alerts)
+        return alerts
+
+    def alerts(self, since_id: int = 0, limit: Optional[int] = None) -> List[Dict[str, Any]]:
+        query = ("SELECT id, created_at, dataset_version, address, kind, sources "
+                 "FROM alerts WHERE id > ? ORDER BY id")
+        args: Tuple[Any, ...] = (since_id,)
+        if limit is not None:
+            query += " LIMIT ?"
+            args += (limit,)
+        columns = ("id", "created_at", "dataset_version", "address", "kind", "sources")
+        return [dict(zip(columns, row)) for row in self._conn.execute(query, args)]
+
+    # --- Internals ---
+
+    def _watch_batch(self, batch: List[str], now: str) -> Tuple[int, List[Dict[str, Any]]]:
+        batch = list(dict.fromkeys(batch))
+        with self._lock, self._conn:
+            existing = set(self._watched_subset(batch))
+            new = [a for a in batch if a not in existing]
+            self._conn.executemany("INSERT INTO watched (address, added_at) VALUES (?, ?)", [(a, now) for a in new])
+
+            # Newly watched addresses are checked against the current flagged set once.
+            hits = []
+            if new:
+                placeholders = ",".join("?" * len(new))
+                hits = self._conn.execute(
+                    f"SELECT address, sources FROM flagged WHERE address IN ({placeholders})", new
+                ).fetchall()
+            version = self.dataset_version
+            alerts = [self._alert(now, version, a, "listed", sources) for a, sources in hits]
+            self._store_alerts(alerts)
+        return len(new), alerts
+
+    def _watched_subset(self, addresses: List[str]) -> List[str]:
+        found: List[str] = []
+        for chunk in _chunks(addresses):
+            placeholders = ",".join("?" * len(chunk))
+            found.extend(row[0] for row in self._conn.execute(
+                f"SELECT address FROM watched WHERE address IN ({placeholders})", list(chunk)
+            ))
+        return found
+
+    @staticmethod
+    def _alert(now: str, version: Optional[str], address: str, kind: str, sources: str) -> Dict[str, Any]:
+        return {"created_at": now, "dataset_version": version, "address": address, "kind": kind, "sources": sources}
+
+    def _store_alerts(self, alerts: List[Dict[str, Any]]) -> None:
+        for alert in alerts:
+            cursor = self._conn.execute(
+                "INSERT INTO alerts (created_at, dataset_version, address, kind, sources) VALUES (?, ?, ?, ?, ?)",
+                (alert["created_at"], alert["dataset_version"], alert["address"], alert["kind"], alert["sources"])
+            )
+            alert["id"] = cursor.lastrowid
@@ -0,0 +1,33 @@
+import threading
+import time
+from typing import Optional
+
+
+class RateLimiter:
+    """
+    Thread-safe token bucket: `rate` acquisitions per second, bursts up to `burst`.
+
+    Waiting callers reserve their slot before sleeping, so they are served in
+    arrival order. `acquire` gives up (returns False) if its slot would come
+    later than `timeout`, which lets deadline-bound callers fail fast.
+    """
+
+    def __init__(self, rate: float, burst: Optional[float] = None):
+        self.rate = float(rate)
+        self.burst = float(burst if burst is not None else max(1.0, rate))
+        self._tokens = self.burst
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self, timeout: Optional[float] = None) -> bool:
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            wait = max(0.0, (1.0 - self._tokens) / self.rate)
+            if timeout is not None and wait > timeout:
+                return False
+            self._tokens -= 1.0
+        if wait:
+            time.sleep(wait)
+        return True
@@ -0,0 +1,227 @@
+import json
+import sys
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FutureTimeout
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, List, Mapping, Tuple
+
+from skillware.core.base_skill import BaseSkill
+from skillware.core.httpserver import SkillwareHTTPServer, read_body
+
+_SKILLS_PREFIX = "/skills/"
+
+
+def _coalesce_key(params: Mapping[str, Any]) -> str:
+    """Requests with equal keys share one execution. Addresses are case-insensitive."""
+    if isinstance(params.get("address"), str):
+        params = dict(params, address=params["address"].strip().lower())
+    return json.dumps(params, sort_keys=True, default=str)
+
+
+class _Batcher:
+    """
+    Queues the requests of one skill, coalesces identical ones and hands the
+    rest to the skill in micro-batches.
+
+    A batch closes `window` seconds after its oldest request arrived, or when
+    it reaches `max_batch`. The skill's `prefetch` hook sees the whole batch
+    (so it can start shared upstream calls), then each request runs `execute`
+    on the server's long-lived pool. Skills that are not `thread_safe` run one
+    request at a time.
+    """
+
+    def __init__(self, skill: BaseSkill, pool: ThreadPoolExecutor, window: float, max_batch: int):
+        self.skill = skill
+        self.window = window
+        self.max_batch = max(1, max_batch)
+        self._pool = pool
+        self._skill_lock = None if skill.thread_safe else threading.Lock()
+
+        self._inflight: Dict[str, Future] = {}
+        self._pending: List[Tuple[Dict[str, Any], Future, float]] = []
+        self._cond = threading.Condition()
+        self._stats = {
+            "requests": 0, "coalesced": 0, "executions": 0, "errors": 0, "partial": 0, "batches": 0,
+            "max_batch_size": 0, "queue_wait_ms_total": 0.0, "queue_wait_ms_max": 0.0, "execute_ms_total": 0.0,
+        }
+        threading.Thread(target=self._run, name=f"skillware-batcher-{type(skill).__name__}", daemon=True).start()
+
+    def submit(self, params: Dict[str, Any]) -> Future:
+        key = _coalesce_key(params)
+        with self._cond:
+            self._stats["requests"] += 1
+            future = self._inflight.get(key)
+            if future is not None:
+                self._stats["coalesced"] += 1
+                return future
+            future = self._inflight[key] = Future()
+            self._pending.append((params, future, time.monotonic()))
+            self._cond.notify()
+        future.add_done_callback(lambda _: self._forget(key))
+        return future
+
+    def _forget(self, key: str) -> None:
+        with self._cond:
+            self._inflight.pop(key, None)
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while not self._pending:
+                    self._cond.wait()
+                closes_at = self._pending[0][2] + self.window
+                while len(self._pending) < self.max_batch and time.monotonic() < closes_at:
+                    self._cond.wait(closes_at - time.monotonic())
+                batch, self._pending = self._pending[:self.max_batch], self._pending[self.max_batch:]
+                self._stats["batches"] += 1
+                self._stats["max_batch_size"] = max(self._stats["max_batch_size"], len(batch))
+            try:
+                self.skill.prefetch([params for params, _, _ in batch])
+            except Exception:
+                pass  # an optimization only; every request still executes on its own
+            for params, future, queued in batch:
+                self._pool.submit(self._execute, params, future, queued)
+
+    def _execute(self, params: Dict[str, Any], future: Future, queued: float) -> None:
+        started = time.monotonic()
+        result, error = None, None
+        try:
+            if self._skill_lock:
+                with self._skill_lock:
+                    result = self.skill.execute(params)
+            else:
+                result = self.skill.execute(params)
+        except Exception as e:
+            error = e
+
+        wait_ms = (started - queued) * 1000
+        with self._cond:
+            stats = self._stats
+            stats["executions"] += 1
+            stats["queue_wait_ms_total"] += wait_ms
+            stats["queue_wait_ms_max"] = max(stats["queue_wait_ms_max"], wait_ms)
+            stats["execute_ms_total"] += (time.monotonic() - started) * 1000
+            if error is not None:
+                stats["errors"] += 1
+            elif isinstance(result, dict) and (result.get("summary") or {}).get("partial"):
+                stats["partial"] += 1
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(result)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._cond:
+            stats = dict(self._stats)
+            stats["queued"] = len(self._pending)
+            stats["in_flight"] = len(self._inflight)
+        executions, batches = stats["executions"], stats["batches"]
+        stats["avg_batch_size"] = round(executions / batches, 2) if batches else 0.0
+        stats["avg_queue_wait_ms"] = round(stats.pop("queue_wait_ms_total") / executions, 2) if executions else 0.0
+        stats["avg_execute_ms"] = round(stats.pop("execute_ms_total") / executions, 2) if executions else 0.0
+        stats["queue_wait_ms_max"] = round(stats["queue_wait_ms_max"], 2)
+        return stats
+
+
+class SkillServer:
+    """
+    Long-running HTTP host for loaded skill instances, so several services can
+    share one warm copy of each skill's datasets.
+
+    Endpoints:
+        POST /skills/<skill path>   JSON params in, the skill's JSON result out
+        GET  /skills                loaded skill paths
+        GET  /stats                 per-skill queueing, coalescing, batching and partial-result counters
+        GET  /health
+
+    Concurrent requests with the same params (same address) are coalesced
+    into one execution; distinct requests arriving within `batch_window`
+    seconds are executed as one micro-batch (see `_Batcher`).
+    """
+
+    def __init__(self, skills: Mapping[str, BaseSkill], batch_window: float = 0.005, max_batch: int = 20,
+                 workers: int = 32, timeout: float = 60.0):
+        self.skills = dict(skills)
+        self.timeout = timeout
+        self._started = time.time()
+        self._pool = ThreadPoolExecutor(workers, thread_name_prefix="skillware-serve")
+        self._batchers = {
+            path: _Batcher(skill, self._pool, batch_window, max_batch) for path, skill in self.skills.items()
+        }
+
+    def warm_up(self) -> None:
+        for skill in self.skills.values():
+            skill.warm_up()
+
+    def execute(self, path: str, params: Dict[str, Any]) -> Tuple[int, Any]:
+        batcher = self._batchers.get(path.strip("/"))
+        if batcher is None:
+            return 404, {"error": f"Unknown skill '{path}'. Loaded: {', '.join(self.skills)}"}
+        if not isinstance(params, dict):
+            return 400, {"error": "Body must be a JSON object of skill parameters."}
+        try:
+            return 200, batcher.submit(params).result(timeout=self.timeout)
+        except FutureTimeout:
+            return 504, {"error": f"Skill did not answer within {self.timeout:g}s."}
+        except Exception as e:
+            return 500, {"error": f"{type(e).__name__}: {e}"}
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "uptime_s": round(time.time() - self._started, 1),
+            "skills": {path: batcher.stats() for path, batcher in self._batchers.items()},
+        }
+
+    def handle(self, method: str, path: str, body: bytes) -> Tuple[int, Any]:
+        path = path.split("?", 1)[0]
+        if method == "POST" and path.startswith(_SKILLS_PREFIX):
+            try:
+                params = json.loads(body or b"{}")
+            except ValueError:
+                return 400, {"error": "Body must be JSON."}
+            return self.execute(path[len(_SKILLS_PREFIX):], params)
+        if method == "GET" and path == "/skills":
+            return 200, {"skills": list(self.skills)}
+        if method == "GET" and path == "/stats":
+            return 200, self.stats()
+        if method == "GET" and path == "/health":
+            return 200, {"status": "ok"}
+        return 404, {"error": f"Unknown endpoint: {method} {path}"}
+
+    def make_server(self, host: str = "127.0.0.1", port: int = 8701) -> ThreadingHTTPServer:
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def _handle(self):
+                body = read_body(self)
+                if body is None:
+                    status, result = 400, {"error": "Invalid Content-Length header."}
+                else:
+                    status, result = server.handle(self.command, self.path, body)
+                payload = json.dumps(result, default=str).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+
+            do_GET = do_POST = _handle
+
+            def log_message(self, fmt, *args):
+                pass
+
+        return SkillwareHTTPServer((host, port), Handler)
+
+    def serve(self, host: str = "127.0.0.1", port: int = 8701) -> None:
+        self.warm_up()
+        httpd = self.make_server(host, port)
+        print(f"Serving {', '.join(self.skills)} on http://{host}:{httpd.server_port}", file=sys.stderr)
+        try:
+            httpd.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            httpd.server_close()
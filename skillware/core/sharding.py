@@ -0,0 +1,242 @@
+import bisect
+import hashlib
+import json
+import random
+import sys
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+from urllib import error as urlerror, parse as urlparse, request as urlrequest
+
+from skillware.core.httpserver import SkillwareHTTPServer, read_body
+
+# Virtual nodes per unit of weight. ~160 keeps the load of 4-16 nodes within a few percent of even.
+DEFAULT_VNODES = 160
+
+
+def shard_key(address: str) -> str:
+    return address.strip().lower()
+
+
+def _hash(value: str) -> int:
+    return int.from_bytes(hashlib.blake2b(value.encode("utf-8"), digest_size=8).digest(), "big")
+
+
+class ConsistentHashRing:
+    """
+    Maps addresses to nodes with consistent hashing.
+
+    Every node is placed on a 64-bit hash ring at `vnodes * weight` points, and
+    an address belongs to the first point clockwise from the hash of its
+    lowercased form. Adding or removing a node only moves the keys of that
+    node's arcs (about 1/N of all keys), so the caches of the other nodes keep
+    their partition.
+
+    Lookups are lock-free: membership changes build a new ring (points, owners
+    and the sorted node list) and swap it in as one immutable tuple.
+    """
+
+    def __init__(self, nodes: Iterable[str] = (), vnodes: int = DEFAULT_VNODES):
+        self.vnodes = vnodes
+        self._weights: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        self._ring: Tuple[Tuple[int, ...], Tuple[str, ...], Tuple[str, ...]] = ((), (), ())
+        for node in nodes:
+            self.add_node(node)
+
+    @property
+    def nodes(self) -> List[str]:
+        return list(self._ring[2])
+
+    def __len__(self) -> int:
+        return len(self._ring[2])
+
+    def add_node(self, node: str, weight: int = 1) -> None:
+        with self._lock:
+            self._weights[node] = weight
+            self._rebuild()
+
+    def remove_node(self, node: str) -> None:
+        with self._lock:
+            if self._weights.pop(node, None) is not None:
+                self._rebuild()
+
+    def node_for(self, address: str) -> str:
+        points, owners, _ = self._ring
+        if not points:
+            raise LookupError("The hash ring has no nodes.")
+        return owners[bisect.bisect(points, _hash(shard_key(address))) % len(points)]
+
+    def preference_list(self, address: str, count: int) -> List[str]:
+        """
+        The owner of `address` followed by the next distinct nodes clockwise;
+        used for failover so a dead node's keys spread over the whole ring.
+        """
+        points, owners, _ = self._ring
+        if not points:
+            raise LookupError("The hash ring has no nodes.")
+        start = bisect.bisect(points, _hash(shard_key(address)))
+        found: List[str] = []
+        for i in range(len(points)):
+            node = owners[(start + i) % len(points)]
+            if node not in found:
+                found.append(node)
+                if len(found) == count:
+                    break
+        return found
+
+    def _rebuild(self) -> None:
+        ring = sorted(
+            (_hash(f"{node}#{i}"), node) for node, weight in self._weights.items() for i in range(self.vnodes * weight)
+        )
+        self._ring = (tuple(p for p, _ in ring), tuple(n for _, n in ring), tuple(sorted(self._weights)))
+
+
+# --- Router ---
+
+_ADMIN_PREFIX = "/_router"
+
+
+def _request_address(path: str, body: bytes) -> Optional[str]:
+    """Finds the address in `?address=` or in a JSON body ({"address"} or {"params": {"address"}})."""
+    query = urlparse.parse_qs(urlparse.urlsplit(path).query)
+    if query.get("address"):
+        return query["address"][0]
+    if not body:
+        return None
+    try:
+        payload = json.loads(body)
+    except ValueError:
+        return None
+    if not isinstance(payload, dict):
+        return None
+    for container in (payload, payload.get("params"), payload.get("args")):
+        if isinstance(container, dict) and isinstance(container.get("address"), str):
+            return container["address"]
+    return None
+
+
+class ShardRouter:
+    """
+    A small HTTP proxy that forwards each request to the node owning its address.
+
+    Requests are forwarded unchanged (method, path, body), with the chosen node
+    in the `X-Skillware-Node` response header. Requests without an address go
+    to a random node. If the owner is unreachable the next node on the ring is
+    tried, up to `failover` nodes.
+
+    Admin endpoints:
+        GET  /_router/ring                 nodes and per-node request counts
+        POST /_router/nodes {"add": url}   join (or {"remove": url} to leave)
+    """
+
+    def __init__(self, ring: ConsistentHashRing, timeout: float = 30.0, failover: int = 2):
+        self.ring = ring
+        self.timeout = timeout
+        self.failover = failover
+        self._stats_lock = threading.Lock()
+        self.stats: Dict[str, Dict[str, int]] = {}
+
+    def forward(self, method: str, path: str, body: bytes,
+                headers: Dict[str, str]) -> Tuple[int, bytes, Dict[str, str]]:
+        address = _request_address(path, body)
+        nodes = self.ring.nodes
+        if not nodes:
+            candidates = []
+        elif address:
+            try:
+                candidates = self.ring.preference_list(address, max(1, self.failover))
+            except LookupError:  # the last node left since `nodes` was read
+                candidates = []
+        else:
+            candidates = [random.choice(nodes)]
+        if not candidates:
+            return 503, b'{"error": "No screening nodes registered."}', {}
+
+        last_error = ""
+        for node in candidates:
+            request = urlrequest.Request(node.rstrip("/") + path, data=body or None, method=method, headers=headers)
+            try:
+                with urlrequest.urlopen(request, timeout=self.timeout) as resp:
+                    self._record(node, "requests")
+                    return resp.status, resp.read(), {"X-Skillware-Node": node}
+            except urlerror.HTTPError as e:
+                # The node answered; its error is the response.
+                self._record(node, "requests")
+                return e.code, e.read(), {"X-Skillware-Node": node}
+            except (urlerror.URLError, OSError) as e:
+                self._record(node, "failures")
+                last_error = f"{node}: {e}"
+        return 502, json.dumps({"error": f"No node reachable ({last_error})."}).encode(), {}
+
+    def admin(self, method: str, path: str, body: bytes) -> Tuple[int, Dict[str, Any]]:
+        if method == "GET" and path == f"{_ADMIN_PREFIX}/ring":
+            return 200, {"nodes": self.ring.nodes, "vnodes": self.ring.vnodes, "stats": self.stats}
+        if method == "POST" and path == f"{_ADMIN_PREFIX}/nodes":
+            try:
+                change = json.loads(body or b"{}")
+            except ValueError:
+                return 400, {"error": "Body must be JSON."}
+            if not isinstance(change, dict):
+                return 400, {"error": 'Body must be a JSON object: {"add": url, "weight": n} or {"remove": url}.'}
+            for key in ("add", "remove"):
+                if change.get(key) is not None and not isinstance(change[key], str):
+                    return 400, {"error": f"'{key}' must be a node URL string."}
+            weight = change.get("weight", 1)
+            if isinstance(weight, bool) or not isinstance(weight, int) or weight < 1:
+                return 400, {"error": "'weight' must be a positive integer."}
+            if change.get("add"):
+                self.ring.add_node(change["add"], weight)
+            if change.get("remove"):
+                self.ring.remove_node(change["remove"])
+            return 200, {"nodes": self.ring.nodes}
+        return 404, {"error": f"Unknown admin endpoint: {method} {path}"}
+
+    def make_server(self, host: str = "127.0.0.1", port: int = 8700) -> ThreadingHTTPServer:
+        router = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def _handle(self):
+                body = read_body(self)
+                if body is None:
+                    self._reply(400, json.dumps({"error": "Invalid Content-Length header."}).encode(), {})
+                    return
+                if self.path.startswith(_ADMIN_PREFIX):
+                    status, payload = router.admin(self.command, self.path, body)
+                    self._reply(status, json.dumps(payload).encode(), {})
+                    return
+                headers = {"Content-Type": self.headers.get("Content-Type", "application/json")}
+                self._reply(*router.forward(self.command, self.path, body, headers))
+
+            def _reply(self, status: int, payload: bytes, headers: Dict[str, str]):
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(payload)))
+                for key, value in headers.items():
+                    self.send_header(key, value)
+                self.end_headers()
+                self.wfile.write(payload)
+
+            do_GET = do_POST = _handle
+
+            def log_message(self, fmt, *args):
+                pass
+
+        return SkillwareHTTPServer((host, port), Handler)
+
+    def serve(self, host: str = "127.0.0.1", port: int = 8700) -> None:
+        server = self.make_server(host, port)
+        print(f"Routing {len(self.ring)} node(s) on http://{host}:{server.server_port}", file=sys.stderr)
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            server.server_close()
+
+    def _record(self, node: str, counter: str) -> None:
+        with self._stats_lock:
+            stats = self.stats.setdefault(node, {"requests": 0, "failures": 0})
+            stats[counter] += 1